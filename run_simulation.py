@@ -1,28 +1,61 @@
-import random
+from typing import Iterable, Optional
+import argparse
+import asyncio
+import os
+import sys
 import time
 
-from faker import Faker
-
+from src.arrivals import HOUR_SEC, RateProfile, Surge, profile_arrivals
+from src.async_centre import AsyncCallCentre, start_gateway
+from src.benchmark import (
+    DEFAULT_BACKLOG,
+    DEFAULT_ESCALATION_PROB,
+    DEFAULT_REPEATS,
+    DEFAULT_STAFF,
+    DEFAULT_THRESHOLD,
+    benchmark_grid,
+    compare,
+    display_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
 from src.call import CallPriority
-from src.call_centre import CallCentre, CallCentreConfig
+from src.call_centre import (
+    CallCentre,
+    CallCentreConfig,
+    Patience,
+    PatienceDistribution,
+)
+from src.employee import EmployeeSeniorotyLevel
+from src.erlang import ErlangEstimate, estimate, validate
+from src.event_log import EventLog
+from src.federation import ShardSpec, run_federation
+from src.names import DEFAULT_POOL_SIZE, NamePool
+from src.optimizer import StaffingOptimizer, WaitSla
+from src.profiling import PROFILE_ENV_VAR
+from src.replay import ScaledClock, read_trace, replay_realtime
+from src.rng import RandomStreams
+from src.routing import RoutingPolicy
+from src.simulation import Arrival, SimulationEngine, random_arrivals
+from src.staffing import daily_shifts, parse_shift, run_with_shifts
+from src.sweep import SweepSettings, parse_grid, run_sweep
 
+BENCHMARK_BASELINE = os.path.join("benchmarks", "baseline.json")
 MAX_CALL_INTERVAL_SEC = 2
 PROB_OF_HIGH_PRIORITY_CALL = 0.3
 
 
-def random_call_priority():
-    return random.choices(
-        [CallPriority.HIGH, CallPriority.LOW],
-        weights=[
-            PROB_OF_HIGH_PRIORITY_CALL,
-            1 - PROB_OF_HIGH_PRIORITY_CALL,
-        ],
-        k=1,
-    )[0]
+def random_call_priority(streams: RandomStreams) -> CallPriority:
+    return (
+        CallPriority.HIGH
+        if streams.priority.random() < PROB_OF_HIGH_PRIORITY_CALL
+        else CallPriority.LOW
+    )
 
 
-def main():
-    fire_station_config = CallCentreConfig(
+def fire_station_config() -> CallCentreConfig:
+    return CallCentreConfig(
         juniors=5,
         seniors=3,
         managers=2,
@@ -30,8 +63,90 @@ def main():
         max_call_duration_sec=15,
         call_escalation_prob=0.5,
     )
-    faker = Faker()
-    call_centre = CallCentre(fire_station_config)
+
+
+def caller_names(args) -> NamePool:
+    if args.names_file:
+        return NamePool.from_file(args.names_file, seed=args.seed)
+    return NamePool.from_faker(size=args.name_pool_size, seed=args.seed)
+
+
+def caller_patience(args) -> Optional[Patience]:
+    if args.patience is None:
+        return None
+    return Patience(args.patience, PatienceDistribution(args.patience_distribution))
+
+
+def open_event_log(args) -> Optional[EventLog]:
+    return EventLog(args.event_log) if args.event_log else None
+
+
+def display_metrics(call_centre: CallCentre):
+    if call_centre.metrics is None:
+        return
+
+    print("Queue wait (s):")
+    for priority, histogram in call_centre.metrics.queue_wait.items():
+        if not histogram.count:
+            continue
+        print(
+            f"## {priority.name}: mean {histogram.mean:.1f} | "
+            + " | ".join(
+                f"p{percentile} {histogram.percentile(percentile):.1f}"
+                for percentile in (50, 95, 99)
+            )
+        )
+    print("Utilization (calls per employee, min/max):")
+    for level, share in call_centre.utilization().items():
+        calls_handled = [
+            employee.calls_handled for employee in call_centre.employees[level]
+        ]
+        spread = f"{min(calls_handled)}/{max(calls_handled)}" if calls_handled else "-"
+        print(f"## {level.value}s: {share:.1%} ({spread})")
+    print(f"Escalations: {call_centre.metrics.escalations}")
+    if any(call_centre.metrics.abandoned.values()):
+        print(
+            "Abandoned: "
+            + " | ".join(
+                f"{priority.name} {abandoned} "
+                f"({call_centre.metrics.abandonment_rate(priority):.1%})"
+                for priority, abandoned in call_centre.metrics.abandoned.items()
+            )
+        )
+
+
+def display_profile(call_centre: CallCentre):
+    if call_centre.profiler is None:
+        return
+
+    print("Hot path (inclusive timings):")
+    for stat in call_centre.profile_report():
+        print(
+            f"## {stat.name}: {stat.calls} calls | {stat.total_sec:.3f}s total"
+            f" | {stat.mean_us:.1f}us mean"
+        )
+
+
+def run_realtime(args):
+    names = caller_names(args)
+    event_log = open_event_log(args)
+    call_centre = CallCentre(
+        fire_station_config(),
+        event_log=event_log,
+        profile=args.profile,
+        rng=RandomStreams(args.seed),
+        routing=RoutingPolicy(args.routing),
+        patience=caller_patience(args),
+    )
+    try:
+        realtime_loop(call_centre, names)
+    finally:
+        if event_log is not None:
+            event_log.close()
+        display_profile(call_centre)
+
+
+def realtime_loop(call_centre: CallCentre, names: NamePool):
 
     time_count = 0
     next_call = 0
@@ -45,11 +160,13 @@ def main():
 
         if time_count == next_call:
             call_centre.dispatch_call(
-                caller_name=faker.name(),
-                priority=random_call_priority(),
+                caller_name=names.draw(),
+                priority=random_call_priority(call_centre.rng),
                 verbose=True,
             )
-            next_call = time_count + random.randint(1, MAX_CALL_INTERVAL_SEC)
+            next_call = time_count + call_centre.rng.arrivals.randint(
+                1, MAX_CALL_INTERVAL_SEC
+            )
 
         call_centre.display_status()
 
@@ -57,5 +174,510 @@ def main():
         time.sleep(1)
 
 
+def run_gateway(args):
+    event_log = open_event_log(args)
+    call_centre = CallCentre(
+        fire_station_config(),
+        event_log=event_log,
+        profile=args.profile,
+        routing=RoutingPolicy(args.routing),
+        patience=caller_patience(args),
+    )
+    async_centre = AsyncCallCentre(call_centre, verbose=args.verbose)
+    try:
+        asyncio.run(serve_gateway(async_centre, args))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if event_log is not None:
+            event_log.close()
+
+    print(
+        f"Calls arrived: {async_centre.stats.calls_arrived} | "
+        f"Calls ended: {async_centre.stats.calls_ended}"
+    )
+    call_centre.display_status()
+    display_metrics(call_centre)
+    display_profile(call_centre)
+
+
+async def serve_gateway(async_centre: AsyncCallCentre, args):
+    server = await start_gateway(
+        async_centre, host=args.host, port=args.port, path=args.unix
+    )
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Gateway listening on {where}, one JSON call per line")
+    async with server:
+        await asyncio.gather(server.serve_forever(), async_centre.run())
+
+
+def run_event_driven(args):
+    streams = RandomStreams(args.seed)
+    event_log = open_event_log(args)
+    engine = SimulationEngine.from_config(
+        fire_station_config(),
+        event_log=event_log,
+        profile=args.profile,
+        rng=streams,
+        routing=RoutingPolicy(args.routing),
+        patience=caller_patience(args),
+    )
+    arrivals: Iterable[Arrival]
+    if args.hourly_calls is None:
+        arrivals = random_arrivals(
+            num_calls=args.calls,
+            max_call_interval_sec=MAX_CALL_INTERVAL_SEC,
+            prob_high_priority=PROB_OF_HIGH_PRIORITY_CALL,
+            names=caller_names(args),
+            streams=streams,
+        )
+    else:
+        arrivals = profile_arrivals(
+            RateProfile.hourly(args.hourly_calls, args.hourly_prob_high),
+            days=args.days,
+            streams=streams,
+            surges=args.surge,
+            names=caller_names(args),
+        )
+
+    start = time.perf_counter()
+    if args.shift:
+        stats = run_with_shifts(engine, arrivals, daily_shifts(args.shift))
+    else:
+        stats = engine.run(arrivals)
+    elapsed = time.perf_counter() - start
+    if event_log is not None:
+        event_log.close()
+
+    print(f"Simulated {stats.simulated_sec:.0f}s in {elapsed:.2f}s of wall time")
+    print(f"Calls arrived: {stats.calls_arrived} | Calls ended: {stats.calls_ended}")
+    engine.call_centre.display_status()
+    display_metrics(engine.call_centre)
+    display_profile(engine.call_centre)
+
+
+def run_trace_replay(args):
+    arrivals = read_trace(args.trace)
+    event_log = open_event_log(args)
+    start = time.perf_counter()
+    if args.speedup is None:
+        engine = SimulationEngine.from_config(
+            fire_station_config(),
+            event_log=event_log,
+            profile=args.profile,
+            routing=RoutingPolicy(args.routing),
+            patience=caller_patience(args),
+        )
+        call_centre = engine.call_centre
+        stats = engine.run(arrivals)
+    else:
+        call_centre = CallCentre(
+            fire_station_config(),
+            clock=ScaledClock(speedup=args.speedup),
+            event_log=event_log,
+            profile=args.profile,
+            routing=RoutingPolicy(args.routing),
+            patience=caller_patience(args),
+        )
+        stats = replay_realtime(call_centre, arrivals)
+    elapsed = time.perf_counter() - start
+    if event_log is not None:
+        event_log.close()
+
+    print(f"Replayed {stats.simulated_sec:.0f}s in {elapsed:.2f}s of wall time")
+    print(f"Calls arrived: {stats.calls_arrived} | Calls ended: {stats.calls_ended}")
+    call_centre.display_status()
+    display_metrics(call_centre)
+    display_profile(call_centre)
+
+
+def display_estimate(title: str, result: ErlangEstimate):
+    print(title)
+    for priority in CallPriority:
+        print(
+            f"## {priority.name}: P(wait) {result.wait_probability[priority]:.3f} | "
+            f"mean wait {result.mean_wait_sec[priority]:.2f}s"
+        )
+    print(
+        "## Utilization: "
+        + " | ".join(
+            f"{level.value}s {share:.1%}" for level, share in result.utilization.items()
+        )
+    )
+
+
+def run_erlang_estimate(args):
+    config = fire_station_config()
+    start = time.perf_counter()
+    result = estimate(config, args.arrival_rate, args.prob_high)
+    elapsed_us = (time.perf_counter() - start) * 1e6
+
+    display_estimate(f"Erlang C estimate ({elapsed_us:.0f}us):", result)
+    if not result.stable:
+        print("Load exceeds the staff of a priority, its wait grows without bound")
+    if not args.validate:
+        return
+
+    report = validate(
+        config, args.arrival_rate, args.prob_high, num_calls=args.calls, seed=args.seed
+    )
+    display_estimate(f"Simulated ({args.calls} Poisson arrivals):", report.simulated)
+    print(
+        "Estimate - simulation: "
+        + " | ".join(
+            f"{priority.name} P(wait) {error:+.3f}"
+            for priority, error in report.wait_probability_error.items()
+        )
+        + f" | utilization up to {report.max_utilization_error:+.1%}"
+    )
+
+
+def run_federated(args):
+    specs = [
+        ShardSpec(
+            config=fire_station_config(),
+            num_calls=args.calls,
+            max_call_interval_sec=MAX_CALL_INTERVAL_SEC,
+            prob_high_priority=PROB_OF_HIGH_PRIORITY_CALL,
+            seed=args.seed + 2 * index,
+        )
+        for index in range(args.shards)
+    ]
+
+    start = time.perf_counter()
+    result = run_federation(
+        specs, epoch_sec=args.epoch, processes=not args.single_process
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"Ran {args.shards} stations for {result.epochs} epochs in {elapsed:.2f}s")
+    for shard in result.shards:
+        print(
+            f"## Station {shard.index}: {shard.calls_arrived} arrived | "
+            f"{shard.calls_ended} ended | {shard.transferred_out} sent | "
+            f"{shard.transferred_in} received | {shard.final_backlog} on hold"
+        )
+    high_wait = result.metrics.queue_wait[CallPriority.HIGH]
+    if high_wait.count:
+        print(
+            f"HIGH priority wait (s): mean {high_wait.mean:.1f} | "
+            f"p95 {high_wait.percentile(95):.1f}"
+        )
+
+
+def run_parameter_sweep(args):
+    settings = SweepSettings(
+        replications=args.replications,
+        horizon_sec=args.horizon,
+        arrival_rate=args.arrival_rate,
+        prob_high_priority=args.prob_high,
+        seed=args.seed,
+    )
+    written = run_sweep(
+        base=fire_station_config(),
+        grid=parse_grid(args.grid),
+        settings=settings,
+        out_path=args.out,
+        workers=args.workers,
+    )
+    print(f"Wrote {written} grid points to {args.out}")
+
+
+def run_staffing_optimizer(args):
+    base = fire_station_config()
+    costs = {
+        EmployeeSeniorotyLevel.JUNIOR: args.cost_junior,
+        EmployeeSeniorotyLevel.SENIOR: args.cost_senior,
+        EmployeeSeniorotyLevel.MANAGER: args.cost_manager,
+        EmployeeSeniorotyLevel.DIRECTOR: args.cost_director,
+    }
+    sla = WaitSla(
+        max_wait_sec=args.sla_wait,
+        percentile=args.sla_percentile,
+        priority=(
+            None if args.sla_priority == "all" else CallPriority[args.sla_priority]
+        ),
+    )
+    optimizer = StaffingOptimizer(
+        arrival_rate=args.arrival_rate,
+        prob_high_priority=args.prob_high,
+        costs=costs,
+        sla=sla,
+        max_call_duration_sec=base.max_call_duration_sec,
+        call_escalation_prob=base.call_escalation_prob,
+        max_staff=args.max_staff,
+        seed=args.seed,
+    )
+    result = optimizer.optimize()
+
+    print(
+        f"Evaluated {len(result.evaluations)} configs | Screening runs: "
+        f"{result.screening_runs} | Full runs: {result.full_runs}"
+    )
+    if result.best is None or result.config_staffing is None:
+        print("No staffing within the limits meets the SLA")
+        return
+
+    print(f"Cheapest staffing (cost {result.best.cost}):")
+    for level, size in result.config_staffing.items():
+        print(f"## {level.value}s: {size}")
+    print(f"## p{sla.percentile:g} wait: {result.best.full_wait_sec}s")
+
+
+def run_benchmark_suite(args):
+    cases = list(
+        benchmark_grid(
+            staff=args.staff, backlog=args.backlog, escalation_prob=args.escalation
+        )
+    )
+    results = run_benchmarks(cases, repeats=args.repeats)
+    save_results(results, args.out)
+
+    regressions = None
+    if args.baseline and os.path.exists(args.baseline):
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+    display_results(results, regressions)
+    print(f"Wrote {len(cases)} benchmark cases to {args.out}")
+
+    if regressions is None:
+        print("No baseline to compare against")
+    elif regressions:
+        print(
+            f"FAIL: {len(regressions)} metrics regressed by more than "
+            f"{args.threshold:.0%}"
+        )
+        sys.exit(1)
+    else:
+        print(f"PASS: no metric regressed by more than {args.threshold:.0%}")
+
+
+def parse_surge(value: str) -> Surge:
+    """start_hour:end_hour:factor, hours since the start of the simulation"""
+    try:
+        start_hour, end_hour, factor = (float(part) for part in value.split(":"))
+        return Surge(start_hour * HOUR_SEC, end_hour * HOUR_SEC, factor)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Invalid surge {value!r}: {error}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fire station call centre simulation")
+    parser.set_defaults(
+        func=run_realtime,
+        names_file=None,
+        name_pool_size=DEFAULT_POOL_SIZE,
+        seed=None,
+        event_log=None,
+        profile=None,
+        routing=RoutingPolicy.LAST_RELEASED.value,
+        patience=None,
+        patience_distribution=PatienceDistribution.EXPONENTIAL.value,
+    )
+    subparsers = parser.add_subparsers(title="modes")
+
+    # event log, profiling, routing and patience of the realtime, serve, des and
+    # replay modes
+    outputs = argparse.ArgumentParser(add_help=False)
+    outputs.add_argument(
+        "--event-log", default=None, help="Append binary call events to this file"
+    )
+    outputs.add_argument(
+        "--profile",
+        action="store_true",
+        default=None,
+        help=f"Report hot-path timings at the end (or set {PROFILE_ENV_VAR}=1)",
+    )
+    outputs.add_argument(
+        "--routing",
+        choices=[policy.value for policy in RoutingPolicy],
+        default=RoutingPolicy.LAST_RELEASED.value,
+        help="Which free employee of a level answers the next call",
+    )
+    outputs.add_argument(
+        "--patience",
+        type=float,
+        default=None,
+        help="Mean seconds callers wait on hold before hanging up (never by default)",
+    )
+    outputs.add_argument(
+        "--patience-distribution",
+        choices=[distribution.value for distribution in PatienceDistribution],
+        default=PatienceDistribution.EXPONENTIAL.value,
+    )
+
+    # caller names of the realtime and des modes
+    names = argparse.ArgumentParser(add_help=False)
+    names.add_argument("--names-file", default=None, help="One caller name per line")
+    names.add_argument("--name-pool-size", type=int, default=DEFAULT_POOL_SIZE)
+
+    realtime = subparsers.add_parser(
+        "realtime", parents=[names, outputs], help="Wall-clock loop (default)"
+    )
+    realtime.add_argument("--seed", type=int, default=None)
+    realtime.set_defaults(func=run_realtime)
+
+    event_driven = subparsers.add_parser(
+        "des",
+        parents=[names, outputs],
+        help="Discrete-event simulation under a virtual clock",
+    )
+    event_driven.add_argument("--calls", type=int, default=100_000)
+    event_driven.add_argument("--seed", type=int, default=None)
+    event_driven.add_argument(
+        "--hourly-calls",
+        type=float,
+        nargs=24,
+        default=None,
+        help="Expected calls in each hour of the day, replaces --calls",
+    )
+    event_driven.add_argument(
+        "--hourly-prob-high",
+        type=float,
+        nargs="+",
+        default=PROB_OF_HIGH_PRIORITY_CALL,
+        help="Share of HIGH priority calls, one value or one per hour",
+    )
+    event_driven.add_argument("--days", type=int, default=1)
+    event_driven.add_argument(
+        "--shift",
+        type=parse_shift,
+        action="append",
+        default=[],
+        help="hour:level=headcount,... repeated daily, e.g. 8:juniors=6,seniors=3",
+    )
+    event_driven.add_argument(
+        "--surge",
+        type=parse_surge,
+        action="append",
+        default=[],
+        help="start_hour:end_hour:factor, e.g. 30:36:4 for a storm on day 2",
+    )
+    event_driven.set_defaults(func=run_event_driven)
+
+    gateway = subparsers.add_parser(
+        "serve",
+        parents=[outputs],
+        help="asyncio call centre behind a local TCP or Unix socket gateway",
+    )
+    gateway.add_argument("--host", default="127.0.0.1")
+    gateway.add_argument("--port", type=int, default=8765)
+    gateway.add_argument("--unix", default=None, help="Unix socket path, over TCP")
+    gateway.add_argument("--verbose", action="store_true")
+    gateway.set_defaults(func=run_gateway)
+
+    replay = subparsers.add_parser(
+        "replay", parents=[outputs], help="Replay a recorded call log"
+    )
+    replay.add_argument(
+        "trace", help="CSV or JSONL with timestamp, caller, priority, duration_sec"
+    )
+    replay.add_argument(
+        "--speedup",
+        type=float,
+        default=None,
+        help="Replay in scaled real time, as fast as possible if omitted",
+    )
+    replay.set_defaults(func=run_trace_replay)
+
+    erlang = subparsers.add_parser(
+        "erlang", help="Analytical Erlang C estimate of waits and utilization"
+    )
+    erlang.add_argument(
+        "--arrival-rate", type=float, default=2 / (1 + MAX_CALL_INTERVAL_SEC)
+    )
+    erlang.add_argument("--prob-high", type=float, default=PROB_OF_HIGH_PRIORITY_CALL)
+    erlang.add_argument(
+        "--validate", action="store_true", help="Compare with a simulated run"
+    )
+    erlang.add_argument("--calls", type=int, default=100_000)
+    erlang.add_argument("--seed", type=int, default=0)
+    erlang.set_defaults(func=run_erlang_estimate)
+
+    federate = subparsers.add_parser(
+        "federate",
+        help="Stations in separate processes, HIGH priority overflow to a neighbour",
+    )
+    federate.add_argument("--shards", type=int, default=os.cpu_count() or 1)
+    federate.add_argument("--calls", type=int, default=100_000, help="Per station")
+    federate.add_argument(
+        "--epoch", type=float, default=60.0, help="Simulated seconds between exchanges"
+    )
+    federate.add_argument("--seed", type=int, default=0)
+    federate.add_argument("--single-process", action="store_true")
+    federate.set_defaults(func=run_federated)
+
+    sweep = subparsers.add_parser(
+        "sweep", help="Monte Carlo parameter sweep over a staffing grid"
+    )
+    sweep.add_argument(
+        "--grid",
+        nargs="+",
+        required=True,
+        help="field=values, e.g. juniors=3:20 managers=1,2,4 call_escalation_prob=0.1:0.7:0.1",
+    )
+    sweep.add_argument("--out", default="sweep.csv")
+    sweep.add_argument("--replications", type=int, default=100)
+    sweep.add_argument("--horizon", type=int, default=3600, help="Seconds per run")
+    sweep.add_argument(
+        "--arrival-rate", type=float, default=2 / (1 + MAX_CALL_INTERVAL_SEC)
+    )
+    sweep.add_argument("--prob-high", type=float, default=PROB_OF_HIGH_PRIORITY_CALL)
+    sweep.add_argument("--seed", type=int, default=0)
+    sweep.add_argument("--workers", type=int, default=None)
+    sweep.set_defaults(func=run_parameter_sweep)
+
+    optimize = subparsers.add_parser(
+        "optimize", help="Cheapest staffing meeting a wait-time SLA"
+    )
+    optimize.add_argument(
+        "--arrival-rate", type=float, default=2 / (1 + MAX_CALL_INTERVAL_SEC)
+    )
+    optimize.add_argument("--prob-high", type=float, default=PROB_OF_HIGH_PRIORITY_CALL)
+    optimize.add_argument("--sla-wait", type=float, default=10.0)
+    optimize.add_argument("--sla-percentile", type=float, default=95.0)
+    optimize.add_argument(
+        "--sla-priority", choices=["HIGH", "LOW", "all"], default="HIGH"
+    )
+    optimize.add_argument("--cost-junior", type=float, default=1.0)
+    optimize.add_argument("--cost-senior", type=float, default=1.5)
+    optimize.add_argument("--cost-manager", type=float, default=2.5)
+    optimize.add_argument("--cost-director", type=float, default=4.0)
+    optimize.add_argument("--max-staff", type=int, default=50)
+    optimize.add_argument("--seed", type=int, default=0)
+    optimize.set_defaults(func=run_staffing_optimizer)
+
+    bench = subparsers.add_parser(
+        "bench", help="Dispatch throughput, review latency and memory benchmarks"
+    )
+    bench.add_argument("--staff", type=int, nargs="+", default=DEFAULT_STAFF)
+    bench.add_argument("--backlog", type=int, nargs="+", default=DEFAULT_BACKLOG)
+    bench.add_argument(
+        "--escalation", type=float, nargs="+", default=DEFAULT_ESCALATION_PROB
+    )
+    bench.add_argument(
+        "--repeats", type=int, default=DEFAULT_REPEATS, help="Median of n timings"
+    )
+    bench.add_argument("--out", default="bench.json")
+    bench.add_argument(
+        "--baseline",
+        default=BENCHMARK_BASELINE,
+        help="Results to compare against, '' to skip",
+    )
+    bench.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative change counted as a regression",
+    )
+    bench.set_defaults(func=run_benchmark_suite)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    args.func(args)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,166 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.call import CallPriority
+from src.names import NamePool
+from src.rng import RandomStreams
+from src.simulation import Arrival
+
+DAY_SEC = 86_400
+HOUR_SEC = 3_600
+
+
+@dataclass
+class Surge:
+    """Storm: the arrival rate is multiplied by `factor` in [start_sec, end_sec)"""
+
+    start_sec: float
+    end_sec: float
+    factor: float
+    # priority mix during the surge, None keeps the profile's
+    prob_high_priority: Optional[float] = None
+
+    def __post_init__(self):
+        if self.end_sec < self.start_sec or self.factor < 0:
+            raise ValueError("Surges need an ordered window and a non-negative factor")
+
+
+class RateProfile:
+    """
+    Daily arrival rate, piecewise constant: `rates` calls/sec over consecutive
+    segments of `segment_sec` covering one day, each with its own share of
+    HIGH priority calls. The same day repeats over the simulation.
+    """
+
+    def __init__(
+        self,
+        rates: Union[Sequence[float], np.ndarray],
+        prob_high_priority: Union[float, Sequence[float], np.ndarray],
+        segment_sec: float = HOUR_SEC,
+    ):
+        self.rates = np.asarray(rates, dtype=np.float64)
+        self.prob_high_priority = np.broadcast_to(
+            np.asarray(prob_high_priority, dtype=np.float64), self.rates.shape
+        ).copy()
+        self.segment_sec = float(segment_sec)
+
+        if len(self.rates) == 0 or not np.isclose(
+            len(self.rates) * self.segment_sec, DAY_SEC
+        ):
+            raise ValueError("Rate segments must cover exactly one day")
+        if (self.rates < 0).any() or not np.isfinite(self.rates).all():
+            raise ValueError("Arrival rates must be finite and non-negative")
+        if ((self.prob_high_priority < 0) | (self.prob_high_priority > 1)).any():
+            raise ValueError("Priority mix must be within [0, 1]")
+
+    @classmethod
+    def constant(cls, rate: float, prob_high_priority: float) -> "RateProfile":
+        return cls([rate], prob_high_priority, segment_sec=DAY_SEC)
+
+    @classmethod
+    def hourly(
+        cls,
+        calls_per_hour: Sequence[float],
+        prob_high_priority: Union[float, Sequence[float]],
+    ) -> "RateProfile":
+        """24 hourly call counts, starting at midnight"""
+        return cls(
+            np.asarray(calls_per_hour, dtype=np.float64) / HOUR_SEC, prob_high_priority
+        )
+
+    def smoothed(self, resolution_sec: float = 300) -> "RateProfile":
+        """
+        Periodic linear interpolation through the segment midpoints, resampled
+        into `resolution_sec` segments: the same daily volume without steps
+        between segments. The priority mix keeps the step of its segment.
+        """
+        num_segments = int(round(DAY_SEC / resolution_sec))
+        if num_segments < 1 or not np.isclose(num_segments * resolution_sec, DAY_SEC):
+            raise ValueError("Resolution must divide a day")
+
+        midpoints = (np.arange(len(self.rates)) + 0.5) * self.segment_sec
+        samples = (np.arange(num_segments) + 0.5) * resolution_sec
+        rates = np.interp(samples, midpoints, self.rates, period=DAY_SEC)
+        segments = (samples // self.segment_sec).astype(np.int64)
+        return RateProfile(rates, self.prob_high_priority[segments], resolution_sec)
+
+    def rate_at(self, time_sec: float) -> float:
+        return float(self.rates[int(time_sec % DAY_SEC // self.segment_sec)])
+
+    @property
+    def calls_per_day(self) -> float:
+        return float(self.rates.sum() * self.segment_sec)
+
+
+def day_arrivals(
+    profile: RateProfile,
+    day: int,
+    streams: RandomStreams,
+    surges: Sequence[Surge] = (),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Arrival times of one day, in seconds since the start of the simulation,
+    and whether each call is HIGH priority.
+
+    Non-homogeneous Poisson by inversion: the day is cut into pieces of
+    constant rate (profile segments and surge edges), the number of calls is
+    Poisson of the day's cumulative rate, and sorted uniform points of the
+    cumulative rate are mapped back to times piece by piece.
+    """
+    start = day * DAY_SEC
+    edges = start + np.arange(len(profile.rates) + 1) * profile.segment_sec
+    surge_edges = [
+        edge
+        for surge in surges
+        for edge in (surge.start_sec, surge.end_sec)
+        if start < edge < start + DAY_SEC
+    ]
+    if surge_edges:
+        edges = np.unique(np.concatenate([edges, surge_edges]))
+
+    piece_starts = edges[:-1]
+    segments = ((piece_starts - start) // profile.segment_sec).astype(np.int64)
+    rates = profile.rates[segments]
+    prob_high = profile.prob_high_priority[segments]
+    for surge in surges:
+        active = (piece_starts >= surge.start_sec) & (piece_starts < surge.end_sec)
+        rates = np.where(active, rates * surge.factor, rates)
+        if surge.prob_high_priority is not None:
+            prob_high = np.where(active, surge.prob_high_priority, prob_high)
+
+    cumulative = np.concatenate([[0.0], np.cumsum(rates * np.diff(edges))])
+    arrivals_generator = streams.arrivals.generator
+    num_calls = int(arrivals_generator.poisson(cumulative[-1]))
+    # points in (0, total], each falls in a piece of positive rate
+    points = np.sort(1.0 - arrivals_generator.random(num_calls)) * cumulative[-1]
+    pieces = np.searchsorted(cumulative, points, side="left") - 1
+    times = piece_starts[pieces] + (points - cumulative[pieces]) / rates[pieces]
+    high = streams.priority.generator.random(num_calls) < prob_high[pieces]
+    return times, high
+
+
+def profile_arrivals(
+    profile: RateProfile,
+    days: int,
+    streams: Optional[RandomStreams] = None,
+    surges: Sequence[Surge] = (),
+    caller_name: str = "Caller",
+    names: Optional[NamePool] = None,
+) -> Iterator[Arrival]:
+    """
+    Arrivals following `profile` for `days` days, with optional surges on top.
+    Days are generated whole with NumPy as they are reached, so months of
+    simulated time cost one day of arrays at a time.
+    """
+    streams = streams or RandomStreams()
+    for day in range(days):
+        times, high = day_arrivals(profile, day, streams, surges)
+        callers: List[str] = (
+            names.draw_many(len(times)) if names else [caller_name] * len(times)
+        )
+        for time_sec, is_high, caller in zip(times.tolist(), high.tolist(), callers):
+            yield Arrival(
+                time_sec, caller, CallPriority.HIGH if is_high else CallPriority.LOW
+            )
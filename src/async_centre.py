@@ -0,0 +1,154 @@
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
+import asyncio
+import json
+
+from src.call import Call, CallPriority
+from src.call_centre import CallCentre
+
+# caller name, priority, duration_sec (None for random), dispatched call
+CallRequest = Tuple[str, CallPriority, Optional[int], "asyncio.Future[Call]"]
+
+
+@dataclass
+class AsyncStats:
+    calls_arrived: int = 0
+    calls_ended: int = 0
+
+
+class AsyncCallCentre:
+    """
+    asyncio front end of a wall-clock CallCentre.
+
+    Calls arrive through the `incoming` queue and are dispatched in order by
+    `run`. Completion is timer driven: a loop timer is kept on the earliest
+    end time of the active calls, so calls end at their exact time (instead
+    of on the next tick of a polling loop) and an idle centre uses no CPU.
+    One timer on the heap head ends the same calls at the same times as a
+    timer per assignment, without rescheduling a handle for every call.
+    """
+
+    def __init__(
+        self,
+        call_centre: CallCentre,
+        escalate: Optional[bool] = None,
+        verbose: bool = False,
+    ):
+        self.call_centre = call_centre
+        self.escalate = escalate
+        self.verbose = verbose
+        self.stats = AsyncStats()
+        self.incoming: "asyncio.Queue[CallRequest]" = asyncio.Queue()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_end_time: Optional[float] = None
+
+    async def dispatch(
+        self,
+        caller_name: str,
+        priority: CallPriority,
+        duration_sec: Optional[int] = None,
+    ) -> Call:
+        """Queue a call and wait for it to be dispatched"""
+        future: "asyncio.Future[Call]" = asyncio.get_running_loop().create_future()
+        await self.incoming.put((caller_name, priority, duration_sec, future))
+        return await future
+
+    async def run(self):
+        """Dispatch incoming calls until cancelled"""
+        try:
+            while True:
+                caller_name, priority, duration_sec, future = await self.incoming.get()
+                call = self.call_centre.dispatch_call(
+                    caller_name=caller_name,
+                    priority=priority,
+                    verbose=self.verbose,
+                    duration_sec=duration_sec,
+                )
+                self.stats.calls_arrived += 1
+                self._schedule_next_end()
+                if not future.cancelled():
+                    future.set_result(call)
+        finally:
+            self._cancel_timer()
+
+    def _schedule_next_end(self):
+        next_end_time = self.call_centre.active_calls.next_end_time
+        # callers on hold hanging up wake the timer too
+        next_abandon_time = self.call_centre.call_backlog.next_abandon_time
+        if next_abandon_time is not None and (
+            next_end_time is None or next_abandon_time < next_end_time
+        ):
+            next_end_time = next_abandon_time
+        if next_end_time == self._timer_end_time:
+            return
+
+        self._cancel_timer()
+        if next_end_time is None:
+            return
+
+        delay = max(0.0, next_end_time - self.call_centre.clock())
+        self._timer = asyncio.get_running_loop().call_later(delay, self._on_call_end)
+        self._timer_end_time = next_end_time
+
+    def _on_call_end(self):
+        self._timer = None
+        self._timer_end_time = None
+        self.stats.calls_ended += self.call_centre.review_active_calls(
+            escalate=self.escalate, verbose=self.verbose
+        )
+        self.call_centre.review_backlog()
+        self._schedule_next_end()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_end_time = None
+
+
+async def start_gateway(
+    async_centre: AsyncCallCentre,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    path: Optional[str] = None,
+) -> asyncio.Server:
+    """
+    Local stand-in for the phone gateway, on a Unix socket at `path` or on
+    TCP `host`:`port`. Clients send one JSON object per line with caller,
+    priority (HIGH or LOW) and an optional duration_sec, and get one JSON
+    line back per call: its uid and the uid of the assigned employee (null
+    when backlogged), or an error.
+    """
+
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                reply = await _handle_request(async_centre, line)
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle_client, path=path)
+    return await asyncio.start_server(handle_client, host=host, port=port)
+
+
+async def _handle_request(async_centre: AsyncCallCentre, line: bytes) -> Dict[str, Any]:
+    try:
+        record = json.loads(line)
+        duration = record.get("duration_sec")
+        caller_name = str(record["caller"])
+        priority = CallPriority[str(record["priority"]).upper()]
+        duration_sec = int(duration) if duration not in (None, "") else None
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        return {"error": f"Invalid call request: {error}"}
+
+    call = await async_centre.dispatch(caller_name, priority, duration_sec)
+    return {
+        "call_uid": call.uid,
+        "caller_uid": call.caller.uid,
+        "assigned_to": None if call.assigned_to is None else call.assigned_to.uid,
+    }
@@ -0,0 +1,292 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import asdict, dataclass
+import gc
+import itertools
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+from src.call import CallPriority
+from src.call_centre import CallCentre, CallCentreConfig
+from src.rng import RandomStreams
+from src.simulation import VirtualClock
+
+DEFAULT_STAFF = [10, 1000, 100_000]
+DEFAULT_BACKLOG = [0, 10_000]
+DEFAULT_ESCALATION_PROB = [0.1, 0.5]
+MAX_CALL_DURATION_SEC = 15
+PROB_HIGH_PRIORITY = 0.3
+# fire station proportions of juniors, seniors, managers and directors
+STAFF_SHARES = (5, 3, 2, 2)
+# small cases are repeated on fresh call centres until this many calls are timed
+MIN_TIMED_CALLS = 10_000
+# timings are the median of this many measurements
+DEFAULT_REPEATS = 7
+# iterations of the pure Python loop timed next to each measurement, its time
+# tracks the speed of the machine at that moment
+CALIBRATION_LOOPS = 200_000
+DEFAULT_THRESHOLD = 0.25
+CALLER_NAMES = [f"Caller {i}" for i in range(1000)]
+
+# metric name -> True if higher is better
+METRICS = {
+    "dispatch_calls_per_sec": True,
+    "review_ns_per_call": False,
+    "memory_bytes_per_call": False,
+}
+# metrics scaled by the calibration ratio before comparing: +1 for rates,
+# -1 for durations
+TIMED_METRICS = {"dispatch_calls_per_sec": 1, "review_ns_per_call": -1}
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    staff: int
+    backlog: int
+    escalation_prob: float
+
+    @property
+    def name(self) -> str:
+        return (
+            f"staff={self.staff}/backlog={self.backlog}"
+            f"/escalation={self.escalation_prob:g}"
+        )
+
+    def config(self) -> CallCentreConfig:
+        """`staff` split across levels in STAFF_SHARES, at least one per level"""
+        sizes = [
+            max(1, round(self.staff * share / sum(STAFF_SHARES)))
+            for share in STAFF_SHARES
+        ]
+        return CallCentreConfig(
+            juniors=sizes[0],
+            seniors=sizes[1],
+            managers=sizes[2],
+            directors=sizes[3],
+            max_call_duration_sec=MAX_CALL_DURATION_SEC,
+            call_escalation_prob=self.escalation_prob,
+        )
+
+
+@dataclass
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    # timings scaled to the speed of the baseline run, see compare
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline"""
+        return self.current / self.baseline - 1.0
+
+
+def benchmark_grid(
+    staff: Sequence[int] = DEFAULT_STAFF,
+    backlog: Sequence[int] = DEFAULT_BACKLOG,
+    escalation_prob: Sequence[float] = DEFAULT_ESCALATION_PROB,
+) -> Iterator[BenchmarkCase]:
+    for values in itertools.product(staff, backlog, escalation_prob):
+        yield BenchmarkCase(*values)
+
+
+def run_case(
+    case: BenchmarkCase, repeats: int = DEFAULT_REPEATS, seed: int = 0
+) -> Dict[str, Any]:
+    """
+    One round fills a fresh call centre with staff + backlog calls (the
+    dispatch timing), then moves the clock past every call end and runs one
+    review of active calls and backlog (the review timing). Rounds are
+    repeated until MIN_TIMED_CALLS calls were dispatched, the median of
+    `repeats` measurements is kept, as is the median calibration loop time
+    measured along with them. Memory is the traced allocation still held per
+    dispatched call after a fill.
+    """
+    streams = RandomStreams(seed)
+    config = case.config()
+    dispatch_rates = []
+    reviews_ns = []
+    calibrations_ns = []
+
+    for _ in range(repeats):
+        calibrations_ns.append(_calibration_ns())
+        dispatched = reviewed = 0
+        dispatch_ns = review_ns = 0
+        while dispatched < MIN_TIMED_CALLS:
+            round_stats = _run_round(config, case.backlog, streams)
+            dispatched += round_stats[0]
+            dispatch_ns += round_stats[1]
+            reviewed += round_stats[2]
+            review_ns += round_stats[3]
+        dispatch_rates.append(dispatched / dispatch_ns * 1e9)
+        reviews_ns.append(review_ns / max(reviewed, 1))
+
+    return {
+        "case": case.name,
+        **asdict(case),
+        "dispatch_calls_per_sec": statistics.median(dispatch_rates),
+        "review_ns_per_call": statistics.median(reviews_ns),
+        "calibration_ns": statistics.median(calibrations_ns),
+        "memory_bytes_per_call": _memory_per_call(config, case.backlog, streams),
+    }
+
+
+def run_benchmarks(
+    cases: Sequence[BenchmarkCase], repeats: int = DEFAULT_REPEATS, seed: int = 0
+) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [run_case(case, repeats=repeats, seed=seed) for case in cases],
+    }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Metrics more than `threshold` (relative) worse than the baseline.
+    Cases missing from either side are not compared. When both sides have a
+    calibration time, timings are first scaled to the speed of the baseline
+    run, so that a machine running slower overall is not a regression.
+    """
+    baseline_results = {result["case"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(result["case"])
+        if reference is None:
+            continue
+
+        speedup = 1.0
+        if result.get("calibration_ns") and reference.get("calibration_ns"):
+            speedup = result["calibration_ns"] / reference["calibration_ns"]
+        for metric, higher_is_better in METRICS.items():
+            value, reference_value = result[metric], reference[metric]
+            value *= speedup ** TIMED_METRICS.get(metric, 0)
+            if higher_is_better:
+                worse = value < reference_value * (1 - threshold)
+            else:
+                worse = value > reference_value * (1 + threshold)
+            if worse:
+                regressions.append(
+                    Regression(result["case"], metric, reference_value, value)
+                )
+
+    return regressions
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def save_results(results: Dict[str, Any], path: str):
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+        results_file.write("\n")
+
+
+def _arrivals(num_calls: int, streams: RandomStreams) -> List[Tuple[str, CallPriority]]:
+    """Drawn before the timed part, callers repeat like a name pool"""
+    return [
+        (
+            CALLER_NAMES[i % len(CALLER_NAMES)],
+            (
+                CallPriority.HIGH
+                if streams.priority.random() < PROB_HIGH_PRIORITY
+                else CallPriority.LOW
+            ),
+        )
+        for i in range(num_calls)
+    ]
+
+
+def _num_calls(call_centre: CallCentre, backlog: int) -> int:
+    """Enough calls to keep every employee busy and leave `backlog` on hold"""
+    return sum(len(staff) for staff in call_centre.employees.values()) + backlog
+
+
+def _run_round(
+    config: CallCentreConfig, backlog: int, streams: RandomStreams
+) -> List[int]:
+    """[calls dispatched, dispatch ns, calls reviewed, review ns]"""
+    clock = VirtualClock()
+    call_centre = CallCentre(config, clock=clock, rng=streams)
+    arrivals = _arrivals(_num_calls(call_centre, backlog), streams)
+
+    # like timeit, keep collector pauses out of the timings
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for caller_name, priority in arrivals:
+            call_centre.dispatch_call(caller_name, priority)
+        dispatch_ns = time.perf_counter_ns() - start
+
+        clock.time_sec += MAX_CALL_DURATION_SEC
+        start = time.perf_counter_ns()
+        reviewed = call_centre.review_active_calls()
+        call_centre.review_backlog()
+        review_ns = time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+    return [len(arrivals), dispatch_ns, reviewed, review_ns]
+
+
+def _calibration_ns() -> int:
+    """Time of a fixed pure Python loop, like the interpreter-bound hot path"""
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        total = 0
+        for i in range(CALIBRATION_LOOPS):
+            total += i % 7
+        return time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+
+def _memory_per_call(
+    config: CallCentreConfig, backlog: int, streams: RandomStreams
+) -> float:
+    call_centre = CallCentre(config, clock=VirtualClock(), rng=streams)
+    arrivals = _arrivals(_num_calls(call_centre, backlog), streams)
+    # callers are interned on first sight and random values drawn in blocks
+    # whenever one runs out: register the callers and draw every duration
+    # outside the trace, so that only the calls themselves are measured
+    for caller_name in CALLER_NAMES:
+        call_centre.callers.register(caller_name)
+    durations = call_centre._draw_durations(len(arrivals))
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for (caller_name, priority), duration_sec in zip(arrivals, durations):
+            call_centre.dispatch_call(caller_name, priority, duration_sec=duration_sec)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / len(arrivals)
+
+
+def display_results(
+    results: Dict[str, Any], regressions: Optional[List[Regression]] = None
+):
+    for result in results["results"]:
+        print(
+            f"## {result['case']}: {result['dispatch_calls_per_sec']:,.0f} calls/s"
+            f" | review {result['review_ns_per_call']:,.0f} ns/call"
+            f" | {result['memory_bytes_per_call']:,.0f} B/call"
+        )
+    for regression in regressions or []:
+        print(
+            f"!! Regression {regression.case} {regression.metric}: "
+            f"{regression.baseline:,.1f} -> {regression.current:,.1f} "
+            f"({regression.change:+.1%})"
+        )
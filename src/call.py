@@ -1,11 +1,12 @@
-from typing import Optional
+from typing import List, Mapping, Optional, TypeVar, Union
 from enum import Enum, auto
 from dataclasses import dataclass
 
 import datetime
-import random
 
-from src.employee import Employee, EmployeeSeniorotyLevel
+from src.employee import Employee, EmployeePool, EmployeeSeniorotyLevel
+from src.event_log import CallEvent
+from src.rng import UniformStream
 
 
 class CallPriority(Enum):
@@ -25,27 +26,94 @@ EMPLOYEE_ASSIGNMENT_ORDER = {
     ],
 }
 
+# Order in which the backlog is served, escalated calls are HIGH priority
+BACKLOG_SERVICE_ORDER = [CallPriority.HIGH, CallPriority.LOW]
 
-@dataclass
+T = TypeVar("T")
+
+
+def by_priority(values: Mapping[CallPriority, T]) -> List[T]:
+    """
+    `values` as a list indexed by `priority._value_`, for per-call lookups:
+    hashing an Enum member is a Python-level call, the list index is not.
+    Index 0 is unused.
+    """
+    size = max(priority._value_ for priority in CallPriority) + 1
+    indexed: List[T] = [None] * size  # type: ignore[list-item]
+    for priority, value in values.items():
+        indexed[priority._value_] = value
+    return indexed
+
+
+@dataclass(slots=True)
 class Caller:
     uid: int
     name: str
 
 
-@dataclass
-class CallInfo:
-    timestamp: datetime.datetime
-    caller: Caller
-    priority: CallPriority
-    duration_sec: int
-    call_escalation_prob: float
-    assigned_to: Optional[Employee] = None
-    assigned_at: Optional[datetime.datetime] = None
+def _to_sec(moment: Union[None, float, datetime.datetime]) -> Optional[float]:
+    if isinstance(moment, datetime.datetime):
+        return moment.timestamp()
+    return moment
 
 
 class Call:
-    def __init__(self, *args, **kwargs) -> None:
-        self._info = CallInfo(*args, **kwargs)
+    """
+    A single call, slotted to keep millions of them cheap.
+    Times are POSIX seconds (floats) read from the call centre clock,
+    `timestamp` and `assigned_at` give datetime views of them.
+    """
+
+    __slots__ = (
+        "uid",
+        "caller",
+        "priority",
+        "duration_sec",
+        "call_escalation_prob",
+        "escalates",
+        "assigned_to",
+        "timestamp_sec",
+        "assigned_at_sec",
+        "queued_at_sec",
+        "patience_sec",
+        "abandon_at_sec",
+        "abandoned",
+        "_pool",
+    )
+
+    def __init__(
+        self,
+        timestamp: Union[float, datetime.datetime],
+        caller: Caller,
+        priority: CallPriority,
+        duration_sec: int,
+        call_escalation_prob: float,
+        assigned_to: Optional[Employee] = None,
+        assigned_at: Union[None, float, datetime.datetime] = None,
+        uid: int = 0,
+        patience_sec: Optional[float] = None,
+        escalates: Optional[bool] = None,
+    ) -> None:
+        self.uid = uid
+        self.caller = caller
+        self.priority = priority
+        self.duration_sec = duration_sec
+        self.call_escalation_prob = call_escalation_prob
+        # escalation drawn when the call was registered, None to draw it at
+        # the end of the call
+        self.escalates = escalates
+        self.assigned_to = assigned_to
+        self.timestamp_sec: float = _to_sec(timestamp)  # type: ignore
+        self.assigned_at_sec = _to_sec(assigned_at)
+        # start of the current wait, the escalation time for escalated calls
+        self.queued_at_sec: float = self.timestamp_sec
+        # how long the caller waits on hold before hanging up, None for ever
+        self.patience_sec = patience_sec
+        # hang-up deadline while on hold, see CallBacklog
+        self.abandon_at_sec: Optional[float] = None
+        self.abandoned = False
+        # pool of the assigned employee, released on end
+        self._pool: Optional[EmployeePool] = None
 
     def __str__(self) -> str:
         return (
@@ -61,108 +129,91 @@ class Call:
         if self.assigned_to is not None:
             raise ValueError("Cannnot assign a call that is already assigned")
 
-        for seniority_level in EMPLOYEE_ASSIGNMENT_ORDER[self.priority]:
-            if self.assigned_to:
-                break
-
-            for employee in call_centre.employees[seniority_level]:
-                if employee.is_free:
-                    self.assigned_to = employee
-                    self.assigned_at = datetime.datetime.now()
-                    call_centre.active_calls.append(self)
-                    employee.is_free = False
-                    break
-
-        if self.assigned_to is None:
-            call_centre.call_backlog.append(self)
+        for pool in call_centre._assignment_pools[self.priority._value_]:
+            employee = pool.acquire()
+            if employee is not None:
+                self.assigned_to = employee
+                self.assigned_at_sec = call_centre.clock()
+                self._pool = pool
+                call_centre.active_calls.append(self)
+                if call_centre.metrics is not None:
+                    call_centre.metrics.record_assignment(self)
+                if call_centre.event_log is not None:
+                    call_centre.event_log.record(
+                        CallEvent.ASSIGNED, self, self.assigned_at_sec, employee
+                    )
+                return
+
+        call_centre.call_backlog.append(self)
+        if call_centre.event_log is not None:
+            call_centre.event_log.record(
+                CallEvent.BACKLOGGED, self, call_centre.clock()
+            )
 
     def end(self, call_centre, escalate: Optional[bool] = None, verbose: bool = False):
         assigned_employee = self.assigned_to
         if assigned_employee is None:
             raise RuntimeError("Cannot end an unassigned call")
 
+        pool = self._pool or call_centre.employee_pools[assigned_employee.seniority]
+        metrics = call_centre.metrics
+        if pool.handling_time is not None:
+            pool.handling_time.record(self.duration_sec)
+        event_log = call_centre.event_log
+        if event_log is not None:
+            event_log.record(
+                CallEvent.ENDED, self, self.end_time_sec, assigned_employee
+            )
+
         self.assigned_to = None
-        assigned_employee.is_free = True
+        self._pool = None
+        if not pool.release(assigned_employee):
+            call_centre.employee_left(assigned_employee, self.end_time_sec)
 
-        if self.priority == CallPriority.LOW and self._should_escalate(escalate):
+        if self.priority == CallPriority.LOW and self._should_escalate(
+            escalate, call_centre.rng.escalation
+        ):
 
             if verbose:
                 print("\n!! Call Escalated !!")
                 print(self)
+            if metrics is not None:
+                metrics.record_escalation()
+            if event_log is not None:
+                event_log.record(CallEvent.ESCALATED, self, self.end_time_sec)
+
+            self.queued_at_sec = self.end_time_sec  # type: ignore
 
             self.priority = CallPriority.HIGH
-            self.assign(call_centre)
+            call_centre._assign_call(self, call_centre)
 
-    def _should_escalate(self, escalate: Optional[bool] = None):
-        prob_escalate = self.call_escalation_prob
-        return (
-            escalate
-            if escalate is not None
-            else random.choices(
-                [True, False], weights=[prob_escalate, 1 - prob_escalate], k=1
-            )[0]
-        )
+    def _should_escalate(self, escalate: Optional[bool], stream: UniformStream) -> bool:
+        if escalate is not None:
+            return escalate
+        if self.escalates is not None:
+            return self.escalates
+        return stream.random() < self.call_escalation_prob
 
     @property
-    def expired(self):
-        if self.assigned_to is None:
-            return False
-        assert self.assigned_at
-
-        since_assignment = datetime.datetime.now() - self.assigned_at
-        if since_assignment.total_seconds() >= self.duration_sec:
-            return True
-        else:
-            return False
+    def end_time_sec(self) -> Optional[float]:
+        if self.assigned_at_sec is None:
+            return None
+        return self.assigned_at_sec + self.duration_sec
 
     @property
     def timestamp(self) -> datetime.datetime:
-        return self._info.timestamp
+        return datetime.datetime.fromtimestamp(self.timestamp_sec)
 
     @timestamp.setter
-    def timestamp(self, val: datetime.datetime):
-        self._info.timestamp = val
-
-    @property
-    def caller(self) -> Caller:
-        return self._info.caller
-
-    @caller.setter
-    def caller(self, val: Caller):
-        self._info.caller = val
-
-    @property
-    def priority(self) -> CallPriority:
-        return self._info.priority
-
-    @priority.setter
-    def priority(self, val: CallPriority):
-        self._info.priority = val
-
-    @property
-    def duration_sec(self) -> int:
-        return self._info.duration_sec
-
-    @duration_sec.setter
-    def duration_sec(self, val: int):
-        self._info.duration_sec = val
-
-    @property
-    def assigned_to(self) -> Optional[Employee]:
-        return self._info.assigned_to
-
-    @assigned_to.setter
-    def assigned_to(self, val: Employee):
-        self._info.assigned_to = val
+    def timestamp(self, val: Union[float, datetime.datetime]):
+        self.timestamp_sec = _to_sec(val)  # type: ignore
 
     @property
     def assigned_at(self) -> Optional[datetime.datetime]:
-        return self._info.assigned_at
+        if self.assigned_at_sec is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.assigned_at_sec)
 
     @assigned_at.setter
-    def assigned_at(self, val: Optional[datetime.datetime]):
-        self._info.assigned_at = val
-
-    @property
-    def call_escalation_prob(self) -> float:
-        return self._info.call_escalation_prob
+    def assigned_at(self, val: Union[None, float, datetime.datetime]):
+        self.assigned_at_sec = _to_sec(val)
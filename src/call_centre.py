@@ -1,10 +1,30 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
-import datetime
-import random
+from enum import Enum
+import math
+import time
 
-from src.call import CallPriority, Call, Caller
-from src.employee import EmployeeSeniorotyLevel, Employee
+from src.call import (
+    BACKLOG_SERVICE_ORDER,
+    EMPLOYEE_ASSIGNMENT_ORDER,
+    CallPriority,
+    Call,
+    by_priority,
+)
+from src.callers import CallerRegistry
+from src.event_log import CallEvent, EventLog
+from src.metrics import CallCentreMetrics
+from src.profiling import (
+    CALL_CENTRE_HOT_PATH,
+    CALL_HOT_PATH,
+    HotPathProfiler,
+    TimingStat,
+    profiling_enabled,
+)
+from src.employee import EmployeeSeniorotyLevel, Employee, EmployeePool
+from src.queues import ActiveCallQueue, CallBacklog
+from src.rng import RandomStreams, UniformStream
+from src.routing import RoutingPolicy, create_pool
 
 
 @dataclass
@@ -30,12 +50,91 @@ class CallCentreConfig:
             raise ValueError("Number of employees must be positive")
 
 
+class PatienceDistribution(Enum):
+    FIXED = "fixed"
+    EXPONENTIAL = "exponential"
+
+
+@dataclass(frozen=True)
+class Patience:
+    """How long callers wait on hold before hanging up, drawn once per call"""
+
+    mean_sec: float
+    distribution: PatienceDistribution = PatienceDistribution.EXPONENTIAL
+
+    def __post_init__(self):
+        if not self.mean_sec > 0:
+            raise ValueError("Mean patience must be positive")
+
+    def draw(self, stream: UniformStream) -> float:
+        if self.distribution is PatienceDistribution.FIXED:
+            return self.mean_sec
+        return -self.mean_sec * math.log(1.0 - stream.random())
+
+
+@dataclass(frozen=True)
+class CallCentreStatus:
+    """Point-in-time view of the staffing and queue counters"""
+
+    free_staff: Dict[EmployeeSeniorotyLevel, int]
+    busy_staff: Dict[EmployeeSeniorotyLevel, int]
+    active_calls: int
+    backlog: Dict[CallPriority, int]
+
+    @property
+    def free_staff_total(self) -> int:
+        return sum(self.free_staff.values())
+
+    @property
+    def total_staff(self) -> int:
+        return self.free_staff_total + sum(self.busy_staff.values())
+
+    @property
+    def backlog_total(self) -> int:
+        return sum(self.backlog.values())
+
+
 class CallCentre:
-    def __init__(self, config: CallCentreConfig):
+    # Call.assign and Call.end as invoked by the call centre, a profiler
+    # replaces them on its instance only
+    _assign_call = staticmethod(Call.assign)
+    _end_call = staticmethod(Call.end)
+
+    def __init__(
+        self,
+        config: CallCentreConfig,
+        clock: Callable[[], float] = time.time,
+        event_log: Optional[EventLog] = None,
+        collect_metrics: bool = True,
+        profile: Optional[bool] = None,
+        rng: Optional[RandomStreams] = None,
+        routing: RoutingPolicy = RoutingPolicy.LAST_RELEASED,
+        patience: Optional[Patience] = None,
+    ):
+        """
+        profile = None to enable profiling from the environment, see src.profiling
+        routing picks the free employee of a level that answers, see src.routing
+        patience = None for callers that never hang up on hold
+        """
         # mimic DB id count
         self._employee_count = 0
-        self._caller_count = 0
+        self._call_count = 0
+        self.callers = CallerRegistry()
         self._config = config
+        # POSIX seconds, wall clock by default, simulations plug in a virtual one
+        self.clock = clock
+        # structured event sink, None disables it
+        self.event_log = event_log
+        # durations and escalations, unseeded unless a seeded service is passed
+        self.rng = rng if rng is not None else RandomStreams()
+        self.metrics = CallCentreMetrics() if collect_metrics else None
+        self.patience = patience
+        self._started_at_sec = clock()
+        self.profiler: Optional[HotPathProfiler] = None
+        if profile is None:
+            profile = profiling_enabled()
+        if profile:
+            HotPathProfiler().attach(self)
 
         self.employees = {
             EmployeeSeniorotyLevel.JUNIOR: self._create_employees_batch(
@@ -51,20 +150,214 @@ class CallCentre:
                 config.directors, EmployeeSeniorotyLevel.DIRECTOR, is_free=True
             ),
         }
+        # staffed time per level, times relative to the start:
+        # present * elapsed - sum of hire times + time of those who left
+        self._hire_offsets_sec = {level: 0.0 for level in EmployeeSeniorotyLevel}
+        self._departed_staff_sec = {level: 0.0 for level in EmployeeSeniorotyLevel}
+        # Free/busy pools per level, O(1) or O(log n) assignment and release
+        self.routing = routing
+        self.employee_pools: Dict[EmployeeSeniorotyLevel, EmployeePool] = {
+            seniority_level: create_pool(routing, employees, self.rng.routing)
+            for seniority_level, employees in self.employees.items()
+        }
+        self.assignment_pools = {
+            priority: [
+                self.employee_pools[seniority_level]
+                for seniority_level in EMPLOYEE_ASSIGNMENT_ORDER[priority]
+            ]
+            for priority in CallPriority
+        }
+        # the same, looked up per call, see by_priority
+        self._assignment_pools = by_priority(self.assignment_pools)
+        if self.metrics is not None:
+            for seniority_level, pool in self.employee_pools.items():
+                pool.handling_time = self.metrics.handling_time[seniority_level]
+
+        # First in first out (queue) per priority
+        self.call_backlog = CallBacklog()
+        self.active_calls = ActiveCallQueue()
+        # (priority, deque of calls on hold, pools answering) in service order
+        self._backlog_service = [
+            (
+                priority,
+                self.call_backlog.queue(priority),
+                self.assignment_pools[priority],
+            )
+            for priority in BACKLOG_SERVICE_ORDER
+        ]
 
-        # First in first out (queue)
-        self.call_backlog: List[Call] = []
-        self.active_calls: List[Call] = []
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickled state, see src.snapshot. The event log and profiler are left out"""
+        state = self.__dict__.copy()
+        for name in [*CALL_CENTRE_HOT_PATH, *CALL_HOT_PATH.values()]:
+            state.pop(name, None)
+        state["event_log"] = None
+        state["profiler"] = None
+        return state
 
     def dispatch_call(
-        self, caller_name: str, priority: CallPriority, verbose: bool = False
-    ):
-        call = self._register_call(caller_name, priority)
-        call.assign(call_centre=self)
+        self,
+        caller_name: str,
+        priority: CallPriority,
+        verbose: bool = False,
+        duration_sec: Optional[int] = None,
+        timestamp: Optional[float] = None,
+        patience_sec: Optional[float] = None,
+    ) -> Call:
+        """
+        duration_sec = None for a random duration,
+        timestamp = None for now (an earlier one counts as time already waited),
+        patience_sec = None to draw it from the call centre patience
+        """
+        call = self._register_call(
+            caller_name,
+            priority,
+            timestamp=timestamp,
+            duration_sec=duration_sec,
+            patience_sec=patience_sec,
+        )
+        if self.event_log is not None:
+            self.event_log.record(CallEvent.ARRIVED, call, call.timestamp_sec)
+        self._assign_call(call, self)
         if verbose:
             print("\n!! New Call Received !!")
             print(call)
 
+        return call
+
+    def dispatch_calls(
+        self, calls: Iterable[Tuple[str, CallPriority]], verbose: bool = False
+    ) -> List[Call]:
+        """
+        Dispatch a burst of (caller name, priority) calls, same outcome as
+        calling dispatch_call for each of them in order.
+
+        All calls are registered in one step sharing one clock read, with
+        their durations drawn in one vectorized step. Pools do not free up
+        during a burst, so a first pass over the free counts decides which
+        level answers each call, then every pool hands out all of its calls'
+        employees in one step.
+        """
+        requests = list(calls)
+        now = self.clock()
+        durations = self._draw_durations(len(requests))
+        dispatched = [
+            self._register_call(
+                caller_name, priority, timestamp=now, duration_sec=duration_sec
+            )
+            for (caller_name, priority), duration_sec in zip(requests, durations)
+        ]
+
+        # the first pool of its priority with a free employee answers a call,
+        # a pool stays full for the rest of the burst once full
+        num_free = {pool: pool.num_free for pool in self.employee_pools.values()}
+        pool_calls: Dict[EmployeePool, List[Call]] = {
+            pool: [] for pool in self.employee_pools.values()
+        }
+        answered: List[Optional[EmployeePool]] = []
+        for call in dispatched:
+            for pool in self._assignment_pools[call.priority._value_]:
+                if num_free[pool]:
+                    num_free[pool] -= 1
+                    pool_calls[pool].append(call)
+                    answered.append(pool)
+                    break
+            else:
+                answered.append(None)
+
+        if self.routing is RoutingPolicy.RANDOM:
+            # random routing pools share a stream, draw in dispatch order
+            for call, answering in zip(dispatched, answered):
+                if answering is not None:
+                    call.assigned_to = answering.acquire()
+        else:
+            for pool, answered_calls in pool_calls.items():
+                employees = pool.acquire_many(len(answered_calls))
+                for call, employee in zip(answered_calls, employees):
+                    call.assigned_to = employee
+
+        metrics = self.metrics
+        event_log = self.event_log
+        for call, answering in zip(dispatched, answered):
+            if event_log is not None:
+                event_log.record(CallEvent.ARRIVED, call, now)
+            if answering is None:
+                self.call_backlog.append(call)
+                if event_log is not None:
+                    event_log.record(CallEvent.BACKLOGGED, call, now)
+            else:
+                call.assigned_at_sec = now
+                call._pool = answering
+                self.active_calls.append(call)
+                if metrics is not None:
+                    metrics.record_assignment(call)
+                if event_log is not None:
+                    event_log.record(CallEvent.ASSIGNED, call, now, call.assigned_to)
+
+            if verbose:
+                print("\n!! New Call Received !!")
+                print(call)
+
+        return dispatched
+
+    def add_employees(
+        self, seniority: EmployeeSeniorotyLevel, num_employees: int
+    ) -> List[Employee]:
+        """Hire at runtime, the new employees take calls on hold right away"""
+        if num_employees < 0:
+            raise ValueError("Number of employees must be positive")
+
+        now = self.clock()
+        employees = self._create_employees_batch(
+            num_employees, seniority, is_free=True, hired_at_sec=now
+        )
+        pool = self.employee_pools[seniority]
+        for employee in employees:
+            pool.add(employee)
+        self.employees[seniority].extend(employees)
+        self._hire_offsets_sec[seniority] += num_employees * (
+            now - self._started_at_sec
+        )
+
+        self.review_backlog()
+        return employees
+
+    def retire_employees(
+        self, seniority: EmployeeSeniorotyLevel, num_employees: int
+    ) -> List[Employee]:
+        """
+        Most recently hired first, O(1) each. They leave `employees` at once,
+        free ones leave straight away, busy ones after their current call.
+        """
+        roster = self.employees[seniority]
+        if not 0 <= num_employees <= len(roster):
+            raise ValueError(f"Cannot retire {num_employees} of {len(roster)}")
+
+        now = self.clock()
+        pool = self.employee_pools[seniority]
+        retired = []
+        for _ in range(num_employees):
+            employee = roster.pop()
+            if pool.retire(employee):
+                self.employee_left(employee, now)
+            retired.append(employee)
+
+        return retired
+
+    def set_headcount(self, seniority: EmployeeSeniorotyLevel, headcount: int):
+        """Hire or retire to reach `headcount`, see add_employees/retire_employees"""
+        change = headcount - len(self.employees[seniority])
+        if change > 0:
+            self.add_employees(seniority, change)
+        elif change < 0:
+            self.retire_employees(seniority, -change)
+
+    def employee_left(self, employee: Employee, left_at_sec: float):
+        """Staffed time bookkeeping of a retired employee leaving"""
+        level = employee.seniority
+        self._hire_offsets_sec[level] -= employee.hired_at_sec - self._started_at_sec
+        self._departed_staff_sec[level] += left_at_sec - employee.hired_at_sec
+
     def review_active_calls(
         self, escalate: Optional[bool] = None, verbose: bool = False
     ):
@@ -72,55 +365,129 @@ class CallCentre:
         Mimics end of chat
 
         escalate = None for random escalation
+        Returns the number of calls that ended
         """
-        inds_to_remove = []
-        for ind in range(len(self.active_calls)):
-            call = self.active_calls[ind]
-            if call.expired:
-                inds_to_remove.append(ind)
-                call.end(call_centre=self, escalate=escalate, verbose=verbose)
+        expired_calls = self.active_calls.pop_expired(self.clock())
+        for call in expired_calls:
+            self._end_call(call, self, escalate, verbose)
 
-        # remove back to front to keep the order
-        inds_to_remove.sort(reverse=True)
-        for ind in inds_to_remove:
-            self.active_calls.pop(ind)
+        return len(expired_calls)
 
     def review_backlog(self):
-        backlog_len = len(self.call_backlog)
-        for _ in range(backlog_len):
-            call = self.call_backlog.pop(0)
-            call.assign(call_centre=self)
+        """
+        Assign calls on hold, HIGH priority first and FIFO within a priority,
+        after the callers out of patience have hung up.
+        Stops serving a priority as soon as none of its levels has a free employee.
+        """
+        call_backlog = self.call_backlog
+        if call_backlog.next_abandon_time is not None:
+            self.review_abandonments()
+        for priority, queue, pools in self._backlog_service:
+            # may hold abandoned calls only, popleft skips them
+            while queue and any(pool.has_free for pool in pools):
+                call = call_backlog.popleft(priority)
+                if call is None:
+                    break
+                self._assign_call(call, self)
 
-    def display_status(self):
-        free_staff = self.free_staff_detailed
-        total_staff = (
-            self._config.juniors
-            + self._config.seniors
-            + self._config.managers
-            + self._config.directors
+    def review_abandonments(self) -> int:
+        """
+        Hang up the calls on hold past their patience.
+        Returns the number of calls abandoned
+        """
+        abandoned = self.call_backlog.abandon_expired(self.clock())
+        for call in abandoned:
+            if self.metrics is not None:
+                self.metrics.record_abandonment(call)
+            if self.event_log is not None:
+                self.event_log.record(
+                    CallEvent.ABANDONED,
+                    call,
+                    call.queued_at_sec + call.patience_sec,  # type: ignore
+                )
+
+        return len(abandoned)
+
+    def status(self) -> CallCentreStatus:
+        """O(1) snapshot of all counters, does not touch individual employees"""
+        return CallCentreStatus(
+            free_staff={
+                seniority_level: pool.num_free
+                for seniority_level, pool in self.employee_pools.items()
+            },
+            busy_staff={
+                seniority_level: pool.num_busy
+                for seniority_level, pool in self.employee_pools.items()
+            },
+            active_calls=len(self.active_calls),
+            backlog={
+                priority: self.call_backlog.count(priority)
+                for priority in BACKLOG_SERVICE_ORDER
+            },
         )
 
+    def utilization(self) -> Dict[EmployeeSeniorotyLevel, float]:
+        """
+        Per level share of staffed time spent on completed calls so far,
+        staffed time follows the headcount changes
+        """
+        if self.metrics is None:
+            raise RuntimeError("Metrics collection is disabled")
+
+        elapsed_sec = self.clock() - self._started_at_sec
+        staff = {}
+        for seniority_level, pool in self.employee_pools.items():
+            present = pool.num_free + pool.num_busy
+            staffed_sec = (
+                present * elapsed_sec
+                - self._hire_offsets_sec[seniority_level]
+                + self._departed_staff_sec[seniority_level]
+            )
+            staff[seniority_level] = (
+                staffed_sec / elapsed_sec if elapsed_sec > 0 else float(present)
+            )
+        return self.metrics.utilization(elapsed_sec, staff)
+
+    def profile_report(self) -> List[TimingStat]:
+        """Hot-path call counts and cumulative timings, most total time first"""
+        if self.profiler is None:
+            raise RuntimeError("Profiling is disabled")
+        return self.profiler.report()
+
+    def display_status(self):
+        status = self.status()
+        free_staff = status.free_staff
+        total_staff = {
+            seniority_level: free_staff[seniority_level]
+            + status.busy_staff[seniority_level]
+            for seniority_level in free_staff
+        }
+
         print("\nFire Station Call Centre Current Status")
         print("\n#### Employees (available/total):")
-        print(f"\n## Staff Available: {free_staff['total']} / {total_staff}")
+        print(f"\n## Staff Available: {status.free_staff_total} / {status.total_staff}")
         print(
-            f"## Juniors: {free_staff[EmployeeSeniorotyLevel.JUNIOR]} / {self._config.juniors}"
+            f"## Juniors: {free_staff[EmployeeSeniorotyLevel.JUNIOR]} / {total_staff[EmployeeSeniorotyLevel.JUNIOR]}"
         )
         print(
-            f"## Seniors: {free_staff[EmployeeSeniorotyLevel.SENIOR]} / {self._config.seniors}"
+            f"## Seniors: {free_staff[EmployeeSeniorotyLevel.SENIOR]} / {total_staff[EmployeeSeniorotyLevel.SENIOR]}"
         )
         print(
-            f"## Managers: {free_staff[EmployeeSeniorotyLevel.MANAGER]} / {self._config.managers}"
+            f"## Managers: {free_staff[EmployeeSeniorotyLevel.MANAGER]} / {total_staff[EmployeeSeniorotyLevel.MANAGER]}"
         )
         print(
-            f"## Directors: {free_staff[EmployeeSeniorotyLevel.DIRECTOR]} / {self._config.directors}"
+            f"## Directors: {free_staff[EmployeeSeniorotyLevel.DIRECTOR]} / {total_staff[EmployeeSeniorotyLevel.DIRECTOR]}"
         )
         print("\n#### Call Queues:")
-        print(f"\n## Active Calls: {len(self.active_calls)}")
-        print(f"## Calls in Backlog: {len(self.call_backlog)}")
+        print(f"\n## Active Calls: {status.active_calls}")
+        print(f"## Calls in Backlog: {status.backlog_total}")
 
     def _create_employees_batch(
-        self, num_employees: int, seniority: EmployeeSeniorotyLevel, is_free: bool
+        self,
+        num_employees: int,
+        seniority: EmployeeSeniorotyLevel,
+        is_free: bool,
+        hired_at_sec: Optional[float] = None,
     ) -> List[Employee]:
 
         out_list = []
@@ -130,47 +497,65 @@ class CallCentre:
                     uid=self._employee_count,
                     seniority=seniority,
                     is_free=is_free,
+                    hired_at_sec=(
+                        self._started_at_sec if hired_at_sec is None else hired_at_sec
+                    ),
                 )
             )
             self._employee_count += 1
 
         return out_list
 
-    def _register_call(self, caller_name: str, priority: CallPriority) -> Call:
-        caller = Caller(name=caller_name, uid=self._caller_count)
-        self._caller_count += 1
+    def _register_call(
+        self,
+        caller_name: str,
+        priority: CallPriority,
+        timestamp: Optional[float] = None,
+        duration_sec: Optional[int] = None,
+        patience_sec: Optional[float] = None,
+    ) -> Call:
+        caller = self.callers.register(caller_name)
+        if patience_sec is None and self.patience is not None:
+            patience_sec = self.patience.draw(self.rng.patience)
+        # drawn for every call, whatever its priority and end order, so that
+        # the same calls escalate under any staffing
+        escalates = self.rng.escalation.random() < self._config.call_escalation_prob
+        self._call_count += 1
 
         return Call(
-            timestamp=datetime.datetime.now(),
+            uid=self._call_count - 1,
+            timestamp=self.clock() if timestamp is None else timestamp,
             caller=caller,
             priority=priority,
-            duration_sec=random.randint(1, self._config.max_call_duration_sec),
+            duration_sec=(
+                self.rng.durations.randint(1, self._config.max_call_duration_sec)
+                if duration_sec is None
+                else duration_sec
+            ),
             call_escalation_prob=self._config.call_escalation_prob,
             assigned_to=None,
+            patience_sec=patience_sec,
+            escalates=escalates,
+        )
+
+    def _draw_durations(self, num_calls: int) -> List[int]:
+        """
+        Uniform durations in [1, max_call_duration_sec] in one vectorized
+        step, consuming the stream exactly like num_calls single draws
+        """
+        return self.rng.durations.randints(
+            1, self._config.max_call_duration_sec, num_calls
         )
 
     @property
     def free_staff(self) -> int:
-        free_staff = 0
-        for seniority_level in self.employees.keys():
-            for employee in self.employees[seniority_level]:
-                if employee.is_free:
-                    free_staff += 1
-
-        return free_staff
+        return sum(pool.num_free for pool in self.employee_pools.values())
 
     @property
     def free_staff_detailed(self):
-        free_staff = {}
-        free_staff_total = 0
-        for seniority_level in self.employees.keys():
-            free_staff[seniority_level] = 0
-
-        for seniority_level in self.employees.keys():
-            for employee in self.employees[seniority_level]:
-                if employee.is_free:
-                    free_staff[seniority_level] += 1
-                    free_staff_total += 1
-
-        free_staff["total"] = free_staff_total  # type: ignore
+        free_staff = {
+            seniority_level: pool.num_free
+            for seniority_level, pool in self.employee_pools.items()
+        }
+        free_staff["total"] = sum(free_staff.values())  # type: ignore
         return free_staff
@@ -0,0 +1,39 @@
+from typing import Dict, Iterator, Optional
+
+from src.call import Caller
+
+
+class CallerRegistry:
+    """
+    Registered callers, interned by name: a repeat caller keeps their uid.
+    Lookups by name and by uid are O(1).
+    """
+
+    def __init__(self) -> None:
+        self._by_name: Dict[str, Caller] = {}
+        self._by_uid: Dict[int, Caller] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_uid)
+
+    def __iter__(self) -> Iterator[Caller]:
+        return iter(self._by_uid.values())
+
+    def register(self, name: str) -> Caller:
+        """Caller with this name, created with the next uid on their first call"""
+        caller = self._by_name.get(name)
+        if caller is None:
+            caller = Caller(uid=len(self._by_uid), name=name)
+            self._by_name[name] = caller
+            self._by_uid[caller.uid] = caller
+
+        return caller
+
+    def get(self, uid: int) -> Caller:
+        caller = self._by_uid.get(uid)
+        if caller is None:
+            raise KeyError(f"Unknown caller uid: {uid}")
+        return caller
+
+    def find(self, name: str) -> Optional[Caller]:
+        return self._by_name.get(name)
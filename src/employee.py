@@ -1,6 +1,11 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    # src.metrics imports this module, import only for type checking
+    from src.metrics import LogHistogram
+
 
 class EmployeeSeniorotyLevel(Enum):
     JUNIOR = "Junior"
@@ -14,6 +19,161 @@ class Employee:
     seniority: EmployeeSeniorotyLevel
     uid: int
     is_free: bool
+    # calls taken so far, escalated legs count again
+    calls_handled: int = 0
+    # clock reading when hired, the call centre start for the initial staff
+    hired_at_sec: float = 0.0
+    # set on retirement, a busy employee leaves after their current call
+    retiring: bool = False
 
     def __str__(self) -> str:
         return f"uid: {self.uid} | seniority: {self.seniority.value} | is_free: {self.is_free}"
+
+
+class EmployeePool:
+    """
+    Free/busy bookkeeping for the employees of a single seniority level.
+
+    Free employees are kept on a stack: at start-up the first employee in list
+    order is on top, after that the most recently released employee is handed
+    out first. Both acquire and release are O(1).
+
+    Retirement is lazy: a retired free employee stays in the free container
+    and is skipped by acquire, a retiring busy employee is not put back on
+    release. The container is compacted once mostly retired employees.
+    """
+
+    # compact the free container above this many retired employees,
+    # when they outnumber the free ones
+    COMPACT_MIN_RETIRED = 64
+
+    def __init__(self, employees: List[Employee]):
+        self._free: List[Employee] = [
+            employee for employee in reversed(employees) if employee.is_free
+        ]
+        self._busy: Dict[int, Employee] = {
+            employee.uid: employee for employee in employees if not employee.is_free
+        }
+        # retired employees still in the free container
+        self._retired_free = 0
+        # busy employees leaving after their current call
+        self._retiring = 0
+        # handling-time histogram of the level in the call centre metrics,
+        # resolved once here rather than per ended call
+        self.handling_time: Optional["LogHistogram"] = None
+
+    def acquire(self) -> Optional[Employee]:
+        """Take a free employee and mark them busy. None if nobody is free."""
+        free = self._free
+        while free:
+            employee = free.pop()
+            if employee.retiring:
+                self._retired_free -= 1
+                continue
+            employee.is_free = False
+            employee.calls_handled += 1
+            self._busy[employee.uid] = employee
+            return employee
+
+        return None
+
+    def acquire_many(self, num_employees: int) -> List[Employee]:
+        """
+        Up to `num_employees` free employees in the order that many acquire
+        calls would hand them out, sliced off the stack in one step.
+        """
+        free = self._free
+        if self._retired_free:
+            return self._acquire_each(num_employees)
+
+        num_taken = min(num_employees, len(free))
+        if not num_taken:
+            return []
+        employees = free[-num_taken:]
+        del free[-num_taken:]
+        employees.reverse()
+        self._mark_busy(employees)
+        return employees
+
+    def release(self, employee: Employee) -> bool:
+        """False when the employee was retiring and has now left"""
+        if self._busy.pop(employee.uid, None) is None:
+            raise RuntimeError(f"Employee {employee.uid} is not busy in this pool")
+
+        if employee.retiring:
+            self._retiring -= 1
+            return False
+
+        employee.is_free = True
+        self._push_free(employee)
+        return True
+
+    def add(self, employee: Employee):
+        """A newly hired employee, free at once"""
+        employee.is_free = True
+        self._push_free(employee)
+
+    def retire(self, employee: Employee) -> bool:
+        """
+        True when the employee leaves at once (free),
+        False when they leave on release of their current call (busy)
+        """
+        if employee.retiring:
+            raise ValueError(f"Employee {employee.uid} is already retiring")
+
+        employee.retiring = True
+        if employee.uid in self._busy:
+            self._retiring += 1
+            return False
+
+        employee.is_free = False
+        self._retired_free += 1
+        if (
+            self._retired_free > self.COMPACT_MIN_RETIRED
+            and self._retired_free > len(self._free) // 2
+        ):
+            self._compact()
+        return True
+
+    def _push_free(self, employee: Employee):
+        self._free.append(employee)
+
+    def _acquire_each(self, num_employees: int) -> List[Employee]:
+        employees: List[Employee] = []
+        while len(employees) < num_employees:
+            employee = self.acquire()
+            if employee is None:
+                break
+            employees.append(employee)
+        return employees
+
+    def _mark_busy(self, employees: List[Employee]):
+        busy = self._busy
+        for employee in employees:
+            employee.is_free = False
+            employee.calls_handled += 1
+            busy[employee.uid] = employee
+
+    def _compact(self):
+        # in place, keeps the order of the free employees
+        free = [employee for employee in self._free if not employee.retiring]
+        self._free.clear()
+        self._free.extend(free)
+        self._retired_free = 0
+
+    @property
+    def has_free(self) -> bool:
+        return len(self._free) > self._retired_free
+
+    @property
+    def num_free(self) -> int:
+        return len(self._free) - self._retired_free
+
+    @property
+    def num_busy(self) -> int:
+        """Busy employees, retiring ones on their last call included"""
+        return len(self._busy)
+
+    @property
+    def num_retiring(self) -> int:
+        return self._retiring
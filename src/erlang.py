@@ -0,0 +1,194 @@
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+import math
+
+from src.call import CallPriority
+from src.call_centre import CallCentreConfig
+from src.employee import EmployeeSeniorotyLevel
+from src.rng import RandomStreams
+from src.simulation import SimulationEngine, poisson_arrivals
+
+
+@dataclass
+class ErlangEstimate:
+    # Erlangs offered per priority, HIGH includes escalated calls
+    offered_load: Dict[CallPriority, float]
+    # probability that a call (or escalated leg) waits at all
+    wait_probability: Dict[CallPriority, float]
+    mean_wait_sec: Dict[CallPriority, float]
+    utilization: Dict[EmployeeSeniorotyLevel, float]
+    # False when the load of a priority exceeds its staff, its wait grows
+    # without bound (mean_wait_sec inf)
+    stable: bool = True
+
+
+@dataclass
+class ValidationReport:
+    estimate: ErlangEstimate
+    simulated: ErlangEstimate
+    # estimate minus simulation
+    wait_probability_error: Dict[CallPriority, float] = field(default_factory=dict)
+    mean_wait_error_sec: Dict[CallPriority, float] = field(default_factory=dict)
+    utilization_error: Dict[EmployeeSeniorotyLevel, float] = field(default_factory=dict)
+
+    @property
+    def max_utilization_error(self) -> float:
+        return max(abs(error) for error in self.utilization_error.values())
+
+
+def erlang_b(servers: int, load: float) -> float:
+    """Blocking probability of `servers` with `load` Erlangs offered"""
+    blocking = 1.0
+    for n in range(1, servers + 1):
+        blocking = load * blocking / (n + load * blocking)
+    return blocking
+
+
+def erlang_c(servers: int, load: float) -> float:
+    """Probability of waiting in M/M/servers, 1 when overloaded"""
+    if servers <= 0 or load >= servers:
+        return 1.0
+    blocking = erlang_b(servers, load)
+    return blocking / (1 - load / servers * (1 - blocking))
+
+
+def estimate(
+    config: CallCentreConfig, arrival_rate: float, prob_high_priority: float
+) -> ErlangEstimate:
+    """
+    Closed-form estimate for Poisson arrivals of `arrival_rate` calls/sec.
+
+    Escalated LOW calls come back as HIGH calls with the same duration, so
+    HIGH carries prob_high + (1 - prob_high) * escalation_prob of the calls.
+    LOW calls overflow juniors -> seniors -> managers and HIGH calls
+    managers -> directors; the per level split of the load uses Erlang B
+    overflow. Waits use the two-class non-preemptive priority M/M/c formula
+    (Cobham), HIGH on managers and directors with the LOW overflow on the
+    managers as the lower class, LOW on juniors, seniors and the managers
+    HIGH leaves free. Waits are scaled by (1 + cs^2) / 2 for the uniform
+    durations (Allen-Cunneen).
+    """
+    mean_duration = (1 + config.max_call_duration_sec) / 2
+    # squared coefficient of variation of a uniform duration in [1, max]
+    service_scv = (config.max_call_duration_sec - 1) / (
+        3 * (config.max_call_duration_sec + 1)
+    )
+    wait_factor = (1 + service_scv) / 2
+
+    low_load = arrival_rate * (1 - prob_high_priority) * mean_duration
+    high_load = (
+        arrival_rate
+        * (prob_high_priority + (1 - prob_high_priority) * config.call_escalation_prob)
+        * mean_duration
+    )
+    first_line = config.juniors + config.seniors
+    high_servers = config.managers + config.directors
+
+    # per level split of the carried load
+    low_on_juniors = low_load * (1 - erlang_b(config.juniors, low_load))
+    low_on_seniors = low_load * erlang_b(config.juniors, low_load) - low_load * (
+        erlang_b(first_line, low_load)
+    )
+    low_on_managers = low_load * erlang_b(first_line, low_load)
+    high_on_managers = high_load * (1 - erlang_b(config.managers, high_load))
+    high_on_directors = high_load - high_on_managers
+
+    # HIGH: managers + directors, LOW overflow as the lower priority class
+    high_wait_prob = erlang_c(high_servers, high_load + low_on_managers)
+    high_share = high_load / high_servers if high_servers else math.inf
+    # LOW: first line + the managers HIGH leaves free
+    low_servers = first_line + max(0, math.floor(config.managers - high_on_managers))
+    low_wait_prob = erlang_c(low_servers, low_load)
+
+    # HIGH is served first, it only needs its own load below its servers
+    if high_share < 1:
+        high_wait = high_wait_prob * mean_duration / (high_servers * (1 - high_share))
+        high_wait *= wait_factor
+    else:
+        high_wait, high_wait_prob = math.inf, 1.0
+    if low_servers > low_load:
+        low_wait = low_wait_prob * mean_duration / (low_servers - low_load)
+        low_wait *= wait_factor
+    else:
+        low_wait, low_wait_prob = math.inf, 1.0
+
+    if not math.isfinite(high_wait):
+        # the HIGH backlog grows, managers and directors are never idle
+        high_on_managers, high_on_directors = config.managers, config.directors
+
+    def share(load: float, servers: int) -> float:
+        return min(1.0, load / servers) if servers else 0.0
+
+    return ErlangEstimate(
+        offered_load={CallPriority.HIGH: high_load, CallPriority.LOW: low_load},
+        wait_probability={
+            CallPriority.HIGH: high_wait_prob,
+            CallPriority.LOW: low_wait_prob,
+        },
+        mean_wait_sec={CallPriority.HIGH: high_wait, CallPriority.LOW: low_wait},
+        utilization={
+            EmployeeSeniorotyLevel.JUNIOR: share(low_on_juniors, config.juniors),
+            EmployeeSeniorotyLevel.SENIOR: share(low_on_seniors, config.seniors),
+            EmployeeSeniorotyLevel.MANAGER: share(
+                low_on_managers + high_on_managers, config.managers
+            ),
+            EmployeeSeniorotyLevel.DIRECTOR: share(high_on_directors, config.directors),
+        },
+        stable=math.isfinite(high_wait) and math.isfinite(low_wait),
+    )
+
+
+def validate(
+    config: CallCentreConfig,
+    arrival_rate: float,
+    prob_high_priority: float,
+    num_calls: int = 100_000,
+    seed: Optional[int] = 0,
+) -> ValidationReport:
+    """
+    Compare the estimate with a discrete-event run of `num_calls` Poisson
+    arrivals. Large errors mean the approximation should not be trusted for
+    this config, e.g. close to saturation or with very few managers.
+    """
+    streams = RandomStreams(seed)
+    engine = SimulationEngine.from_config(config, rng=streams)
+    engine.run(poisson_arrivals(num_calls, arrival_rate, prob_high_priority, streams))
+    call_centre = engine.call_centre
+    metrics = call_centre.metrics
+    assert metrics is not None
+
+    wait_probability = {}
+    mean_wait_sec = {}
+    for priority, histogram in metrics.queue_wait.items():
+        waited = histogram.count - histogram.counts[0]
+        wait_probability[priority] = (
+            waited / histogram.count if histogram.count else 0.0
+        )
+        mean_wait_sec[priority] = histogram.mean or 0.0
+
+    predicted = estimate(config, arrival_rate, prob_high_priority)
+    simulated = ErlangEstimate(
+        offered_load=predicted.offered_load,
+        wait_probability=wait_probability,
+        mean_wait_sec=mean_wait_sec,
+        # over the whole run, the drain after the last arrival included
+        utilization=call_centre.utilization(),
+        stable=predicted.stable,
+    )
+
+    return ValidationReport(
+        estimate=predicted,
+        simulated=simulated,
+        wait_probability_error={
+            priority: predicted.wait_probability[priority] - value
+            for priority, value in wait_probability.items()
+        },
+        mean_wait_error_sec={
+            priority: predicted.mean_wait_sec[priority] - value
+            for priority, value in mean_wait_sec.items()
+        },
+        utilization_error={
+            level: predicted.utilization[level] - value
+            for level, value in simulated.utilization.items()
+        },
+    )
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Optional
+from enum import IntEnum
+import os
+import struct
+
+import numpy as np
+
+from src.employee import Employee, EmployeeSeniorotyLevel
+
+if TYPE_CHECKING:
+    # src.call records events, import only for type checking
+    from src.call import Call
+
+
+class CallEvent(IntEnum):
+    ARRIVED = 1
+    ASSIGNED = 2
+    BACKLOGGED = 3
+    ESCALATED = 4
+    ENDED = 5
+    ABANDONED = 6
+
+
+# priority codes are CallPriority values
+SENIORITY_CODES = {
+    level: code for code, level in enumerate(EmployeeSeniorotyLevel, start=1)
+}
+# employee_uid / seniority of events without an employee
+NO_EMPLOYEE = -1
+NO_SENIORITY = 0
+
+# Fixed-width little-endian records, 32 bytes each
+EVENT_DTYPE = np.dtype(
+    [
+        ("time_sec", "<f8"),
+        ("call_uid", "<i8"),
+        ("caller_uid", "<i8"),
+        ("employee_uid", "<i4"),
+        ("event", "u1"),
+        ("priority", "u1"),
+        ("seniority", "u1"),
+        ("_pad", "u1"),
+    ]
+)
+_RECORD = struct.Struct("<dqqiBBBx")
+
+
+class EventLog:
+    """
+    Append-only binary log of call events, records of EVENT_DTYPE.
+    Records are packed into a buffer and written in blocks of `buffer_size`
+    records. The file can be opened without parsing with read_event_log.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 65536):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = open(path, "ab")
+        self._buffer = bytearray()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(
+        self,
+        event: CallEvent,
+        call: "Call",
+        time_sec: float,
+        employee: Optional[Employee] = None,
+    ):
+        self._buffer += _RECORD.pack(
+            time_sec,
+            call.uid,
+            call.caller.uid,
+            NO_EMPLOYEE if employee is None else employee.uid,
+            event,
+            call.priority.value,
+            NO_SENIORITY if employee is None else SENIORITY_CODES[employee.seniority],
+        )
+        if len(self._buffer) >= self.buffer_size * _RECORD.size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def read_event_log(path: str) -> np.ndarray:
+    """Memory-map an event log, an empty array for an empty file"""
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=EVENT_DTYPE)
+    return np.memmap(path, dtype=EVENT_DTYPE, mode="r")
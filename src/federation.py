@@ -0,0 +1,262 @@
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence
+from dataclasses import dataclass, field
+import multiprocessing
+
+from src.call import Call, CallPriority
+from src.call_centre import CallCentreConfig
+from src.employee import EmployeeSeniorotyLevel
+from src.metrics import CallCentreMetrics
+from src.rng import RandomStreams
+from src.simulation import Arrival, SimulationEngine, random_arrivals
+
+# levels answering HIGH priority calls
+HIGH_PRIORITY_LEVELS = [EmployeeSeniorotyLevel.MANAGER, EmployeeSeniorotyLevel.DIRECTOR]
+
+
+@dataclass
+class ShardSpec:
+    """One station: its staff and its own synthetic arrivals"""
+
+    config: CallCentreConfig
+    num_calls: int
+    max_call_interval_sec: int
+    prob_high_priority: float
+    seed: int = 0
+
+
+class Transfer(NamedTuple):
+    """A HIGH priority call moved to the neighbouring shard"""
+
+    caller_name: str
+    duration_sec: int
+    # start of its wait, the wait carries over to the neighbour
+    queued_at_sec: float
+    patience_sec: Optional[float] = None
+
+
+class StepReport(NamedTuple):
+    transfers: List[Transfer]
+    # free MANAGERs and DIRECTORs at the end of the epoch
+    free_high_capacity: int
+    done: bool
+
+
+@dataclass
+class ShardResult:
+    index: int
+    calls_arrived: int = 0
+    calls_ended: int = 0
+    transferred_out: int = 0
+    transferred_in: int = 0
+    final_backlog: int = 0
+    simulated_sec: float = 0.0
+    metrics: Optional[CallCentreMetrics] = None
+
+
+@dataclass
+class FederationResult:
+    shards: List[ShardResult]
+    epochs: int
+    metrics: CallCentreMetrics = field(default_factory=CallCentreMetrics)
+
+    @property
+    def calls_arrived(self) -> int:
+        return sum(shard.calls_arrived for shard in self.shards)
+
+    @property
+    def calls_ended(self) -> int:
+        return sum(shard.calls_ended for shard in self.shards)
+
+    @property
+    def transfers(self) -> int:
+        return sum(shard.transferred_out for shard in self.shards)
+
+
+class Shard:
+    """
+    One CallCentre under a virtual clock, advanced an epoch at a time.
+    Each shard draws from its own seeded RandomStreams, so shards run in one
+    process give the same results as shards in separate processes.
+    """
+
+    def __init__(self, index: int, spec: ShardSpec):
+        self.index = index
+        streams = RandomStreams(spec.seed)
+        self.engine = SimulationEngine.from_config(spec.config, rng=streams)
+        self.call_centre = self.engine.call_centre
+        self.result = ShardResult(index=index)
+        self._arrivals = self._track_exhaustion(
+            random_arrivals(
+                num_calls=spec.num_calls,
+                max_call_interval_sec=spec.max_call_interval_sec,
+                prob_high_priority=spec.prob_high_priority,
+                caller_name=f"Caller@{index}",
+                streams=streams,
+            )
+        )
+        self._arrivals_exhausted = False
+        # uids of calls received from the neighbour, never transferred again
+        self._received: set = set()
+
+    def step(
+        self, until: float, transfers_in: List[Transfer], transfer_budget: int
+    ) -> StepReport:
+        """
+        Dispatch the calls transferred in, run to `until` and hand out up to
+        `transfer_budget` of the HIGH priority calls left on hold, newest first.
+        """
+        for transfer in transfers_in:
+            call = self.call_centre.dispatch_call(
+                caller_name=transfer.caller_name,
+                priority=CallPriority.HIGH,
+                duration_sec=transfer.duration_sec,
+                timestamp=transfer.queued_at_sec,
+                patience_sec=transfer.patience_sec,
+            )
+            self._received.add(call.uid)
+        self.result.transferred_in += len(transfers_in)
+
+        self.engine.run(self._arrivals, until=until)
+        transfers_out = self._take_transfers(transfer_budget)
+
+        done = self._arrivals_exhausted and not len(self.call_centre.active_calls)
+        return StepReport(transfers_out, self.free_high_capacity, done)
+
+    @property
+    def free_high_capacity(self) -> int:
+        return sum(
+            self.call_centre.employee_pools[level].num_free
+            for level in HIGH_PRIORITY_LEVELS
+        )
+
+    def finish(self) -> ShardResult:
+        stats = self.engine.stats
+        self.result.calls_arrived = stats.calls_arrived
+        self.result.calls_ended = stats.calls_ended
+        self.result.simulated_sec = stats.simulated_sec
+        self.result.final_backlog = len(self.call_centre.call_backlog)
+        self.result.metrics = self.call_centre.metrics
+        return self.result
+
+    def _take_transfers(self, budget: int) -> List[Transfer]:
+        call_backlog = self.call_centre.call_backlog
+        transfers: List[Transfer] = []
+        kept: List[Call] = []
+        while len(transfers) < budget:
+            call = call_backlog.pop(CallPriority.HIGH)
+            if call is None:
+                break
+            if call.uid in self._received:
+                kept.append(call)
+                continue
+            transfers.append(
+                Transfer(
+                    call.caller.name,
+                    call.duration_sec,
+                    call.queued_at_sec,
+                    call.patience_sec,
+                )
+            )
+        # back at the newest end in their original order
+        for call in reversed(kept):
+            call_backlog.append(call)
+
+        self.result.transferred_out += len(transfers)
+        return transfers
+
+    def _track_exhaustion(self, arrivals: Iterator[Arrival]) -> Iterator[Arrival]:
+        yield from arrivals
+        self._arrivals_exhausted = True
+
+
+def _shard_worker(connection: Any, index: int, spec: ShardSpec):
+    shard = Shard(index, spec)
+    while True:
+        message = connection.recv()
+        if message is None:
+            connection.send(shard.finish())
+            break
+        connection.send(shard.step(*message))
+    connection.close()
+
+
+def run_federation(
+    specs: Sequence[ShardSpec],
+    epoch_sec: float = 60.0,
+    processes: bool = True,
+) -> FederationResult:
+    """
+    Run one shard per spec, in its own process unless `processes` is False.
+
+    Shards run independently for `epoch_sec` of simulated time, then
+    exchange one batched message each: HIGH priority calls still on hold,
+    up to the free MANAGER and DIRECTOR capacity the next shard in the ring
+    reported at the end of the previous epoch, move to that shard. Calls are
+    moved at most once. Messages are only exchanged at epoch boundaries, so
+    shards scale with cores; shorter epochs route overflow sooner.
+    """
+    if epoch_sec <= 0:
+        raise ValueError("Epoch length must be positive")
+
+    num_shards = len(specs)
+    shards: List[Any] = []
+    workers = []
+    if processes:
+        for index, spec in enumerate(specs):
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_shard_worker, args=(child, index, spec), daemon=True
+            )
+            worker.start()
+            workers.append(worker)
+            shards.append(parent)
+    else:
+        shards = [Shard(index, spec) for index, spec in enumerate(specs)]
+
+    inboxes: List[List[Transfer]] = [[] for _ in specs]
+    # no overflow before every shard has reported its capacity once
+    free_capacity = [0] * num_shards
+    epochs = 0
+    try:
+        while True:
+            epochs += 1
+            until = epochs * epoch_sec
+            budgets = [free_capacity[(i + 1) % num_shards] for i in range(num_shards)]
+            if num_shards == 1:
+                budgets = [0]
+
+            if processes:
+                for i, connection in enumerate(shards):
+                    connection.send((until, inboxes[i], budgets[i]))
+                reports = [connection.recv() for connection in shards]
+            else:
+                reports = [
+                    shard.step(until, inboxes[i], budgets[i])
+                    for i, shard in enumerate(shards)
+                ]
+
+            inboxes = [[] for _ in specs]
+            for i, report in enumerate(reports):
+                inboxes[(i + 1) % num_shards].extend(report.transfers)
+            free_capacity = [report.free_high_capacity for report in reports]
+
+            if all(report.done for report in reports) and not any(inboxes):
+                break
+
+        if processes:
+            for connection in shards:
+                connection.send(None)
+            results = [connection.recv() for connection in shards]
+        else:
+            results = [shard.finish() for shard in shards]
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    federation = FederationResult(shards=results, epochs=epochs)
+    for shard_result in results:
+        if shard_result.metrics is not None:
+            federation.metrics.merge(shard_result.metrics)
+    return federation
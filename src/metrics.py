@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional
+import math
+
+from src.call import Call, CallPriority, by_priority
+from src.employee import EmployeeSeniorotyLevel
+
+
+class LogHistogram:
+    """
+    Fixed-memory histogram of non-negative values with log-spaced buckets.
+
+    Bucket 0 holds values below `min_value`, then `buckets_per_decade`
+    buckets per power of ten up to `max_value` (larger values go to the last
+    bucket). Percentiles are accurate to the bucket width, about 12% with 20
+    buckets per decade. Count, sum, min and max are exact. Histograms with the
+    same layout can be merged, e.g. across parallel runs.
+    """
+
+    def __init__(
+        self,
+        min_value: float = 1e-3,
+        max_value: float = 1e6,
+        buckets_per_decade: int = 20,
+    ):
+        if not 0 < min_value < max_value or buckets_per_decade < 1:
+            raise ValueError("Invalid histogram layout")
+
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_decade = buckets_per_decade
+        num_buckets = math.ceil(math.log10(max_value / min_value) * buckets_per_decade)
+        self.counts: List[int] = [0] * (num_buckets + 2)
+        self.count = 0
+        self.total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def layout(self):
+        return (self.min_value, self.max_value, self.buckets_per_decade)
+
+    def record(self, value: float):
+        if value < self.min_value:
+            ind = 0
+        else:
+            ind = min(
+                int(math.log10(value / self.min_value) * self.buckets_per_decade) + 1,
+                len(self.counts) - 1,
+            )
+        self.counts[ind] += 1
+        self.count += 1
+        self.total += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        """Add the counts of another histogram with the same layout, in place"""
+        if other.layout != self.layout:
+            raise ValueError("Cannot merge histograms with different layouts")
+
+        for ind, count in enumerate(other.counts):
+            self.counts[ind] += count
+        self.count += other.count
+        self.total += other.total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+        return self
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min if self.count else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max if self.count else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Value at `percentile` (0-100): geometric middle of its bucket,
+        0 for the bucket below min_value, clamped to the exact min and max.
+        """
+        if not self.count:
+            return None
+
+        target = max(1, math.ceil(self.count * percentile / 100.0))
+        seen = 0
+        for ind, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                break
+
+        if ind == 0:
+            value = 0.0
+        else:
+            lower = self.min_value * 10 ** ((ind - 1) / self.buckets_per_decade)
+            value = lower * 10 ** (0.5 / self.buckets_per_decade)
+
+        return min(max(value, self._min), self._max)
+
+
+class CallCentreMetrics:
+    """
+    Queueing metrics updated from Call.assign and Call.end:
+    queue wait per priority (escalated legs count as HIGH from the moment
+    they are escalated), handling time and busy time per seniority level,
+    escalation count, and callers hanging up on hold per priority.
+    """
+
+    def __init__(self) -> None:
+        self.queue_wait = {priority: LogHistogram() for priority in CallPriority}
+        self._queue_wait = by_priority(self.queue_wait)
+        # recorded by Call.end through EmployeePool.handling_time
+        self.handling_time = {level: LogHistogram() for level in EmployeeSeniorotyLevel}
+        self.escalations = 0
+        self.abandoned = {priority: 0 for priority in CallPriority}
+
+    @property
+    def busy_time_sec(self) -> Dict[EmployeeSeniorotyLevel, float]:
+        """Time spent on completed calls per level, the handling time total"""
+        return {level: hist.total for level, hist in self.handling_time.items()}
+
+    def record_assignment(self, call: Call):
+        assert call.assigned_at_sec is not None
+        self._queue_wait[call.priority._value_].record(
+            call.assigned_at_sec - call.queued_at_sec
+        )
+
+    def record_escalation(self):
+        self.escalations += 1
+
+    def record_abandonment(self, call: Call):
+        self.abandoned[call.priority] += 1
+
+    def abandonment_rate(self, priority: CallPriority) -> float:
+        """Share of the calls (escalated legs included) of `priority` that hung up"""
+        abandoned = self.abandoned[priority]
+        settled = abandoned + self.queue_wait[priority].count
+        return abandoned / settled if settled else 0.0
+
+    def merge(self, other: "CallCentreMetrics") -> "CallCentreMetrics":
+        for priority, histogram in other.queue_wait.items():
+            self.queue_wait[priority].merge(histogram)
+        for level, histogram in other.handling_time.items():
+            self.handling_time[level].merge(histogram)
+        self.escalations += other.escalations
+        for priority, abandoned in other.abandoned.items():
+            self.abandoned[priority] += abandoned
+        return self
+
+    def utilization(
+        self, elapsed_sec: float, staff: Dict[EmployeeSeniorotyLevel, float]
+    ) -> Dict[EmployeeSeniorotyLevel, float]:
+        """
+        Share of staffed time spent on completed calls, per level.
+        `staff` is the average headcount over elapsed_sec
+        """
+        busy_time_sec = self.busy_time_sec
+        return {
+            level: (
+                busy_time_sec[level] / (staff[level] * elapsed_sec)
+                if staff.get(level) and elapsed_sec > 0
+                else 0.0
+            )
+            for level in EmployeeSeniorotyLevel
+        }
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        out: Dict[str, Optional[float]] = {"escalations": self.escalations}
+        for priority, histogram in self.queue_wait.items():
+            name = priority.name.lower()
+            out[f"{name}_calls_assigned"] = histogram.count
+            out[f"{name}_calls_abandoned"] = self.abandoned[priority]
+            out[f"{name}_abandonment_rate"] = self.abandonment_rate(priority)
+            out[f"{name}_mean_wait_sec"] = histogram.mean
+            for percentile in (50, 95, 99):
+                out[f"{name}_p{percentile}_wait_sec"] = histogram.percentile(percentile)
+
+        return out
@@ -0,0 +1,268 @@
+from typing import Dict, Optional, Union
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.call import BACKLOG_SERVICE_ORDER, EMPLOYEE_ASSIGNMENT_ORDER, CallPriority
+from src.call_centre import CallCentreConfig
+from src.employee import EmployeeSeniorotyLevel
+
+LEVEL_SIZE_FIELD = {
+    EmployeeSeniorotyLevel.JUNIOR: "juniors",
+    EmployeeSeniorotyLevel.SENIOR: "seniors",
+    EmployeeSeniorotyLevel.MANAGER: "managers",
+    EmployeeSeniorotyLevel.DIRECTOR: "directors",
+}
+
+
+class _ReplicatedQueue:
+    """
+    One FIFO queue of enqueue times per replication, stored as ring buffers
+    in a single (replications, capacity) array. Grows when full.
+    """
+
+    def __init__(self, replications: int, capacity: int = 64):
+        self.times = np.zeros((replications, capacity), dtype=np.int64)
+        self.head = np.zeros(replications, dtype=np.int64)
+        self.size = np.zeros(replications, dtype=np.int64)
+        self._rows = np.arange(replications)
+
+    @property
+    def capacity(self) -> int:
+        return self.times.shape[1]
+
+    def push(self, counts: np.ndarray, time: int):
+        """Enqueue counts[r] calls at `time` in replication r"""
+        max_count = counts.max()
+        if max_count == 0:
+            return
+
+        if (self.size + counts).max() > self.capacity:
+            self._grow(int((self.size + counts).max()))
+
+        offsets = np.arange(max_count)
+        mask = offsets < counts[:, None]
+        positions = (self.head[:, None] + self.size[:, None] + offsets) % self.capacity
+        rows = np.broadcast_to(self._rows[:, None], mask.shape)
+        self.times[rows[mask], positions[mask]] = time
+        self.size += counts
+
+    def pop(self, counts: np.ndarray):
+        """
+        Dequeue counts[r] calls from the front of replication r.
+        Returns (replication index, enqueue time) of every dequeued call.
+        """
+        offsets = np.arange(counts.max())
+        mask = offsets < counts[:, None]
+        positions = (self.head[:, None] + offsets) % self.capacity
+        rows = np.broadcast_to(self._rows[:, None], mask.shape)[mask]
+        times = self.times[rows, positions[mask]]
+
+        self.head = (self.head + counts) % self.capacity
+        self.size -= counts
+        return rows, times
+
+    def _grow(self, min_capacity: int):
+        capacity = self.capacity
+        while capacity < min_capacity:
+            capacity *= 2
+
+        # unroll every ring so it starts at index 0
+        offsets = np.arange(self.capacity)
+        positions = (self.head[:, None] + offsets) % self.capacity
+        times = np.zeros((len(self._rows), capacity), dtype=np.int64)
+        times[:, : self.capacity] = np.take_along_axis(self.times, positions, axis=1)
+
+        self.times = times
+        self.head[:] = 0
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Per replication outcomes. Waits are queue waits in whole seconds, the last
+    histogram bin collects every wait of max_wait_sec or more.
+    Escalated legs are recorded as HIGH priority waits.
+    """
+
+    wait_histogram: Dict[CallPriority, np.ndarray]
+    mean_backlog: np.ndarray
+    max_backlog: np.ndarray
+    final_backlog: np.ndarray
+    utilization: Dict[EmployeeSeniorotyLevel, np.ndarray]
+    escalations: np.ndarray
+    horizon_sec: int
+
+    @property
+    def replications(self) -> int:
+        return len(self.mean_backlog)
+
+    def _histogram(self, priority: Optional[CallPriority]) -> np.ndarray:
+        if priority is not None:
+            return self.wait_histogram[priority]
+        return sum(self.wait_histogram.values())  # type: ignore
+
+    def calls_served(self, priority: Optional[CallPriority] = None) -> np.ndarray:
+        return self._histogram(priority).sum(axis=1)
+
+    def mean_wait(self, priority: Optional[CallPriority] = None) -> np.ndarray:
+        histogram = self._histogram(priority)
+        bins = np.arange(histogram.shape[1])
+        served = histogram.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (histogram * bins).sum(axis=1) / served
+
+    def wait_percentile(
+        self, percentile: float, priority: Optional[CallPriority] = None
+    ) -> np.ndarray:
+        """Per replication wait percentile (0-100), NaN where nothing was served"""
+        return _histogram_percentile(self._histogram(priority), percentile)
+
+    def pooled_wait_percentile(
+        self, percentile: float, priority: Optional[CallPriority] = None
+    ) -> float:
+        """Wait percentile over the calls of all replications together"""
+        pooled = self._histogram(priority).sum(axis=0, keepdims=True)
+        return float(_histogram_percentile(pooled, percentile)[0])
+
+    def summary(self) -> Dict[str, float]:
+        """Scalar outcomes averaged over replications"""
+        out = {
+            "calls_served": float(self.calls_served().mean()),
+            "mean_wait_sec": float(np.nanmean(self.mean_wait())),
+            "p95_wait_high_sec": self.pooled_wait_percentile(95, CallPriority.HIGH),
+            "p95_wait_low_sec": self.pooled_wait_percentile(95, CallPriority.LOW),
+            "mean_backlog": float(self.mean_backlog.mean()),
+            "max_backlog": float(self.max_backlog.max()),
+            "escalations": float(self.escalations.mean()),
+        }
+        for level, utilization in self.utilization.items():
+            out[f"utilization_{level.value.lower()}"] = float(utilization.mean())
+
+        return out
+
+
+def _histogram_percentile(histogram: np.ndarray, percentile: float) -> np.ndarray:
+    cumulative = histogram.cumsum(axis=1)
+    served = cumulative[:, -1]
+    target = np.ceil(served * percentile / 100.0)
+    out = (cumulative < np.maximum(target, 1)[:, None]).sum(axis=1).astype(float)
+    out[served == 0] = np.nan
+    return out
+
+
+def run_replications(
+    config: CallCentreConfig,
+    replications: int,
+    horizon_sec: int,
+    arrival_rate: float,
+    prob_high_priority: float,
+    seed: Union[None, int, np.random.SeedSequence] = None,
+    max_wait_sec: int = 3600,
+) -> MonteCarloResult:
+    """
+    Run independent replications of a call centre side by side with NumPy.
+
+    Time advances in 1 second ticks as in the real-time loop. Every tick:
+    calls whose duration is over end (LOW legs escalate to HIGH with
+    call_escalation_prob), new calls arrive as Poisson(arrival_rate) split by
+    prob_high_priority, then queued calls are assigned following
+    BACKLOG_SERVICE_ORDER and EMPLOYEE_ASSIGNMENT_ORDER.
+    Durations are uniform integers in [1, max_call_duration_sec].
+    """
+    if replications < 1 or horizon_sec < 1:
+        raise ValueError("Replications and horizon must be positive")
+    if arrival_rate < 0 or not 0.0 <= prob_high_priority <= 1.0:
+        raise ValueError("Invalid arrival rate or priority mix")
+
+    rng = np.random.default_rng(seed)
+    num_bins = max_wait_sec + 1
+
+    staff = {level: getattr(config, field) for level, field in LEVEL_SIZE_FIELD.items()}
+    # busy_until <= t means free at tick t
+    busy_until = {
+        level: np.zeros((replications, size), dtype=np.int64)
+        for level, size in staff.items()
+    }
+    # whether the call held by a slot escalates when it ends
+    escalates = {
+        level: np.zeros((replications, size), dtype=bool)
+        for level, size in staff.items()
+    }
+    busy_time = {level: np.zeros(replications, dtype=np.int64) for level in staff}
+
+    queues = {priority: _ReplicatedQueue(replications) for priority in CallPriority}
+    wait_histogram = {
+        priority: np.zeros((replications, num_bins), dtype=np.int64)
+        for priority in CallPriority
+    }
+    backlog_sum = np.zeros(replications, dtype=np.int64)
+    max_backlog = np.zeros(replications, dtype=np.int64)
+    escalations = np.zeros(replications, dtype=np.int64)
+
+    high_rate = arrival_rate * prob_high_priority
+    low_rate = arrival_rate - high_rate
+
+    for t in range(horizon_sec):
+        # 1. End calls, escalated legs go back on hold as HIGH priority
+        escalated = np.zeros(replications, dtype=np.int64)
+        for level in staff:
+            if staff[level]:
+                ended = busy_until[level] == t
+                escalated += (ended & escalates[level]).sum(axis=1)
+                escalates[level][ended] = False
+        escalations += escalated
+        queues[CallPriority.HIGH].push(escalated, t)
+
+        # 2. New arrivals
+        queues[CallPriority.HIGH].push(rng.poisson(high_rate, replications), t)
+        queues[CallPriority.LOW].push(rng.poisson(low_rate, replications), t)
+
+        # 3. Assign queued calls to free employees
+        for priority in BACKLOG_SERVICE_ORDER:
+            queue = queues[priority]
+            for level in EMPLOYEE_ASSIGNMENT_ORDER[priority]:
+                if not staff[level] or not queue.size.any():
+                    continue
+
+                free = busy_until[level] <= t
+                counts = np.minimum(free.sum(axis=1), queue.size)
+                if not counts.any():
+                    continue
+
+                chosen = free & (free.cumsum(axis=1) <= counts[:, None])
+                durations = rng.integers(
+                    1, config.max_call_duration_sec + 1, size=chosen.shape
+                )
+                busy_until[level] = np.where(chosen, t + durations, busy_until[level])
+                busy_time[level] += np.where(
+                    chosen, np.minimum(durations, horizon_sec - t), 0
+                ).sum(axis=1)
+                if priority == CallPriority.LOW:
+                    escalates[level] |= chosen & (
+                        rng.random(chosen.shape) < config.call_escalation_prob
+                    )
+
+                waited_in, enqueued_at = queue.pop(counts)
+                waits = np.minimum(t - enqueued_at, max_wait_sec)
+                np.add.at(wait_histogram[priority], (waited_in, waits), 1)
+
+        backlog = queues[CallPriority.HIGH].size + queues[CallPriority.LOW].size
+        backlog_sum += backlog
+        np.maximum(max_backlog, backlog, out=max_backlog)
+
+    utilization = {}
+    for level, size in staff.items():
+        utilization[level] = (
+            busy_time[level] / (size * horizon_sec) if size else np.zeros(replications)
+        )
+
+    return MonteCarloResult(
+        wait_histogram=wait_histogram,
+        mean_backlog=backlog_sum / horizon_sec,
+        max_backlog=max_backlog,
+        final_backlog=backlog,
+        utilization=utilization,
+        escalations=escalations,
+        horizon_sec=horizon_sec,
+    )
@@ -0,0 +1,47 @@
+from typing import List, Optional, Sequence
+import random
+
+DEFAULT_POOL_SIZE = 1000
+
+
+class NamePool:
+    """
+    Caller names generated once (or loaded from a file) and drawn cheaply.
+    Faker is only imported when a pool is generated with it.
+    """
+
+    def __init__(self, names: Sequence[str], rand: Optional[random.Random] = None):
+        if not names:
+            raise ValueError("Name pool cannot be empty")
+
+        self._names = list(names)
+        self._rand = rand or random.Random()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def from_faker(
+        cls, size: int = DEFAULT_POOL_SIZE, seed: Optional[int] = None
+    ) -> "NamePool":
+        from faker import Faker
+
+        faker = Faker()
+        if seed is not None:
+            faker.seed_instance(seed)
+
+        return cls([faker.name() for _ in range(size)], rand=random.Random(seed))
+
+    @classmethod
+    def from_file(cls, path: str, seed: Optional[int] = None) -> "NamePool":
+        """One name per line, blank lines are skipped"""
+        with open(path) as names_file:
+            names = [line.strip() for line in names_file if line.strip()]
+
+        return cls(names, rand=random.Random(seed))
+
+    def draw(self) -> str:
+        return self._names[int(self._rand.random() * len(self._names))]
+
+    def draw_many(self, num_names: int) -> List[str]:
+        return self._rand.choices(self._names, k=num_names)
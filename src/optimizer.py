@@ -0,0 +1,225 @@
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import heapq
+import math
+
+from src.call import CallPriority
+from src.call_centre import CallCentreConfig
+from src.employee import EmployeeSeniorotyLevel
+from src.monte_carlo import LEVEL_SIZE_FIELD, run_replications
+
+# (juniors, seniors, managers, directors)
+Staffing = Tuple[int, int, int, int]
+LEVELS = list(LEVEL_SIZE_FIELD)
+
+
+@dataclass(frozen=True)
+class WaitSla:
+    """`percentile` of the queue wait of `priority` calls (None: all calls)"""
+
+    max_wait_sec: float
+    percentile: float = 95.0
+    priority: Optional[CallPriority] = CallPriority.HIGH
+
+
+@dataclass(frozen=True)
+class SimulationBudget:
+    replications: int
+    horizon_sec: int
+
+
+@dataclass
+class Evaluation:
+    staffing: Staffing
+    cost: float
+    # None when rejected without simulating
+    screening_wait_sec: Optional[float] = None
+    full_wait_sec: Optional[float] = None
+    meets_sla: bool = False
+
+
+@dataclass
+class OptimizationResult:
+    best: Optional[Evaluation]
+    evaluations: List[Evaluation] = field(default_factory=list)
+    screening_runs: int = 0
+    full_runs: int = 0
+
+    @property
+    def config_staffing(self) -> Optional[Dict[EmployeeSeniorotyLevel, int]]:
+        if self.best is None:
+            return None
+        return dict(zip(LEVELS, self.best.staffing))
+
+
+class StaffingOptimizer:
+    """
+    Cheapest staffing mix meeting a wait-time SLA.
+
+    Candidates are visited best-first in order of cost, so the first one that
+    passes is the cheapest. Simulation budget is saved by:
+    - a capacity check, configs whose offered load exceeds their servers are
+      rejected without simulating,
+    - monotonicity, a config with no more staff than a failing one at every
+      level cannot pass and is skipped,
+    - memoization of every evaluated staffing,
+    - short screening runs, only configs within `screening_margin` of the SLA
+      get the full run.
+    Simulations use one fixed seed, so candidates see common random numbers.
+    """
+
+    def __init__(
+        self,
+        arrival_rate: float,
+        prob_high_priority: float,
+        costs: Dict[EmployeeSeniorotyLevel, float],
+        sla: WaitSla,
+        max_call_duration_sec: int,
+        call_escalation_prob: float,
+        max_staff: int = 50,
+        screening: SimulationBudget = SimulationBudget(20, 1800),
+        full: SimulationBudget = SimulationBudget(200, 3600),
+        screening_margin: float = 1.5,
+        max_candidates: int = 100_000,
+        seed: int = 0,
+    ):
+        if any(costs.get(level, 0) <= 0 for level in LEVELS):
+            raise ValueError("Every seniority level needs a positive cost")
+
+        self.arrival_rate = arrival_rate
+        self.prob_high_priority = prob_high_priority
+        self.costs = costs
+        self.sla = sla
+        self.max_call_duration_sec = max_call_duration_sec
+        self.call_escalation_prob = call_escalation_prob
+        self.max_staff = max_staff
+        self.screening = screening
+        self.full = full
+        self.screening_margin = screening_margin
+        self.max_candidates = max_candidates
+        self.seed = seed
+
+        self._evaluations: Dict[Staffing, Evaluation] = {}
+        # maximal failing staffings, anything dominated by them fails too
+        self._failing: List[Staffing] = []
+        self._screening_runs = 0
+        self._full_runs = 0
+
+    def cost(self, staffing: Staffing) -> float:
+        return sum(self.costs[level] * size for level, size in zip(LEVELS, staffing))
+
+    def config(self, staffing: Staffing) -> CallCentreConfig:
+        return CallCentreConfig(
+            juniors=staffing[0],
+            seniors=staffing[1],
+            managers=staffing[2],
+            directors=staffing[3],
+            max_call_duration_sec=self.max_call_duration_sec,
+            call_escalation_prob=self.call_escalation_prob,
+        )
+
+    def has_capacity(self, staffing: Staffing) -> bool:
+        """Offered load (Erlangs) below the servers, per priority and in total"""
+        juniors, seniors, managers, directors = staffing
+        mean_duration = (1 + self.max_call_duration_sec) / 2
+        low_load = self.arrival_rate * (1 - self.prob_high_priority) * mean_duration
+        high_load = (
+            self.arrival_rate
+            * (
+                self.prob_high_priority
+                + (1 - self.prob_high_priority) * self.call_escalation_prob
+            )
+            * mean_duration
+        )
+        return (
+            low_load < juniors + seniors + managers
+            and high_load < managers + directors
+            and low_load + high_load < sum(staffing)
+        )
+
+    def evaluate(self, staffing: Staffing) -> Evaluation:
+        """Memoized screening then full evaluation of one staffing"""
+        if staffing in self._evaluations:
+            return self._evaluations[staffing]
+
+        evaluation = Evaluation(staffing=staffing, cost=self.cost(staffing))
+        self._evaluations[staffing] = evaluation
+
+        if self._is_dominated(staffing) or not self.has_capacity(staffing):
+            self._record_failure(staffing)
+            return evaluation
+
+        evaluation.screening_wait_sec = self._simulate(staffing, self.screening)
+        self._screening_runs += 1
+        if not evaluation.screening_wait_sec <= (
+            self.sla.max_wait_sec * self.screening_margin
+        ):
+            self._record_failure(staffing)
+            return evaluation
+
+        evaluation.full_wait_sec = self._simulate(staffing, self.full)
+        self._full_runs += 1
+        evaluation.meets_sla = evaluation.full_wait_sec <= self.sla.max_wait_sec
+        if not evaluation.meets_sla:
+            self._record_failure(staffing)
+
+        return evaluation
+
+    def optimize(self) -> OptimizationResult:
+        start: Staffing = (0, 0, 0, 0)
+        candidates: List[Tuple[float, Staffing]] = [(0.0, start)]
+        visited = {start}
+        best = None
+
+        while candidates and len(visited) <= self.max_candidates:
+            _, staffing = heapq.heappop(candidates)
+            evaluation = self.evaluate(staffing)
+            if evaluation.meets_sla:
+                best = evaluation
+                break
+
+            for ind in range(len(LEVELS)):
+                if staffing[ind] >= self.max_staff:
+                    continue
+                grown = list(staffing)
+                grown[ind] += 1
+                neighbour: Staffing = (grown[0], grown[1], grown[2], grown[3])
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    heapq.heappush(candidates, (self.cost(neighbour), neighbour))
+
+        return OptimizationResult(
+            best=best,
+            evaluations=list(self._evaluations.values()),
+            screening_runs=self._screening_runs,
+            full_runs=self._full_runs,
+        )
+
+    def _simulate(self, staffing: Staffing, budget: SimulationBudget) -> float:
+        result = run_replications(
+            self.config(staffing),
+            replications=budget.replications,
+            horizon_sec=budget.horizon_sec,
+            arrival_rate=self.arrival_rate,
+            prob_high_priority=self.prob_high_priority,
+            seed=self.seed,
+        )
+        wait_sec = result.pooled_wait_percentile(self.sla.percentile, self.sla.priority)
+        # nothing served at that priority
+        return math.inf if math.isnan(wait_sec) else wait_sec
+
+    def _is_dominated(self, staffing: Staffing) -> bool:
+        return any(
+            all(size <= limit for size, limit in zip(staffing, failing))
+            for failing in self._failing
+        )
+
+    def _record_failure(self, staffing: Staffing):
+        if self._is_dominated(staffing):
+            return
+        self._failing = [
+            failing
+            for failing in self._failing
+            if not all(size <= limit for size, limit in zip(failing, staffing))
+        ]
+        self._failing.append(staffing)
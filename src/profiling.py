@@ -0,0 +1,89 @@
+from typing import Callable, Dict, List
+from dataclasses import dataclass
+import functools
+import os
+import time
+
+PROFILE_ENV_VAR = "CALL_CENTRE_PROFILE"
+
+# CallCentre methods timed per instance
+CALL_CENTRE_HOT_PATH = [
+    "dispatch_call",
+    "dispatch_calls",
+    "review_active_calls",
+    "review_backlog",
+    "display_status",
+]
+# Call methods, timed through the CallCentre attributes the call centre
+# invokes them with: report name -> attribute
+CALL_HOT_PATH = {"assign": "_assign_call", "end": "_end_call"}
+
+
+def profiling_enabled() -> bool:
+    """Whether PROFILE_ENV_VAR is set to a true value"""
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class TimingStat:
+    name: str
+    calls: int
+    total_ns: int
+
+    @property
+    def total_sec(self) -> float:
+        return self.total_ns / 1e9
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_ns / self.calls / 1e3 if self.calls else 0.0
+
+
+class HotPathProfiler:
+    """
+    Call counts and cumulative perf_counter_ns timings of the hot-path
+    functions. Timings are inclusive: Call.assign run from dispatch_call
+    counts towards both.
+
+    Nothing is wrapped until a profiler is attached, and only on the
+    attached CallCentre instance: others run the plain methods.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = {}
+        self.total_ns: Dict[str, int] = {}
+
+    def attach(self, call_centre):
+        """Wrap the hot-path methods of `call_centre` and of its calls"""
+        for name in CALL_CENTRE_HOT_PATH:
+            setattr(call_centre, name, self.timed(name, getattr(call_centre, name)))
+        for name, attribute in CALL_HOT_PATH.items():
+            setattr(
+                call_centre,
+                attribute,
+                self.timed(name, getattr(call_centre, attribute)),
+            )
+        call_centre.profiler = self
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        self.calls.setdefault(name, 0)
+        self.total_ns.setdefault(name, 0)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.total_ns[name] += time.perf_counter_ns() - start
+                self.calls[name] += 1
+
+        return wrapper
+
+    def report(self) -> List[TimingStat]:
+        """Per function stats, most total time first"""
+        stats = [
+            TimingStat(name, self.calls.get(name, 0), total_ns)
+            for name, total_ns in self.total_ns.items()
+        ]
+        return sorted(stats, key=lambda stat: stat.total_ns, reverse=True)
@@ -0,0 +1,161 @@
+from typing import Deque, Iterator, List, Optional, Tuple
+from collections import deque
+import heapq
+import itertools
+
+from src.call import BACKLOG_SERVICE_ORDER, Call, CallPriority, by_priority
+
+
+class ActiveCallQueue:
+    """
+    Active calls kept in a min-heap ordered by their end time
+    (assigned_at_sec + duration_sec).
+
+    The end time is computed when a call is added, a call's duration
+    must not be changed while it is active.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Call]] = []
+        # tie breaker, keeps calls ending at the same time in assignment order
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Call]:
+        return (call for _, _, call in self._heap)
+
+    def append(self, call: Call):
+        if call.assigned_at_sec is None:
+            raise ValueError("Only assigned calls can be active")
+
+        end_time = call.assigned_at_sec + call.duration_sec
+        heapq.heappush(self._heap, (end_time, next(self._counter), call))
+
+    def pop(self) -> Call:
+        """Remove and return the call that ends first."""
+        return heapq.heappop(self._heap)[2]
+
+    def pop_expired(self, now: float) -> List[Call]:
+        """Remove and return all calls that ended at or before `now`. O(k log n)"""
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            expired.append(heapq.heappop(self._heap)[2])
+
+        return expired
+
+    @property
+    def next_end_time(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+
+class CallBacklog:
+    """
+    Calls on hold, one FIFO deque per CallPriority.
+    Iteration follows BACKLOG_SERVICE_ORDER, HIGH priority calls first.
+
+    Calls with a patience get a hang-up deadline when they join, kept in a
+    min-heap. Abandoning is lazy: the call is flagged and left in its deque
+    as a tombstone, skipped when popped, so hanging up is O(log n) rather
+    than O(backlog). Deques are compacted once they are mostly tombstones.
+    """
+
+    # compact a deque above this many tombstones, when they outnumber live calls
+    COMPACT_MIN_TOMBSTONES = 64
+
+    def __init__(self) -> None:
+        # indexed by priority._value_, see by_priority
+        self._queues: List[Deque[Call]] = by_priority(
+            {priority: deque() for priority in BACKLOG_SERVICE_ORDER}
+        )
+        self._live: List[int] = by_priority(
+            {priority: 0 for priority in BACKLOG_SERVICE_ORDER}
+        )
+        # (deadline, tie breaker, call), stale once call.abandon_at_sec differs
+        self._deadlines: List[Tuple[float, int, Call]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(self._live[priority._value_] for priority in BACKLOG_SERVICE_ORDER)
+
+    def __iter__(self) -> Iterator[Call]:
+        for priority in BACKLOG_SERVICE_ORDER:
+            for call in self._queues[priority._value_]:
+                if not call.abandoned:
+                    yield call
+
+    def append(self, call: Call):
+        index = call.priority._value_
+        self._queues[index].append(call)
+        self._live[index] += 1
+        if call.patience_sec is not None:
+            call.abandon_at_sec = call.queued_at_sec + call.patience_sec
+            heapq.heappush(
+                self._deadlines, (call.abandon_at_sec, next(self._counter), call)
+            )
+
+    def popleft(self, priority: CallPriority) -> Optional[Call]:
+        """Oldest call on hold of `priority`, None if there is none"""
+        queue = self._queues[priority._value_]
+        while queue:
+            call = queue.popleft()
+            if not call.abandoned:
+                return self._taken(call)
+        return None
+
+    def pop(self, priority: CallPriority) -> Optional[Call]:
+        """Newest call on hold of `priority`, None if there is none"""
+        queue = self._queues[priority._value_]
+        while queue:
+            call = queue.pop()
+            if not call.abandoned:
+                return self._taken(call)
+        return None
+
+    def count(self, priority: CallPriority) -> int:
+        return self._live[priority._value_]
+
+    def abandon_expired(self, now: float) -> List[Call]:
+        """Flag and return the calls whose deadline is at or before `now`"""
+        abandoned = []
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            deadline, _, call = heapq.heappop(deadlines)
+            if call.abandon_at_sec != deadline:
+                continue
+            call.abandoned = True
+            call.abandon_at_sec = None
+            self._live[call.priority._value_] -= 1
+            abandoned.append(call)
+
+        for priority in {call.priority for call in abandoned}:
+            self._compact(priority)
+        return abandoned
+
+    @property
+    def next_abandon_time(self) -> Optional[float]:
+        """Earliest deadline of a call on hold, drops stale entries on the way"""
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][2].abandon_at_sec != deadlines[0][0]:
+            heapq.heappop(deadlines)
+        return deadlines[0][0] if deadlines else None
+
+    def queue(self, priority: CallPriority) -> Deque[Call]:
+        """Underlying deque, it may hold abandoned calls (call.abandoned)"""
+        return self._queues[priority._value_]
+
+    def _taken(self, call: Call) -> Call:
+        self._live[call.priority._value_] -= 1
+        # its deadline entry goes stale
+        call.abandon_at_sec = None
+        return call
+
+    def _compact(self, priority: CallPriority):
+        queue = self._queues[priority._value_]
+        tombstones = len(queue) - self._live[priority._value_]
+        if tombstones > self.COMPACT_MIN_TOMBSTONES and tombstones > len(queue) // 2:
+            # in place, queue() hands out the deque itself
+            live = [call for call in queue if not call.abandoned]
+            queue.clear()
+            queue.extend(live)
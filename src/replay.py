@@ -0,0 +1,119 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+import csv
+import datetime
+import json
+import os
+import time
+
+from src.call import CallPriority
+from src.call_centre import CallCentre
+from src.simulation import Arrival, SimulationStats
+
+TRACE_FIELDS = ["timestamp", "caller", "priority", "duration_sec"]
+
+
+class ScaledClock:
+    """Wall clock running `speedup` times faster, starting at `start_sec`"""
+
+    def __init__(self, speedup: float, start_sec: Optional[float] = None):
+        if speedup <= 0:
+            raise ValueError("Speed-up factor must be positive")
+
+        self.speedup = speedup
+        self.start_sec = time.time() if start_sec is None else start_sec
+        self._wall_start = time.monotonic()
+
+    def __call__(self) -> float:
+        return self.start_sec + self.time_sec
+
+    @property
+    def time_sec(self) -> float:
+        """Scaled time since start"""
+        return (time.monotonic() - self._wall_start) * self.speedup
+
+
+def read_trace(path: str) -> Iterator[Arrival]:
+    """
+    Stream a recorded call log one record at a time, as Arrivals timed
+    relative to the first record. CSV (with a header) and JSONL files are
+    supported, both with the fields in TRACE_FIELDS:
+    timestamp in POSIX seconds or ISO 8601, priority HIGH or LOW and an
+    optional duration_sec (empty for a random duration).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".csv", ".jsonl"):
+        raise ValueError(f"Unsupported trace format: {path}")
+
+    with open(path, newline="") as trace_file:
+        records: Iterable[Dict[str, Any]]
+        if extension == ".csv":
+            records = csv.DictReader(trace_file)
+        else:
+            records = (json.loads(line) for line in trace_file if line.strip())
+
+        first_sec = None
+        for record in records:
+            timestamp_sec = _parse_timestamp(record["timestamp"])
+            if first_sec is None:
+                first_sec = timestamp_sec
+
+            duration = record.get("duration_sec")
+            yield Arrival(
+                time_sec=timestamp_sec - first_sec,
+                caller_name=str(record["caller"]),
+                priority=CallPriority[str(record["priority"]).upper()],
+                duration_sec=int(duration) if duration not in (None, "") else None,
+            )
+
+
+def replay_realtime(
+    call_centre: CallCentre,
+    arrivals: Iterable[Arrival],
+    sleep: Callable[[float], None] = time.sleep,
+) -> SimulationStats:
+    """
+    Replay at the pace of the call centre's ScaledClock (speed-up 1 is real
+    time). Sleeps until the next arrival or call end instead of ticking.
+    """
+    clock = call_centre.clock
+    if not isinstance(clock, ScaledClock):
+        raise TypeError("Real-time replay requires a CallCentre with a ScaledClock")
+
+    stats = SimulationStats()
+    arrivals_iter = iter(arrivals)
+    next_arrival = next(arrivals_iter, None)
+
+    while next_arrival is not None or len(call_centre.active_calls):
+        next_end_time = call_centre.active_calls.next_end_time
+        wake_sec = min(
+            next_arrival.time_sec if next_arrival else float("inf"),
+            (
+                (next_end_time - clock.start_sec)
+                if next_end_time is not None
+                else float("inf")
+            ),
+        )
+        if wake_sec > clock.time_sec:
+            sleep((wake_sec - clock.time_sec) / clock.speedup)
+
+        stats.calls_ended += call_centre.review_active_calls()
+        call_centre.review_backlog()
+
+        while next_arrival is not None and next_arrival.time_sec <= clock.time_sec:
+            call_centre.dispatch_call(
+                caller_name=next_arrival.caller_name,
+                priority=next_arrival.priority,
+                duration_sec=next_arrival.duration_sec,
+            )
+            stats.calls_arrived += 1
+            next_arrival = next(arrivals_iter, None)
+
+    stats.simulated_sec = clock.time_sec
+    return stats
+
+
+def _parse_timestamp(value: Any) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.datetime.fromisoformat(value).timestamp()
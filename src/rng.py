@@ -0,0 +1,138 @@
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 4096
+STREAMS = (
+    "arrivals",
+    "priority",
+    "durations",
+    "escalation",
+    "routing",
+    "patience",
+)
+
+
+class UniformStream:
+    """
+    Uniform [0, 1) values drawn from a NumPy generator in blocks and handed
+    out one at a time as Python floats. Offers the random() / randint() of
+    random.Random, so it can stand in for one.
+
+    Pickles compactly: the generator state the current block was drawn
+    from and the position in it, the block is drawn again on unpickling.
+    """
+
+    __slots__ = ("_generator", "_block_size", "_values", "_index", "_block_state")
+
+    def __init__(
+        self, generator: np.random.Generator, block_size: int = DEFAULT_BLOCK_SIZE
+    ):
+        if block_size < 1:
+            raise ValueError("Block size must be positive")
+
+        self._generator = generator
+        self._block_size = block_size
+        self._values: List[float] = []
+        self._index = 0
+        # bit generator state before the current block was drawn
+        self._block_state: Optional[Mapping[str, Any]] = None
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return (self._generator, self._block_size, self._index, self._block_state)
+
+    def __setstate__(self, state: Tuple[Any, ...]):
+        self._generator, self._block_size, self._index, self._block_state = state
+        self._values = []
+        if self._block_state is not None:
+            block_generator = np.random.Generator(type(self._generator.bit_generator)())
+            block_generator.bit_generator.state = self._block_state
+            self._values = block_generator.random(self._block_size).tolist()
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """
+        The NumPy generator behind the stream, for vectorized draws. These skip
+        the current block, runs stay reproducible as long as the scalar and
+        vectorized draws are made in the same order.
+        """
+        return self._generator
+
+    def random(self) -> float:
+        index = self._index
+        if index == len(self._values):
+            self._block_state = self._generator.bit_generator.state
+            self._values = self._generator.random(self._block_size).tolist()
+            index = 0
+        self._index = index + 1
+        return self._values[index]
+
+    def randint(self, low: int, high: int) -> int:
+        """Uniform integer in [low, high]"""
+        return low + int(self.random() * (high - low + 1))
+
+    def randints(self, low: int, high: int, num_values: int) -> List[int]:
+        """
+        num_values of randint, consuming the stream exactly like them: the
+        values are sliced off the blocks and scaled in one NumPy step.
+        """
+        chunks = [np.zeros(0)]
+        remaining = num_values
+        while remaining:
+            if self._index == len(self._values):
+                self._block_state = self._generator.bit_generator.state
+                self._values = self._generator.random(self._block_size).tolist()
+                self._index = 0
+            end = min(self._index + remaining, len(self._values))
+            chunks.append(np.array(self._values[self._index : end]))
+            remaining -= end - self._index
+            self._index = end
+
+        values = np.concatenate(chunks)
+        return (low + (values * (high - low + 1)).astype(np.int64)).tolist()
+
+
+class RandomStreams:
+    """
+    Per-simulation randomness: independent substreams for arrival gaps,
+    call priorities, call durations, escalations, random routing and caller
+    patience, spawned from one seed.
+
+    Each kind of draw consumes its own stream, so runs with the same seed
+    see the same arrivals, priorities and durations whatever the staffing
+    (common random numbers): two configurations compared under one seed
+    differ by the configuration rather than by sampling noise. Escalation
+    is drawn once per call when it is registered, so the same calls escalate
+    whatever order they end in.
+    """
+
+    def __init__(
+        self,
+        seed: Union[None, int, np.random.SeedSequence] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        self.seed_sequence = (
+            seed
+            if isinstance(seed, np.random.SeedSequence)
+            else np.random.SeedSequence(seed)
+        )
+        arrivals, priority, durations, escalation, routing, patience = (
+            UniformStream(np.random.default_rng(child), block_size)
+            for child in self.seed_sequence.spawn(len(STREAMS))
+        )
+        self.arrivals = arrivals
+        self.priority = priority
+        self.durations = durations
+        self.escalation = escalation
+        self.routing = routing
+        self.patience = patience
+
+    @classmethod
+    def replication(
+        cls, seed: Optional[int], index: int, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> "RandomStreams":
+        """
+        Streams of replication `index`. Replications are independent of each
+        other, the same (seed, index) gives every configuration the same numbers.
+        """
+        return cls(np.random.SeedSequence(entropy=seed, spawn_key=(index,)), block_size)
@@ -0,0 +1,164 @@
+from typing import Any, Deque, List, Optional, Tuple
+from collections import deque
+from enum import Enum
+import heapq
+
+from src.employee import Employee, EmployeePool
+from src.rng import UniformStream
+
+
+class RoutingPolicy(Enum):
+    """Which free employee of a level gets the next call"""
+
+    # most recently released first, the default EmployeePool
+    LAST_RELEASED = "last_released"
+    # lowest uid first, like scanning the staff in hiring order
+    FIRST_FREE = "first_free"
+    LONGEST_IDLE = "longest_idle"
+    FEWEST_CALLS = "fewest_calls"
+    RANDOM = "random"
+
+
+class LongestIdlePool(EmployeePool):
+    """
+    Free employees in the order they became free, the one idle the longest
+    is handed the next call. Releases happen in clock order, so a FIFO queue
+    is already sorted on idle time: O(1) acquire and release.
+    """
+
+    def __init__(self, employees: List[Employee]):
+        super().__init__(employees)
+        # first employee in list order is the longest idle at start-up
+        self._free: Deque[Employee] = deque(reversed(self._free))  # type: ignore
+
+    def acquire(self) -> Optional[Employee]:
+        free = self._free
+        while free:
+            employee = free.popleft()
+            if employee.retiring:
+                self._retired_free -= 1
+                continue
+            employee.is_free = False
+            employee.calls_handled += 1
+            self._busy[employee.uid] = employee
+            return employee
+
+        return None
+
+    def acquire_many(self, num_employees: int) -> List[Employee]:
+        free = self._free
+        if self._retired_free:
+            return self._acquire_each(num_employees)
+
+        employees = [free.popleft() for _ in range(min(num_employees, len(free)))]
+        self._mark_busy(employees)
+        return employees
+
+
+class HeapPool(EmployeePool):
+    """
+    Free employees in a min-heap on the entry of `_entry`, whose last item
+    is the employee: the smallest entry is handed the next call.
+    O(log n) acquire and release.
+    """
+
+    def __init__(self, employees: List[Employee]):
+        super().__init__(employees)
+        heap = [self._entry(employee) for employee in employees if employee.is_free]
+        heapq.heapify(heap)
+        self._free: List[Tuple[Any, ...]] = heap  # type: ignore
+
+    def _entry(self, employee: Employee) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def acquire(self) -> Optional[Employee]:
+        heap = self._free
+        while heap:
+            employee = heapq.heappop(heap)[-1]
+            if employee.retiring:
+                self._retired_free -= 1
+                continue
+            employee.is_free = False
+            employee.calls_handled += 1
+            self._busy[employee.uid] = employee
+            return employee
+
+        return None
+
+    def acquire_many(self, num_employees: int) -> List[Employee]:
+        # the heap is reordered on every pop
+        return self._acquire_each(num_employees)
+
+    def _push_free(self, employee: Employee):
+        heapq.heappush(self._free, self._entry(employee))
+
+    def _compact(self):
+        self._free[:] = [entry for entry in self._free if not entry[-1].retiring]
+        heapq.heapify(self._free)
+        self._retired_free = 0
+
+
+class FirstFreePool(HeapPool):
+    """
+    The free employee hired first (lowest uid) is handed the next call,
+    the pick of a scan over the staff in list order.
+    """
+
+    def _entry(self, employee: Employee) -> Tuple[Any, ...]:
+        return (employee.uid, employee)
+
+
+class FewestCallsPool(HeapPool):
+    """
+    Free employees on (calls handled, uid), the least loaded employee is
+    handed the next call.
+    """
+
+    def _entry(self, employee: Employee) -> Tuple[Any, ...]:
+        return (employee.calls_handled, employee.uid, employee)
+
+
+class RandomPool(EmployeePool):
+    """
+    A uniformly random free employee is handed the next call: O(1) acquire
+    by swapping the drawn employee with the last free one.
+    """
+
+    def __init__(self, employees: List[Employee], stream: UniformStream):
+        super().__init__(employees)
+        self.stream = stream
+
+    def acquire(self) -> Optional[Employee]:
+        free = self._free
+        while free:
+            index = int(self.stream.random() * len(free))
+            free[index], free[-1] = free[-1], free[index]
+            employee = free.pop()
+            if employee.retiring:
+                self._retired_free -= 1
+                continue
+            employee.is_free = False
+            employee.calls_handled += 1
+            self._busy[employee.uid] = employee
+            return employee
+
+        return None
+
+    def acquire_many(self, num_employees: int) -> List[Employee]:
+        # one routing draw per employee
+        return self._acquire_each(num_employees)
+
+
+def create_pool(
+    policy: RoutingPolicy, employees: List[Employee], stream: UniformStream
+) -> EmployeePool:
+    """Pool of one level routing with `policy`, RANDOM draws from `stream`"""
+    if policy is RoutingPolicy.FIRST_FREE:
+        return FirstFreePool(employees)
+    if policy is RoutingPolicy.LONGEST_IDLE:
+        return LongestIdlePool(employees)
+    if policy is RoutingPolicy.FEWEST_CALLS:
+        return FewestCallsPool(employees)
+    if policy is RoutingPolicy.RANDOM:
+        return RandomPool(employees, stream)
+    return EmployeePool(employees)
@@ -0,0 +1,237 @@
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+from dataclasses import dataclass
+import datetime
+import itertools
+import math
+import random
+
+from src.call import CallPriority
+from src.call_centre import CallCentre, CallCentreConfig
+from src.names import NamePool
+from src.rng import RandomStreams, UniformStream
+
+SIMULATION_START = datetime.datetime(2000, 1, 1)
+
+
+class VirtualClock:
+    """
+    Simulated clock, a drop-in replacement for time.time.
+    Time only moves when the simulation engine advances it,
+    time_sec is the simulated time since `start`.
+    """
+
+    def __init__(self, start: datetime.datetime = SIMULATION_START):
+        self.start = start
+        self.start_sec = start.timestamp()
+        self.time_sec = 0.0
+
+    def __call__(self) -> float:
+        return self.start_sec + self.time_sec
+
+    def to_sec(self, moment: float) -> float:
+        """Simulated time since `start` of a clock reading"""
+        return moment - self.start_sec
+
+
+class Arrival(NamedTuple):
+    time_sec: float
+    caller_name: str
+    priority: CallPriority
+    # None for a random duration
+    duration_sec: Optional[int] = None
+    # None to draw it from the call centre patience
+    patience_sec: Optional[float] = None
+
+
+@dataclass
+class SimulationStats:
+    calls_arrived: int = 0
+    calls_ended: int = 0
+    simulated_sec: float = 0.0
+
+
+class SimulationEngine:
+    """
+    Discrete-event simulation of a CallCentre under a virtual clock.
+
+    Events are call arrivals (a time ordered iterable of Arrival), call
+    ends (the head of CallCentre.active_calls) and callers hanging up on
+    hold (the earliest deadline of CallCentre.call_backlog). Escalations
+    happen when a call ends, through Call.end, exactly as in the real-time loop.
+    Each event time runs the same steps as run_simulation's real-time loop:
+    review active calls, review backlog, dispatch the arriving calls.
+    """
+
+    def __init__(self, call_centre: CallCentre, escalate: Optional[bool] = None):
+        if not isinstance(call_centre.clock, VirtualClock):
+            raise TypeError(
+                "SimulationEngine requires a CallCentre with a VirtualClock"
+            )
+
+        self.call_centre = call_centre
+        self.clock: VirtualClock = call_centre.clock
+        self.escalate = escalate
+        self.stats = SimulationStats()
+        # first arrival past `until` of the previous run
+        self._pending: Optional[Arrival] = None
+
+    @property
+    def arrivals_consumed(self) -> int:
+        """Arrivals taken from the iterables so far, dispatched or pending"""
+        return self.stats.calls_arrived + (self._pending is not None)
+
+    @property
+    def finished(self) -> bool:
+        """Arrivals of the last run exhausted, no call active and no caller to abandon"""
+        call_centre = self.call_centre
+        return (
+            self._pending is None
+            and not len(call_centre.active_calls)
+            and call_centre.call_backlog.next_abandon_time is None
+        )
+
+    @classmethod
+    def from_config(
+        cls, config: CallCentreConfig, escalate: Optional[bool] = None, **kwargs
+    ) -> "SimulationEngine":
+        """kwargs are passed on to CallCentre"""
+        return cls(
+            CallCentre(config, clock=VirtualClock(), **kwargs), escalate=escalate
+        )
+
+    def run(
+        self,
+        arrivals: Iterable[Arrival],
+        until: Optional[float] = None,
+        idle_to_until: bool = True,
+    ) -> SimulationStats:
+        """
+        Consume arrivals and process events up to `until` seconds of simulated
+        time. Without `until` runs until arrivals are exhausted and no call is
+        active. Can be called repeatedly to continue the same simulation.
+        If events run out before `until` the clock still moves on to `until`,
+        unless `idle_to_until` is False: then it stays at the last event.
+        """
+        arrivals_iter: Iterator[Arrival] = iter(arrivals)
+        if self._pending is not None:
+            arrivals_iter = itertools.chain([self._pending], arrivals_iter)
+            self._pending = None
+
+        call_centre = self.call_centre
+        call_backlog = call_centre.call_backlog
+        clock = self.clock
+        next_arrival = next(arrivals_iter, None)
+        drained = False
+
+        while True:
+            next_end_time = call_centre.active_calls.next_end_time
+            next_end = (
+                clock.to_sec(next_end_time) if next_end_time is not None else None
+            )
+            next_abandon_time = call_backlog.next_abandon_time
+            next_abandon = (
+                clock.to_sec(next_abandon_time)
+                if next_abandon_time is not None
+                else None
+            )
+
+            event_time = next_arrival.time_sec if next_arrival is not None else None
+            if next_end is not None and (event_time is None or next_end <= event_time):
+                event_time = next_end
+            if next_abandon is not None and (
+                event_time is None or next_abandon < event_time
+            ):
+                event_time = next_abandon
+
+            if event_time is None:
+                drained = True
+                break
+
+            if until is not None and event_time > until:
+                break
+
+            if event_time < clock.time_sec:
+                raise ValueError("Arrivals must be ordered by time")
+            clock.time_sec = event_time
+
+            if next_abandon is not None and next_abandon <= event_time:
+                call_centre.review_abandonments()
+            if next_end is not None and next_end <= event_time:
+                self.stats.calls_ended += call_centre.review_active_calls(
+                    escalate=self.escalate
+                )
+                call_centre.review_backlog()
+
+            while next_arrival is not None and next_arrival.time_sec <= event_time:
+                call_centre.dispatch_call(
+                    caller_name=next_arrival.caller_name,
+                    priority=next_arrival.priority,
+                    duration_sec=next_arrival.duration_sec,
+                    patience_sec=next_arrival.patience_sec,
+                )
+                self.stats.calls_arrived += 1
+                next_arrival = next(arrivals_iter, None)
+
+        self._pending = next_arrival
+        if (
+            until is not None
+            and until > clock.time_sec
+            and (idle_to_until or not drained)
+        ):
+            clock.time_sec = until
+        self.stats.simulated_sec = clock.time_sec
+
+        return self.stats
+
+
+def random_arrivals(
+    num_calls: int,
+    max_call_interval_sec: int,
+    prob_high_priority: float,
+    caller_name: str = "Caller",
+    rand: Optional[random.Random] = None,
+    names: Optional[NamePool] = None,
+    streams: Optional[RandomStreams] = None,
+) -> Iterator[Arrival]:
+    """
+    Synthetic arrivals as produced by the real-time loop:
+    uniform integer gaps in [1, max_call_interval_sec] and a fixed priority mix.
+    Callers are drawn from `names` if given, otherwise all share `caller_name`.
+    Gaps and priorities come from the `streams` substreams if given,
+    otherwise both from `rand`.
+    """
+    gaps: Union[random.Random, UniformStream]
+    priorities: Union[random.Random, UniformStream]
+    if streams is not None:
+        gaps, priorities = streams.arrivals, streams.priority
+    else:
+        gaps = priorities = rand or random.Random()
+
+    time_sec = 0
+    for _ in range(num_calls):
+        priority = (
+            CallPriority.HIGH
+            if priorities.random() < prob_high_priority
+            else CallPriority.LOW
+        )
+        yield Arrival(time_sec, names.draw() if names else caller_name, priority)
+        time_sec += gaps.randint(1, max_call_interval_sec)
+
+
+def poisson_arrivals(
+    num_calls: int,
+    arrival_rate: float,
+    prob_high_priority: float,
+    streams: RandomStreams,
+    caller_name: str = "Caller",
+) -> Iterator[Arrival]:
+    """Exponential gaps of mean 1 / arrival_rate, the arrivals queueing models assume"""
+    time_sec = 0.0
+    for _ in range(num_calls):
+        priority = (
+            CallPriority.HIGH
+            if streams.priority.random() < prob_high_priority
+            else CallPriority.LOW
+        )
+        yield Arrival(time_sec, caller_name, priority)
+        time_sec -= math.log(1.0 - streams.arrivals.random()) / arrival_rate
@@ -0,0 +1,127 @@
+from typing import Any, Iterable, Iterator, List, Optional, TypeVar, Union
+import itertools
+import os
+import pickle
+import zlib
+
+from src.call_centre import CallCentre
+from src.rng import RandomStreams
+from src.routing import RandomPool
+from src.simulation import Arrival, SimulationEngine
+
+SNAPSHOT_MAGIC = b"CCSNAP1"
+# flag byte after the magic
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+Snapshottable = TypeVar("Snapshottable", CallCentre, SimulationEngine)
+
+
+def dumps(state: Union[CallCentre, SimulationEngine], compress: bool = False) -> bytes:
+    """
+    Binary snapshot of a CallCentre, or of a SimulationEngine with its call
+    centre, clock and stats: staff and pools, active calls, backlog, callers,
+    id counters, metrics and random streams. The event log and the profiler
+    are not included, attach them again after restoring.
+    """
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    if compress:
+        return SNAPSHOT_MAGIC + _COMPRESSED + zlib.compress(payload, 1)
+    return SNAPSHOT_MAGIC + _RAW + payload
+
+
+def loads(snapshot: bytes, rng: Optional[RandomStreams] = None) -> Any:
+    """
+    Restore a snapshot. `rng` replaces the restored random streams, e.g.
+    to send branches of one warmed-up state down different random paths.
+    """
+    header_size = len(SNAPSHOT_MAGIC) + 1
+    if snapshot[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError("Not a call centre snapshot")
+
+    payload = memoryview(snapshot)[header_size:]
+    flag = snapshot[len(SNAPSHOT_MAGIC) : header_size]
+    state = pickle.loads(zlib.decompress(payload) if flag == _COMPRESSED else payload)
+
+    if rng is not None:
+        call_centre = (
+            state.call_centre if isinstance(state, SimulationEngine) else state
+        )
+        call_centre.rng = rng
+        for pool in call_centre.employee_pools.values():
+            if isinstance(pool, RandomPool):
+                pool.stream = rng.routing
+    return state
+
+
+def save(state: Union[CallCentre, SimulationEngine], path: str, compress: bool = False):
+    """Write a snapshot atomically, an interrupted save keeps the previous file"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(dumps(state, compress=compress))
+    os.replace(temp_path, path)
+
+
+def load(path: str, rng: Optional[RandomStreams] = None) -> Any:
+    with open(path, "rb") as snapshot_file:
+        return loads(snapshot_file.read(), rng=rng)
+
+
+def branch(state: Snapshottable, num_branches: int) -> List[Snapshottable]:
+    """Independent copies of a state, serialized once"""
+    snapshot = dumps(state)
+    return [loads(snapshot) for _ in range(num_branches)]
+
+
+class BackgroundSnapshot:
+    """Snapshot being written by a forked child, see save_in_background"""
+
+    def __init__(self, path: str, pid: Optional[int] = None):
+        self.path = path
+        self.pid = pid
+
+    def wait(self):
+        """Block until the snapshot is on disk"""
+        if self.pid is None:
+            return
+        _, status = os.waitpid(self.pid, 0)
+        self.pid = None
+        if os.waitstatus_to_exitcode(status) != 0:
+            raise RuntimeError(f"Background snapshot to {self.path} failed")
+
+
+def save_in_background(
+    state: Union[CallCentre, SimulationEngine], path: str, compress: bool = False
+) -> BackgroundSnapshot:
+    """
+    Copy-on-write snapshot: a forked child serializes its frozen copy of
+    the state and writes it while the simulation carries on in the parent.
+    Saves in the foreground where fork is not available.
+    """
+    if not hasattr(os, "fork"):
+        save(state, path, compress=compress)
+        return BackgroundSnapshot(path)
+
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            save(state, path, compress=compress)
+            exit_code = 0
+        finally:
+            # skip the parent's exit handlers and buffered output
+            os._exit(exit_code)
+
+    return BackgroundSnapshot(path, pid)
+
+
+def remaining_arrivals(
+    engine: SimulationEngine, arrivals: Iterable[Arrival]
+) -> Iterator[Arrival]:
+    """
+    Resume an arrival sequence for a restored engine: skips the arrivals the
+    engine consumed before the snapshot. `arrivals` must replay the original
+    sequence, e.g. the same trace or random_arrivals with a same-seed
+    RandomStreams of its own.
+    """
+    return itertools.islice(arrivals, engine.arrivals_consumed, None)
@@ -0,0 +1,80 @@
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Sequence
+import itertools
+
+from src.arrivals import DAY_SEC, HOUR_SEC
+from src.employee import EmployeeSeniorotyLevel
+from src.monte_carlo import LEVEL_SIZE_FIELD
+from src.simulation import Arrival, SimulationEngine, SimulationStats
+
+# CallCentreConfig field name -> level
+LEVEL_NAMES = {field: level for level, field in LEVEL_SIZE_FIELD.items()}
+
+
+class ShiftChange(NamedTuple):
+    """Headcount per level from `time_sec` of simulated time, other levels unchanged"""
+
+    time_sec: float
+    staff: Dict[EmployeeSeniorotyLevel, int]
+
+
+def parse_shift(spec: str) -> ShiftChange:
+    """ "8:juniors=6,seniors=3" -> ShiftChange at hour 8 of the day"""
+    hour, _, levels = spec.partition(":")
+    staff = {}
+    for item in levels.split(","):
+        name, _, headcount = item.partition("=")
+        if name not in LEVEL_NAMES or not headcount:
+            raise ValueError(f"Invalid shift: {spec}")
+        staff[LEVEL_NAMES[name]] = int(headcount)
+    return ShiftChange(float(hour) * HOUR_SEC, staff)
+
+
+def daily_shifts(shifts: Sequence[ShiftChange]) -> Iterator[ShiftChange]:
+    """The same day of shift changes (times within a day) repeated for ever"""
+    day = sorted(shifts, key=lambda shift: shift.time_sec)
+    for day_index in itertools.count():
+        for shift in day:
+            yield ShiftChange(day_index * DAY_SEC + shift.time_sec, shift.staff)
+
+
+def run_with_shifts(
+    engine: SimulationEngine,
+    arrivals: Iterable[Arrival],
+    shifts: Iterable[ShiftChange],
+) -> SimulationStats:
+    """
+    Run the engine through time ordered shift changes. The engine runs up to
+    each change (events at the change time included), then levels are hired
+    up or retired down to their new headcount: new staff drain the backlog
+    at once, retiring staff finish their current call. Changes not after the
+    current time apply straight away. Stops applying shifts once the run is
+    over, so an endless schedule like daily_shifts can be passed: the clock
+    stays at the last event instead of idling on to the next change. Calls
+    still on hold keep the run going to the next changes, until a full day
+    of them went by without answering any.
+    """
+    arrivals_iter = iter(arrivals)
+    call_centre = engine.call_centre
+    call_backlog = call_centre.call_backlog
+    # since when only calls on hold are left, and how many of them
+    stalled_at_sec: Optional[float] = None
+    stalled_backlog = 0
+    for shift in shifts:
+        if shift.time_sec > engine.clock.time_sec:
+            engine.run(arrivals_iter, until=shift.time_sec, idle_to_until=False)
+            if not engine.finished:
+                stalled_at_sec = None
+            elif not len(call_backlog):
+                break
+            else:
+                if stalled_at_sec is None or len(call_backlog) < stalled_backlog:
+                    stalled_at_sec = engine.clock.time_sec
+                    stalled_backlog = len(call_backlog)
+                elif shift.time_sec - stalled_at_sec >= DAY_SEC:
+                    break
+                # nothing left but calls on hold: wait for the change
+                engine.run(arrivals_iter, until=shift.time_sec)
+        for level, headcount in shift.staff.items():
+            call_centre.set_headcount(level, headcount)
+
+    return engine.run(arrivals_iter)
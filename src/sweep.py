@@ -0,0 +1,152 @@
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields, replace
+import csv
+import itertools
+import os
+
+import numpy as np
+
+from src.call_centre import CallCentreConfig
+from src.monte_carlo import run_replications
+
+CONFIG_FIELDS = [field.name for field in fields(CallCentreConfig)]
+
+
+@dataclass
+class SweepSettings:
+    replications: int
+    horizon_sec: int
+    arrival_rate: float
+    prob_high_priority: float
+    seed: int = 0
+
+
+def parse_grid_values(spec: str) -> List[Any]:
+    """
+    Values of one grid axis:
+    "3:20" inclusive integer range, "0.1:0.7:0.1" inclusive range with a step,
+    "1,2,5" explicit list
+    """
+    parts = spec.split(":")
+    if len(parts) == 1:
+        return [_parse_number(value) for value in spec.split(",")]
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid grid range: {spec}")
+
+    start, stop = _parse_number(parts[0]), _parse_number(parts[1])
+    step = _parse_number(parts[2]) if len(parts) == 3 else 1
+    if step <= 0:
+        raise ValueError(f"Grid step must be positive: {spec}")
+
+    if all(isinstance(value, int) for value in (start, stop, step)):
+        return list(range(start, stop + 1, step))
+
+    num_steps = int(round((stop - start) / step))
+    return [round(start + i * step, 10) for i in range(num_steps + 1)]
+
+
+def parse_grid(specs: Sequence[str]) -> Dict[str, List[Any]]:
+    """Parse "field=values" items, see parse_grid_values"""
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in CONFIG_FIELDS or not values:
+            raise ValueError(f"Invalid grid axis: {spec}")
+        grid[name] = parse_grid_values(values)
+
+    return grid
+
+
+def expand_grid(
+    base: CallCentreConfig, grid: Mapping[str, Sequence[Any]]
+) -> Iterator[CallCentreConfig]:
+    """Every combination of the grid axes applied on top of the base config"""
+    for name in grid:
+        if name not in CONFIG_FIELDS:
+            raise ValueError(f"Unknown CallCentreConfig field: {name}")
+
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield replace(base, **dict(zip(names, values)))
+
+
+def point_seed(base_seed: int, index: int) -> np.random.SeedSequence:
+    """Independent, deterministic seed of the grid point `index`"""
+    return np.random.SeedSequence(entropy=base_seed, spawn_key=(index,))
+
+
+def evaluate_point(
+    index: int, config: CallCentreConfig, settings: SweepSettings
+) -> Dict[str, Any]:
+    result = run_replications(
+        config,
+        replications=settings.replications,
+        horizon_sec=settings.horizon_sec,
+        arrival_rate=settings.arrival_rate,
+        prob_high_priority=settings.prob_high_priority,
+        seed=point_seed(settings.seed, index),
+    )
+
+    row: Dict[str, Any] = {"index": index}
+    row.update(asdict(config))
+    row.update(result.summary())
+    return row
+
+
+def run_sweep(
+    base: CallCentreConfig,
+    grid: Mapping[str, Sequence[Any]],
+    settings: SweepSettings,
+    out_path: str,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Evaluate every grid point on a process pool and stream one CSV row per
+    point as it finishes (completion order, the `index` column gives the grid
+    order). At most 2 * workers points are in flight, so memory stays bounded
+    for any grid size. Returns the number of rows written.
+    """
+    workers = workers or os.cpu_count() or 1
+    points = enumerate(expand_grid(base, grid))
+    written = 0
+
+    with open(out_path, "w", newline="") as out_file, ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        writer: Optional[csv.DictWriter] = None
+        in_flight: Dict[Future, int] = {}
+
+        def submit_next() -> bool:
+            point: Optional[Tuple[int, CallCentreConfig]] = next(points, None)
+            if point is None:
+                return False
+            future = executor.submit(evaluate_point, point[0], point[1], settings)
+            in_flight[future] = point[0]
+            return True
+
+        for _ in range(2 * workers):
+            if not submit_next():
+                break
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                row = future.result()
+                if writer is None:
+                    writer = csv.DictWriter(out_file, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+                out_file.flush()
+                written += 1
+                submit_next()
+
+    return written
+
+
+def _parse_number(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
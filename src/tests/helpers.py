@@ -0,0 +1,24 @@
+from src.call_centre import CallCentreConfig
+
+
+class FakeClock:
+    """Clock the tests move by hand, starts at an arbitrary non-zero time"""
+
+    def __init__(self, time_sec: float = 1000.0):
+        self.time_sec = time_sec
+
+    def __call__(self) -> float:
+        return self.time_sec
+
+
+def juniors_only(
+    juniors: int = 4, call_escalation_prob: float = 0.0
+) -> CallCentreConfig:
+    return CallCentreConfig(
+        juniors=juniors,
+        seniors=0,
+        managers=0,
+        directors=0,
+        max_call_duration_sec=10,
+        call_escalation_prob=call_escalation_prob,
+    )
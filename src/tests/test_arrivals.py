@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from src.arrivals import (
+    DAY_SEC,
+    HOUR_SEC,
+    RateProfile,
+    Surge,
+    day_arrivals,
+    profile_arrivals,
+)
+from src.call_centre import CallCentreConfig, CallPriority
+from src.rng import RandomStreams
+from src.simulation import SimulationEngine
+
+# quiet nights, a morning peak and a busy evening
+HOURLY_CALLS = [20] * 7 + [300] * 3 + [100] * 8 + [200] * 4 + [20] * 2
+
+
+class TestRateProfile:
+    def test_hourly(self):
+        profile = RateProfile.hourly(HOURLY_CALLS, prob_high_priority=0.3)
+
+        assert profile.calls_per_day == pytest.approx(sum(HOURLY_CALLS))
+        assert profile.rate_at(8 * HOUR_SEC) == pytest.approx(300 / HOUR_SEC)
+        assert profile.rate_at(DAY_SEC + 8 * HOUR_SEC) == profile.rate_at(8 * HOUR_SEC)
+
+    def test_invalid_profiles(self):
+        with pytest.raises(ValueError):
+            RateProfile.hourly([10] * 23, 0.3)
+        with pytest.raises(ValueError):
+            RateProfile.hourly([-1] * 24, 0.3)
+        with pytest.raises(ValueError):
+            RateProfile.hourly([10] * 24, 1.5)
+        with pytest.raises(ValueError):
+            Surge(start_sec=10, end_sec=5, factor=2)
+
+    def test_smoothed_keeps_daily_volume(self):
+        profile = RateProfile.hourly(HOURLY_CALLS, prob_high_priority=0.3)
+
+        smoothed = profile.smoothed(resolution_sec=300)
+
+        assert len(smoothed.rates) == DAY_SEC // 300
+        assert smoothed.calls_per_day == pytest.approx(profile.calls_per_day)
+        assert (
+            np.abs(np.diff(smoothed.rates)).max() < np.abs(np.diff(profile.rates)).max()
+        )
+
+
+class TestProfileArrivals:
+    def test_volume_and_shape(self):
+        profile = RateProfile.hourly(HOURLY_CALLS, prob_high_priority=0.3)
+        days = 20
+
+        times, high = np.concatenate(
+            [day_arrivals(profile, day, RandomStreams(1)) for day in range(days)],
+            axis=1,
+        )
+        hours = (times % DAY_SEC // HOUR_SEC).astype(int)
+        per_hour = np.bincount(hours, minlength=24) / days
+
+        expected = profile.calls_per_day * days
+        assert abs(len(times) - expected) < 5 * np.sqrt(expected)
+        assert per_hour[8] > 10 * per_hour[3]
+        assert high.mean() == pytest.approx(0.3, abs=0.02)
+
+    def test_sorted_and_within_days(self):
+        profile = RateProfile.hourly(HOURLY_CALLS, prob_high_priority=0.3)
+
+        times = [arrival.time_sec for arrival in profile_arrivals(profile, 3)]
+
+        assert times == sorted(times)
+        assert 0 <= times[0] and times[-1] < 3 * DAY_SEC
+
+    def test_per_hour_priority_mix_and_closed_hours(self):
+        calls = [0] * 12 + [100] * 12
+        prob_high = [0.0] * 18 + [1.0] * 6
+        profile = RateProfile.hourly(calls, prob_high)
+
+        arrivals = list(profile_arrivals(profile, 2, RandomStreams(2)))
+
+        for arrival in arrivals:
+            hour = arrival.time_sec % DAY_SEC // HOUR_SEC
+            assert hour >= 12
+            expected = CallPriority.HIGH if hour >= 18 else CallPriority.LOW
+            assert arrival.priority == expected
+
+    def test_surge(self):
+        profile = RateProfile.constant(rate=0.01, prob_high_priority=0.0)
+        storm = Surge(
+            start_sec=DAY_SEC + HOUR_SEC,
+            end_sec=DAY_SEC + 3 * HOUR_SEC,
+            factor=20,
+            prob_high_priority=1.0,
+        )
+
+        times, high = day_arrivals(profile, 1, RandomStreams(3), [storm])
+
+        in_storm = (times >= storm.start_sec) & (times < storm.end_sec)
+        # 2 hours at 0.2 calls/sec against 22 hours at 0.01 calls/sec
+        assert abs(in_storm.sum() - 1440) < 5 * np.sqrt(1440)
+        assert abs((~in_storm).sum() - 792) < 5 * np.sqrt(792)
+        assert high[in_storm].all() and not high[~in_storm].any()
+
+    def test_seeded_and_simulated(self):
+        profile = RateProfile.hourly(HOURLY_CALLS, prob_high_priority=0.3)
+        config = CallCentreConfig(
+            juniors=3,
+            seniors=2,
+            managers=1,
+            directors=1,
+            max_call_duration_sec=30,
+            call_escalation_prob=0.2,
+        )
+
+        assert list(profile_arrivals(profile, 1, RandomStreams(4))) == list(
+            profile_arrivals(profile, 1, RandomStreams(4))
+        )
+
+        streams = RandomStreams(4)
+        engine = SimulationEngine.from_config(config, rng=streams)
+        arrivals = list(profile_arrivals(profile, 1, streams))
+        stats = engine.run(arrivals)
+
+        assert stats.calls_arrived == len(arrivals)
+        assert stats.calls_ended >= len(arrivals)
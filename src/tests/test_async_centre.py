@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from src.async_centre import AsyncCallCentre, start_gateway
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+
+
+def small_config() -> CallCentreConfig:
+    return CallCentreConfig(
+        juniors=1,
+        seniors=0,
+        managers=1,
+        directors=0,
+        max_call_duration_sec=10,
+        call_escalation_prob=0.1,
+    )
+
+
+class TestAsyncCallCentre:
+    def test_calls_end_on_timer(self):
+        async def scenario():
+            async_centre = AsyncCallCentre(CallCentre(small_config()), escalate=False)
+            runner = asyncio.create_task(async_centre.run())
+
+            first = await async_centre.dispatch("Abc", CallPriority.LOW, 1)
+            second = await async_centre.dispatch("Def", CallPriority.LOW, 1)
+            third = await async_centre.dispatch("Ghi", CallPriority.LOW, 1)
+            assert first.assigned_to is not None
+            assert second.assigned_to is not None
+            assert third.assigned_to is None
+            assert len(async_centre.call_centre.call_backlog) == 1
+
+            await asyncio.sleep(1.1)
+            # both ended at their end time, the backlogged call took a line
+            assert async_centre.stats.calls_ended == 2
+            assert third.assigned_to is not None
+            assert async_centre._timer is not None
+
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+            assert async_centre._timer is None
+
+        asyncio.run(scenario())
+
+    def test_gateway(self):
+        async def scenario():
+            async_centre = AsyncCallCentre(CallCentre(small_config()))
+            runner = asyncio.create_task(async_centre.run())
+            server = await start_gateway(async_centre)
+            port = server.sockets[0].getsockname()[1]
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request in (
+                {"caller": "Abc", "priority": "high", "duration_sec": 5},
+                {"caller": "Abc", "priority": "URGENT"},
+                {"caller": "Def", "priority": "HIGH"},
+            ):
+                writer.write(json.dumps(request).encode() + b"\n")
+            writer.write(b"not json\n")
+            await writer.drain()
+            replies = [json.loads(await reader.readline()) for _ in range(4)]
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+            return replies
+
+        replies = asyncio.run(scenario())
+
+        assert replies[0] == {"call_uid": 0, "caller_uid": 0, "assigned_to": 1}
+        assert "error" in replies[1]
+        assert replies[2] == {"call_uid": 1, "caller_uid": 1, "assigned_to": None}
+        assert "error" in replies[3]
@@ -0,0 +1,81 @@
+import pytest
+
+import src.benchmark as benchmark
+from src.benchmark import BenchmarkCase, benchmark_grid, compare, run_benchmarks
+
+
+def results(**metrics):
+    return {"results": [{"case": "staff=10/backlog=0/escalation=0.1", **metrics}]}
+
+
+class TestBenchmark:
+    def test_case_config_keeps_every_level(self):
+        config = BenchmarkCase(staff=10, backlog=0, escalation_prob=0.5).config()
+
+        assert (config.juniors, config.seniors, config.managers, config.directors) == (
+            4,
+            2,
+            2,
+            2,
+        )
+        assert config.call_escalation_prob == 0.5
+        assert len(list(benchmark_grid([10, 100], [0], [0.1, 0.5]))) == 4
+
+    def test_run_benchmarks(self, monkeypatch):
+        monkeypatch.setattr(benchmark, "MIN_TIMED_CALLS", 50)
+        out = run_benchmarks(
+            [BenchmarkCase(staff=10, backlog=20, escalation_prob=0.1)], repeats=1
+        )
+
+        (result,) = out["results"]
+        assert result["case"] == "staff=10/backlog=20/escalation=0.1"
+        assert result["dispatch_calls_per_sec"] > 0
+        assert result["review_ns_per_call"] > 0
+        assert result["memory_bytes_per_call"] > 0
+        assert result["calibration_ns"] > 0
+
+    def test_compare_directions(self):
+        baseline = results(
+            dispatch_calls_per_sec=1000.0,
+            review_ns_per_call=100.0,
+            memory_bytes_per_call=200.0,
+        )
+        faster = results(
+            dispatch_calls_per_sec=2000.0,
+            review_ns_per_call=50.0,
+            memory_bytes_per_call=210.0,
+        )
+        slower = results(
+            dispatch_calls_per_sec=700.0,
+            review_ns_per_call=130.0,
+            memory_bytes_per_call=200.0,
+        )
+
+        assert compare(faster, baseline, threshold=0.25) == []
+        regressions = compare(slower, baseline, threshold=0.25)
+        assert [regression.metric for regression in regressions] == [
+            "dispatch_calls_per_sec",
+            "review_ns_per_call",
+        ]
+        assert regressions[0].change == pytest.approx(-0.3)
+        assert compare(slower, {"results": []}) == []
+
+    def test_compare_scales_timings_by_calibration(self):
+        baseline = results(
+            dispatch_calls_per_sec=1000.0,
+            review_ns_per_call=100.0,
+            memory_bytes_per_call=200.0,
+            calibration_ns=10.0,
+        )
+        # the whole machine runs at half speed, memory is not scaled
+        slow_machine = results(
+            dispatch_calls_per_sec=500.0,
+            review_ns_per_call=200.0,
+            memory_bytes_per_call=300.0,
+            calibration_ns=20.0,
+        )
+
+        regressions = compare(slow_machine, baseline, threshold=0.25)
+        assert [regression.metric for regression in regressions] == [
+            "memory_bytes_per_call"
+        ]
@@ -1,7 +1,18 @@
 import time
 
-from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+import pytest
+
+from src.call_centre import (
+    CallCentre,
+    CallCentreConfig,
+    CallPriority,
+    Patience,
+    PatienceDistribution,
+)
 from src.employee import EmployeeSeniorotyLevel
+from src.event_log import CallEvent, EventLog, read_event_log
+from src.rng import RandomStreams
+from src.routing import RoutingPolicy
 
 
 class TestCallCentreFunctionality:
@@ -103,3 +114,216 @@ class TestCallCentreFunctionality:
         assert len(call_centre.call_backlog) == 3
         assert call_centre.free_staff_detailed[EmployeeSeniorotyLevel.JUNIOR] == 2
         assert call_centre.free_staff_detailed[EmployeeSeniorotyLevel.SENIOR] == 2
+
+    def test_active_calls_end_time_order(self):
+        config = CallCentreConfig(
+            juniors=3,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config)
+
+        durations = [30, 10, 20]
+        for duration in durations:
+            call = call_centre._register_call(
+                caller_name="John Cena", priority=CallPriority.LOW
+            )
+            call.duration_sec = duration
+            call.assign(call_centre)
+
+        # calls are assigned within microseconds of each other
+        assert call.assigned_at_sec is not None
+        expired = call_centre.active_calls.pop_expired(call.assigned_at_sec + 25)
+
+        assert [call.duration_sec for call in expired] == [10, 20]
+        assert len(call_centre.active_calls) == 1
+        assert call_centre.active_calls.pop().duration_sec == 30
+
+    def test_review_backlog_priority_order(self):
+        config = CallCentreConfig(
+            juniors=0,
+            seniors=0,
+            managers=1,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config)
+
+        priorities = [CallPriority.LOW, CallPriority.LOW, CallPriority.HIGH]
+        for uid, priority in enumerate(priorities):
+            call = call_centre._register_call(caller_name=str(uid), priority=priority)
+            call_centre.call_backlog.append(call)
+
+        assert [call.caller.name for call in call_centre.call_backlog] == [
+            "2",
+            "0",
+            "1",
+        ]
+
+        # HIGH priority first
+        call_centre.review_backlog()
+        assert [call.caller.name for call in call_centre.active_calls] == ["2"]
+        assert len(call_centre.call_backlog) == 2
+
+        # then LOW priority in FIFO order
+        call_centre.active_calls.pop().end(call_centre, escalate=False)
+        call_centre.review_backlog()
+        assert [call.caller.name for call in call_centre.active_calls] == ["0"]
+        assert [call.caller.name for call in call_centre.call_backlog] == ["1"]
+
+    def test_status(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=1,
+            managers=1,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config)
+
+        for priority in [CallPriority.HIGH] * 2 + [CallPriority.LOW]:
+            call_centre.dispatch_call(caller_name="Abc", priority=priority)
+
+        status = call_centre.status()
+
+        assert status.free_staff[EmployeeSeniorotyLevel.JUNIOR] == 0
+        assert status.busy_staff[EmployeeSeniorotyLevel.MANAGER] == 1
+        assert status.free_staff[EmployeeSeniorotyLevel.SENIOR] == 1
+        assert status.free_staff_total == call_centre.free_staff == 1
+        assert status.total_staff == 3
+        assert status.active_calls == 2
+        assert status.backlog == {CallPriority.HIGH: 1, CallPriority.LOW: 0}
+        assert status.backlog_total == 1
+
+    @pytest.mark.parametrize("routing", list(RoutingPolicy))
+    def test_dispatch_calls_matches_dispatch_call(self, tmp_path, routing):
+        config = CallCentreConfig(
+            juniors=3,
+            seniors=1,
+            managers=2,
+            directors=1,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        burst = [
+            (f"Caller {ind % 7}", CallPriority.HIGH if ind % 3 else CallPriority.LOW)
+            for ind in range(20)
+        ]
+
+        sequential_log = EventLog(str(tmp_path / "sequential.bin"))
+        sequential = CallCentre(
+            config,
+            clock=lambda: 100.0,
+            rng=RandomStreams(11),
+            event_log=sequential_log,
+            routing=routing,
+        )
+        sequential_calls = [
+            sequential.dispatch_call(caller_name=name, priority=priority)
+            for name, priority in burst
+        ]
+        sequential_log.close()
+
+        batched_log = EventLog(str(tmp_path / "batched.bin"))
+        batched = CallCentre(
+            config,
+            clock=lambda: 100.0,
+            rng=RandomStreams(11),
+            event_log=batched_log,
+            routing=routing,
+        )
+        batched_calls = batched.dispatch_calls(burst)
+        batched_log.close()
+
+        def outcome(call):
+            return (
+                call.uid,
+                call.caller.uid,
+                call.priority,
+                call.duration_sec,
+                call.assigned_to.uid if call.assigned_to else None,
+            )
+
+        assert [outcome(call) for call in batched_calls] == [
+            outcome(call) for call in sequential_calls
+        ]
+        assert [call.uid for call in batched.call_backlog] == [
+            call.uid for call in sequential.call_backlog
+        ]
+        assert batched.status() == sequential.status()
+        batched_events = read_event_log(batched_log.path)
+        sequential_events = read_event_log(sequential_log.path)
+        assert (batched_events["event"] == CallEvent.BACKLOGGED).any()
+        assert batched_events.tolist() == sequential_events.tolist()
+
+    def test_abandonment_is_lazy(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        clock = [1000.0]
+        call_centre = CallCentre(config, clock=lambda: clock[0])
+        call_centre.dispatch_call("Busy", CallPriority.LOW, duration_sec=8)
+        for name, patience_sec in (("0", 5.0), ("1", 10.0), ("2", None)):
+            call_centre.dispatch_call(name, CallPriority.LOW, patience_sec=patience_sec)
+
+        clock[0] += 7
+        call_centre.review_backlog()
+
+        assert [call.caller.name for call in call_centre.call_backlog] == ["1", "2"]
+        assert call_centre.status().backlog[CallPriority.LOW] == 2
+        # left in the deque as a tombstone
+        assert len(call_centre.call_backlog.queue(CallPriority.LOW)) == 3
+        assert call_centre.metrics is not None
+        assert call_centre.metrics.abandoned[CallPriority.LOW] == 1
+
+        clock[0] += 1
+        assert call_centre.review_active_calls(escalate=False) == 1
+        call_centre.review_backlog()
+        assert [call.caller.name for call in call_centre.active_calls] == ["1"]
+
+        # the answered call's deadline has gone stale
+        clock[0] += 10
+        assert call_centre.review_abandonments() == 0
+        assert call_centre.call_backlog.next_abandon_time is None
+        assert [call.caller.name for call in call_centre.call_backlog] == ["2"]
+
+    def test_abandoned_calls_are_compacted(self):
+        config = CallCentreConfig(
+            juniors=0,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        clock = [0.0]
+        call_centre = CallCentre(config, clock=lambda: clock[0])
+        for ind in range(1000):
+            call_centre.dispatch_call(
+                str(ind), CallPriority.HIGH, patience_sec=1 if ind % 10 else 100
+            )
+
+        clock[0] += 2
+        assert call_centre.review_abandonments() == 900
+
+        assert len(call_centre.call_backlog) == 100
+        assert len(call_centre.call_backlog.queue(CallPriority.HIGH)) == 100
+
+    def test_patience(self):
+        streams = RandomStreams(3)
+
+        assert Patience(30, PatienceDistribution.FIXED).draw(streams.patience) == 30
+        draws = [Patience(30).draw(streams.patience) for _ in range(20000)]
+        assert sum(draws) / len(draws) == pytest.approx(30, rel=0.05)
+        with pytest.raises(ValueError):
+            Patience(0)
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from src.call_centre import CallCentre, CallCentreConfig, CallPriority
@@ -38,9 +40,9 @@ class TestCallFunctions:
         )
 
         call_centre = CallCentre(config)
-        for _ in range(10):
+        for ind in range(10):
             call_centre._register_call(
-                caller_name="John Cena",
+                caller_name=f"Caller {ind}",
                 priority=CallPriority.LOW,
             )
 
@@ -52,6 +54,30 @@ class TestCallFunctions:
         # check uids are incrementing as axpected
         assert registered_call.caller.uid == 10
 
+    def test_repeat_caller_registration(self):
+        config = CallCentreConfig(
+            juniors=5,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+
+        call_centre = CallCentre(config)
+        first_call = call_centre._register_call("John Cena", CallPriority.LOW)
+        call_centre._register_call("Jane Doe", CallPriority.LOW)
+        repeat_call = call_centre._register_call("John Cena", CallPriority.HIGH)
+
+        # repeat callers are tracked, not registered again
+        assert repeat_call.caller is first_call.caller
+        assert repeat_call.uid != first_call.uid
+        assert len(call_centre.callers) == 2
+        assert call_centre.callers.get(1).name == "Jane Doe"
+        assert call_centre.callers.find("Nobody") is None
+        with pytest.raises(KeyError):
+            call_centre.callers.get(2)
+
     def test_call_assignment_low_priority_simple(self):
         config = CallCentreConfig(
             juniors=1,
@@ -289,14 +315,80 @@ class TestCallFunctions:
         )
         call_centre = CallCentre(config)
 
-        registered_call = call_centre._register_call(
-            caller_name="John Cena",
-            priority=CallPriority.LOW,
-        )
-
         esc_count = 0
         for _ in range(10000):
-            if registered_call._should_escalate():
+            # escalation is drawn once per call, when registered
+            registered_call = call_centre._register_call(
+                caller_name="John Cena",
+                priority=CallPriority.LOW,
+            )
+            if registered_call._should_escalate(None, call_centre.rng.escalation):
                 esc_count += 1
 
         assert esc_count / 10000 == pytest.approx(config.call_escalation_prob, abs=0.1)
+
+    def test_employee_pools(self):
+        config = CallCentreConfig(
+            juniors=2,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config)
+        junior_pool = call_centre.employee_pools[EmployeeSeniorotyLevel.JUNIOR]
+
+        first_call = call_centre._register_call("John Cena", CallPriority.LOW)
+        second_call = call_centre._register_call("John Cena", CallPriority.LOW)
+        first_call.assign(call_centre)
+        second_call.assign(call_centre)
+
+        assert junior_pool.num_free == 0
+        assert junior_pool.num_busy == 2
+        assert first_call.assigned_to
+        assert first_call.assigned_to.uid == 0
+
+        released_employee = first_call.assigned_to
+        first_call.end(call_centre, escalate=False)
+
+        assert released_employee.is_free
+        assert junior_pool.num_free == 1
+        assert junior_pool.num_busy == 1
+
+        with pytest.raises(RuntimeError):
+            # Cannot release an employee that is already free
+            junior_pool.release(released_employee)
+
+        third_call = call_centre._register_call("John Cena", CallPriority.LOW)
+        third_call.assign(call_centre)
+
+        assert third_call.assigned_to is released_employee
+
+    def test_compact_call(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config, clock=lambda: 1_000_000.0)
+
+        first_call = call_centre._register_call("John Cena", CallPriority.LOW)
+        second_call = call_centre._register_call("John Cena", CallPriority.LOW)
+
+        assert not hasattr(first_call, "__dict__")
+        assert (first_call.uid, second_call.uid) == (0, 1)
+        assert first_call.timestamp_sec == 1_000_000.0
+        assert first_call.timestamp == datetime.datetime.fromtimestamp(1_000_000.0)
+        assert first_call.assigned_at is None
+
+        first_call.assign(call_centre)
+
+        assert first_call.assigned_at_sec == 1_000_000.0
+        assert first_call.end_time_sec == 1_000_000.0 + first_call.duration_sec
+
+        first_call.timestamp = datetime.datetime.fromtimestamp(5.0)
+        assert first_call.timestamp_sec == 5.0
@@ -0,0 +1,60 @@
+from typing import Any, Dict
+import math
+
+import pytest
+
+from src.call_centre import CallCentreConfig, CallPriority
+from src.employee import EmployeeSeniorotyLevel
+from src.erlang import erlang_b, erlang_c, estimate, validate
+
+
+def fire_station(**overrides) -> CallCentreConfig:
+    fields: Dict[str, Any] = dict(
+        juniors=5,
+        seniors=3,
+        managers=2,
+        directors=2,
+        max_call_duration_sec=15,
+        call_escalation_prob=0.5,
+    )
+    fields.update(overrides)
+    return CallCentreConfig(**fields)
+
+
+class TestErlang:
+    def test_erlang_formulas(self):
+        assert erlang_b(1, 1.0) == pytest.approx(0.5)
+        assert erlang_b(2, 1.0) == pytest.approx(0.2)
+        assert erlang_c(2, 1.0) == pytest.approx(1 / 3)
+        assert erlang_c(2, 2.5) == 1.0
+        assert erlang_c(0, 0.1) == 1.0
+
+    def test_offered_load_includes_escalations(self):
+        result = estimate(fire_station(), arrival_rate=0.4, prob_high_priority=0.3)
+
+        # mean duration 8s, HIGH share 0.3 + 0.7 * 0.5
+        assert result.offered_load[CallPriority.LOW] == pytest.approx(0.4 * 0.7 * 8)
+        assert result.offered_load[CallPriority.HIGH] == pytest.approx(0.4 * 0.65 * 8)
+        assert result.stable
+
+    def test_overloaded_high_priority(self):
+        result = estimate(
+            fire_station(managers=1, directors=0),
+            arrival_rate=0.5,
+            prob_high_priority=0.5,
+        )
+
+        assert not result.stable
+        assert math.isinf(result.mean_wait_sec[CallPriority.HIGH])
+        assert result.wait_probability[CallPriority.HIGH] == 1.0
+        assert result.utilization[EmployeeSeniorotyLevel.MANAGER] == 1.0
+
+    def test_validation_against_simulation(self):
+        report = validate(
+            fire_station(), arrival_rate=0.4, prob_high_priority=0.3, num_calls=20000
+        )
+
+        for error in report.wait_probability_error.values():
+            assert abs(error) < 0.05
+        assert abs(report.mean_wait_error_sec[CallPriority.HIGH]) < 0.5
+        assert report.max_utilization_error < 0.1
@@ -0,0 +1,75 @@
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.event_log import (
+    EVENT_DTYPE,
+    NO_EMPLOYEE,
+    SENIORITY_CODES,
+    CallEvent,
+    EventLog,
+    read_event_log,
+)
+from src.employee import EmployeeSeniorotyLevel
+
+
+class TestEventLog:
+    def test_call_lifecycle_events(self, tmp_path):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=1,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        log_path = str(tmp_path / "events.bin")
+
+        with EventLog(log_path) as event_log:
+            call_centre = CallCentre(config, clock=lambda: 100.0, event_log=event_log)
+            first_call = call_centre.dispatch_call("Abc", CallPriority.LOW)
+            call_centre.dispatch_call("Def", CallPriority.LOW)
+            call_centre.dispatch_call("Ghi", CallPriority.LOW)
+            call_centre.active_calls.pop()
+            first_call.end(call_centre, escalate=True)
+
+        events = read_event_log(log_path)
+
+        assert events.dtype == EVENT_DTYPE
+        assert [CallEvent(event) for event in events["event"]] == [
+            CallEvent.ARRIVED,
+            CallEvent.ASSIGNED,
+            CallEvent.ARRIVED,
+            CallEvent.ASSIGNED,
+            CallEvent.ARRIVED,
+            CallEvent.BACKLOGGED,
+            CallEvent.ENDED,
+            CallEvent.ESCALATED,
+            CallEvent.BACKLOGGED,
+        ]
+        assert list(events["call_uid"][:2]) == [0, 0]
+        assert events["employee_uid"][0] == NO_EMPLOYEE
+        assert events["seniority"][1] == SENIORITY_CODES[EmployeeSeniorotyLevel.JUNIOR]
+        assert events["seniority"][3] == SENIORITY_CODES[EmployeeSeniorotyLevel.MANAGER]
+        assert events["time_sec"][6] == 100.0 + first_call.duration_sec
+        assert events["priority"][8] == CallPriority.HIGH.value
+
+    def test_buffered_writes(self, tmp_path):
+        config = CallCentreConfig(
+            juniors=0,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        log_path = str(tmp_path / "events.bin")
+        event_log = EventLog(log_path, buffer_size=4)
+        call_centre = CallCentre(config, event_log=event_log)
+
+        assert len(read_event_log(log_path)) == 0
+
+        # arrived + backlogged per call
+        for _ in range(3):
+            call_centre.dispatch_call("Abc", CallPriority.HIGH)
+        assert len(read_event_log(log_path)) == 4
+
+        event_log.close()
+        assert len(read_event_log(log_path)) == 6
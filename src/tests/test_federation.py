@@ -0,0 +1,54 @@
+import pytest
+
+from src.call_centre import CallCentreConfig, CallPriority
+from src.federation import ShardSpec, run_federation
+
+
+def shard_spec(managers: int, directors: int, seed: int) -> ShardSpec:
+    return ShardSpec(
+        config=CallCentreConfig(
+            juniors=3,
+            seniors=2,
+            managers=managers,
+            directors=directors,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.3,
+        ),
+        num_calls=2000,
+        max_call_interval_sec=2,
+        prob_high_priority=0.5,
+        seed=seed,
+    )
+
+
+class TestFederation:
+    def test_overflow_to_neighbour(self):
+        specs = [shard_spec(1, 0, seed=0), shard_spec(4, 4, seed=1)]
+        result = run_federation(specs, epoch_sec=30, processes=False)
+
+        overloaded, spare = result.shards
+        assert overloaded.transferred_out > 0
+        assert spare.transferred_in == overloaded.transferred_out
+        assert spare.transferred_out == 0
+        assert result.calls_arrived == 4000
+        # metrics of both shards merged
+        assert result.metrics.queue_wait[CallPriority.HIGH].count > 2000
+
+    def test_processes_match_single_process(self):
+        specs = [shard_spec(1, 1, seed=seed) for seed in range(3)]
+
+        in_process = run_federation(specs, epoch_sec=30, processes=False)
+        multi_process = run_federation(specs, epoch_sec=30, processes=True)
+
+        assert multi_process.epochs == in_process.epochs
+        for ours, theirs in zip(multi_process.shards, in_process.shards):
+            assert ours.calls_ended == theirs.calls_ended
+            assert ours.transferred_in == theirs.transferred_in
+            assert ours.transferred_out == theirs.transferred_out
+        assert multi_process.metrics.summary() == in_process.metrics.summary()
+
+    def test_single_shard_and_invalid_epoch(self):
+        result = run_federation([shard_spec(1, 1, seed=0)], processes=False)
+        assert result.transfers == 0
+        with pytest.raises(ValueError):
+            run_federation([shard_spec(1, 1, seed=0)], epoch_sec=0)
@@ -0,0 +1,131 @@
+import pytest
+
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.employee import EmployeeSeniorotyLevel
+from src.metrics import CallCentreMetrics, LogHistogram
+from src.tests.helpers import FakeClock
+
+
+class TestLogHistogram:
+    def test_percentiles_within_bucket_width(self):
+        histogram = LogHistogram()
+        for value in range(1, 1001):
+            histogram.record(float(value))
+
+        assert histogram.count == 1000
+        assert histogram.min == 1.0
+        assert histogram.max == 1000.0
+        assert histogram.mean == pytest.approx(500.5)
+        assert histogram.percentile(50) == pytest.approx(500, rel=0.12)
+        assert histogram.percentile(99) == pytest.approx(990, rel=0.12)
+        assert histogram.percentile(100) == 1000.0
+
+    def test_zero_and_empty(self):
+        histogram = LogHistogram()
+        assert histogram.percentile(50) is None
+        assert histogram.mean is None
+        assert histogram.min is None
+
+        histogram.record(0.0)
+        assert histogram.percentile(50) == 0.0
+
+    def test_merge(self):
+        first, second = LogHistogram(), LogHistogram()
+        first.record(1.0)
+        second.record(100.0)
+        second.record(200.0)
+
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.total == 301.0
+        assert (first.min, first.max) == (1.0, 200.0)
+        with pytest.raises(ValueError):
+            first.merge(LogHistogram(buckets_per_decade=10))
+
+
+class TestCallCentreMetrics:
+    def test_queue_wait_and_utilization(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        clock = FakeClock()
+        call_centre = CallCentre(config, clock=clock)
+
+        call_centre.dispatch_call("Abc", CallPriority.LOW, duration_sec=4)
+        call_centre.dispatch_call("Def", CallPriority.LOW, duration_sec=2)
+
+        clock.time_sec += 4
+        call_centre.review_active_calls(escalate=False)
+        call_centre.review_backlog()
+        clock.time_sec += 2
+        call_centre.review_active_calls(escalate=False)
+
+        metrics = call_centre.metrics
+        assert metrics is not None
+        queue_wait = metrics.queue_wait[CallPriority.LOW]
+        assert queue_wait.count == 2
+        assert (queue_wait.min, queue_wait.max) == (0.0, 4.0)
+        assert metrics.handling_time[EmployeeSeniorotyLevel.JUNIOR].count == 2
+        assert call_centre.utilization()[EmployeeSeniorotyLevel.JUNIOR] == 1.0
+        assert call_centre.utilization()[EmployeeSeniorotyLevel.SENIOR] == 0.0
+
+    def test_escalated_wait_counts_from_escalation(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=1,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        clock = FakeClock()
+        call_centre = CallCentre(config, clock=clock)
+        call_centre.dispatch_call("Abc", CallPriority.HIGH, duration_sec=10)
+        call = call_centre.dispatch_call("Def", CallPriority.LOW, duration_sec=3)
+
+        clock.time_sec += 3
+        call_centre.active_calls.pop()
+        call.end(call_centre, escalate=True)
+        clock.time_sec += 7
+        call_centre.review_active_calls(escalate=False)
+        call_centre.review_backlog()
+
+        metrics = call_centre.metrics
+        assert metrics is not None
+        assert metrics.escalations == 1
+        assert metrics.queue_wait[CallPriority.HIGH].max == 7.0
+        summary = metrics.summary()
+        assert summary["high_calls_assigned"] == 2
+        assert summary["low_calls_assigned"] == 1
+
+        clock.time_sec += 1
+        call_centre.dispatch_call("Ghi", CallPriority.HIGH, patience_sec=0.5)
+        call_centre.dispatch_call("Jkl", CallPriority.HIGH, duration_sec=10)
+        clock.time_sec += 1
+        call_centre.review_backlog()
+        assert metrics.abandoned[CallPriority.HIGH] == 1
+        assert metrics.abandonment_rate(CallPriority.HIGH) == pytest.approx(1 / 3)
+        merged = CallCentreMetrics().merge(metrics).merge(metrics)
+        assert merged.summary()["high_calls_abandoned"] == 2
+
+    def test_disabled(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        call_centre = CallCentre(config, collect_metrics=False)
+        call_centre.dispatch_call("Abc", CallPriority.LOW)
+
+        assert call_centre.metrics is None
+        with pytest.raises(RuntimeError):
+            call_centre.utilization()
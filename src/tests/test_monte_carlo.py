@@ -0,0 +1,98 @@
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from src.call_centre import CallCentreConfig, CallPriority
+from src.employee import EmployeeSeniorotyLevel
+from src.monte_carlo import MonteCarloResult, _ReplicatedQueue, run_replications
+
+
+def make_config(**kwargs) -> CallCentreConfig:
+    fields: Dict[str, Any] = dict(
+        juniors=3,
+        seniors=2,
+        managers=2,
+        directors=1,
+        max_call_duration_sec=10,
+        call_escalation_prob=0.3,
+    )
+    fields.update(kwargs)
+    return CallCentreConfig(**fields)
+
+
+class TestMonteCarlo:
+    def test_replicated_queue_fifo_and_growth(self):
+        queue = _ReplicatedQueue(replications=2, capacity=2)
+
+        queue.push(np.array([1, 2]), time=0)
+        queue.push(np.array([3, 0]), time=5)
+        assert queue.capacity >= 4
+        assert list(queue.size) == [4, 2]
+
+        rows, times = queue.pop(np.array([2, 2]))
+        assert list(rows) == [0, 0, 1, 1]
+        assert list(times) == [0, 5, 0, 0]
+        assert list(queue.size) == [2, 0]
+
+    def test_seeded_runs_are_reproducible(self):
+        config = make_config()
+        first = run_replications(config, 8, 300, 0.5, 0.3, seed=7)
+        second = run_replications(config, 8, 300, 0.5, 0.3, seed=7)
+
+        for priority in CallPriority:
+            assert np.array_equal(
+                first.wait_histogram[priority], second.wait_histogram[priority]
+            )
+        assert np.array_equal(first.mean_backlog, second.mean_backlog)
+
+    def test_no_escalation(self):
+        result = run_replications(
+            make_config(call_escalation_prob=0.0), 4, 300, 0.5, 0.0, seed=1
+        )
+
+        assert result.escalations.sum() == 0
+        assert result.calls_served(CallPriority.HIGH).sum() == 0
+        assert np.all(result.utilization[EmployeeSeniorotyLevel.DIRECTOR] == 0)
+
+    def test_light_load_has_no_waits(self):
+        result = run_replications(make_config(juniors=50), 4, 600, 0.1, 0.0, seed=1)
+
+        assert np.all(result.mean_wait(CallPriority.LOW) == 0)
+        assert np.all(result.max_backlog == 0)
+
+    def test_overload_builds_backlog(self):
+        result = run_replications(make_config(), 4, 600, 5.0, 0.5, seed=1)
+
+        assert np.all(result.final_backlog > 0)
+        assert np.all(result.wait_percentile(95) > result.wait_percentile(5))
+        for utilization in result.utilization.values():
+            assert np.all(utilization > 0.9)
+            assert np.all(utilization <= 1.0)
+
+    def test_wait_percentile(self):
+        histogram = np.array([[5, 3, 0, 2], [0, 0, 0, 0]])
+        result = MonteCarloResult(
+            wait_histogram={
+                CallPriority.HIGH: histogram,
+                CallPriority.LOW: np.zeros_like(histogram),
+            },
+            mean_backlog=np.zeros(2),
+            max_backlog=np.zeros(2),
+            final_backlog=np.zeros(2),
+            utilization={},
+            escalations=np.zeros(2),
+            horizon_sec=1,
+        )
+
+        assert result.wait_percentile(50)[0] == 0
+        assert result.wait_percentile(80)[0] == 1
+        assert result.wait_percentile(95)[0] == 3
+        assert np.isnan(result.wait_percentile(50)[1])
+        assert result.mean_wait()[0] == pytest.approx(0.9)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            run_replications(make_config(), 0, 10, 1.0, 0.3)
+        with pytest.raises(ValueError):
+            run_replications(make_config(), 1, 10, 1.0, 1.3)
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from src.names import NamePool
+
+
+class TestNamePool:
+    def test_draw(self):
+        pool = NamePool(["Abc", "Def", "Ghi"], rand=random.Random(0))
+
+        assert len(pool) == 3
+        assert pool.draw() in {"Abc", "Def", "Ghi"}
+        assert set(pool.draw_many(100)) <= {"Abc", "Def", "Ghi"}
+
+    def test_seeded_draws_repeat(self):
+        names = [f"Caller {ind}" for ind in range(100)]
+
+        first = NamePool(names, rand=random.Random(3)).draw_many(20)
+        second = NamePool(names, rand=random.Random(3)).draw_many(20)
+
+        assert first == second
+
+    def test_from_file(self, tmp_path):
+        names_path = tmp_path / "names.txt"
+        names_path.write_text("John Cena\n\nJane Doe\n")
+
+        pool = NamePool.from_file(str(names_path))
+
+        assert len(pool) == 2
+        assert pool.draw() in {"John Cena", "Jane Doe"}
+
+    def test_empty_pool(self):
+        with pytest.raises(ValueError):
+            NamePool([])
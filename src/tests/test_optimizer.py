@@ -0,0 +1,79 @@
+from typing import Any, Dict
+
+import pytest
+
+from src.employee import EmployeeSeniorotyLevel
+from src.optimizer import SimulationBudget, StaffingOptimizer, WaitSla
+
+COSTS = {
+    EmployeeSeniorotyLevel.JUNIOR: 1.0,
+    EmployeeSeniorotyLevel.SENIOR: 1.5,
+    EmployeeSeniorotyLevel.MANAGER: 2.5,
+    EmployeeSeniorotyLevel.DIRECTOR: 4.0,
+}
+
+
+def make_optimizer(**kwargs) -> StaffingOptimizer:
+    settings: Dict[str, Any] = dict(
+        arrival_rate=0.3,
+        prob_high_priority=0.3,
+        costs=COSTS,
+        sla=WaitSla(max_wait_sec=10),
+        max_call_duration_sec=10,
+        call_escalation_prob=0.2,
+        max_staff=8,
+        screening=SimulationBudget(4, 300),
+        full=SimulationBudget(8, 600),
+    )
+    settings.update(kwargs)
+    return StaffingOptimizer(**settings)
+
+
+class TestStaffingOptimizer:
+    def test_requires_costs(self):
+        with pytest.raises(ValueError):
+            make_optimizer(costs={EmployeeSeniorotyLevel.JUNIOR: 1.0})
+
+    def test_capacity_check(self):
+        optimizer = make_optimizer()
+
+        assert not optimizer.has_capacity((0, 0, 0, 0))
+        assert not optimizer.has_capacity((5, 0, 0, 0))
+        assert optimizer.has_capacity((3, 0, 2, 1))
+
+    def test_memoization_and_pruning(self):
+        optimizer = make_optimizer()
+
+        evaluation = optimizer.evaluate((5, 0, 0, 0))
+        assert not evaluation.meets_sla
+        assert evaluation.screening_wait_sec is None
+        assert optimizer.evaluate((5, 0, 0, 0)) is evaluation
+
+        # dominated by a failing staffing, rejected without simulating
+        assert not optimizer.evaluate((2, 0, 0, 0)).meets_sla
+        assert optimizer._screening_runs == 0
+
+    def test_optimize_finds_cheapest_passing(self):
+        optimizer = make_optimizer()
+        result = optimizer.optimize()
+
+        assert result.best is not None
+        assert result.best.meets_sla
+        assert result.full_runs >= 1
+        assert result.screening_runs >= result.full_runs
+        assert all(
+            evaluation.cost >= result.best.cost
+            for evaluation in result.evaluations
+            if evaluation.meets_sla
+        )
+        # nothing cheaper passed
+        assert not any(
+            evaluation.meets_sla and evaluation.cost < result.best.cost
+            for evaluation in result.evaluations
+        )
+
+    def test_unreachable_sla(self):
+        result = make_optimizer(sla=WaitSla(max_wait_sec=-1), max_staff=1).optimize()
+
+        assert result.best is None
+        assert result.config_staffing is None
@@ -0,0 +1,56 @@
+import pytest
+
+from src.call import Call
+from src.call_centre import CallCentre, CallPriority
+from src.profiling import PROFILE_ENV_VAR
+from src.tests.helpers import juniors_only
+
+
+class TestProfiling:
+    def test_disabled_runs_plain_methods(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        call_centre = CallCentre(juniors_only(1))
+
+        assert call_centre.profiler is None
+        assert "dispatch_call" not in vars(call_centre)
+        with pytest.raises(RuntimeError):
+            call_centre.profile_report()
+
+    def test_counts_hot_path_calls(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        now = [1000.0]
+        call_centre = CallCentre(juniors_only(1), clock=lambda: now[0], profile=True)
+        unprofiled = CallCentre(juniors_only(1))
+
+        call_centre.dispatch_call("Abc", CallPriority.LOW, duration_sec=5)
+        call_centre.dispatch_call("Def", CallPriority.LOW, duration_sec=5)
+        unprofiled.dispatch_call("Ghi", CallPriority.LOW)
+        now[0] += 5
+        call_centre.review_active_calls(escalate=False)
+        call_centre.review_backlog()
+
+        stats = {stat.name: stat for stat in call_centre.profile_report()}
+        assert stats["dispatch_call"].calls == 2
+        assert stats["assign"].calls == 3
+        assert stats["end"].calls == 1
+        assert stats["review_active_calls"].calls == 1
+        assert stats["review_backlog"].calls == 1
+        assert stats["dispatch_calls"].calls == 0
+        assert stats["dispatch_call"].total_ns > 0
+        assert unprofiled.profiler is None
+
+    def test_profiling_leaves_other_call_centres_unwrapped(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        assign, end = Call.assign, Call.end
+        profiled = CallCentre(juniors_only(1), profile=True)
+        unprofiled = CallCentre(juniors_only(1), profile=False)
+
+        assert Call.assign is assign and Call.end is end
+        assert unprofiled._assign_call is assign
+        assert unprofiled._end_call is end
+        assert profiled._assign_call is not assign
+
+    def test_enabled_from_environment(self, monkeypatch):
+        monkeypatch.setenv(PROFILE_ENV_VAR, "1")
+        assert CallCentre(juniors_only(1)).profiler is not None
+        assert CallCentre(juniors_only(1), profile=False).profiler is None
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.replay import ScaledClock, read_trace, replay_realtime
+from src.simulation import SimulationEngine
+
+CONFIG = CallCentreConfig(
+    juniors=1,
+    seniors=0,
+    managers=1,
+    directors=0,
+    max_call_duration_sec=10,
+    call_escalation_prob=0.1,
+)
+
+
+def write_csv_trace(path):
+    path.write_text(
+        "timestamp,caller,priority,duration_sec\n"
+        "1000,John Cena,LOW,5\n"
+        "1002,Jane Doe,high,3\n"
+        "1003,John Cena,LOW,4\n"
+    )
+
+
+class TestReplay:
+    def test_read_csv_trace(self, tmp_path):
+        trace_path = tmp_path / "trace.csv"
+        write_csv_trace(trace_path)
+
+        arrivals = list(read_trace(str(trace_path)))
+
+        assert [arrival.time_sec for arrival in arrivals] == [0, 2, 3]
+        assert arrivals[1].priority == CallPriority.HIGH
+        assert [arrival.duration_sec for arrival in arrivals] == [5, 3, 4]
+
+    def test_read_jsonl_trace(self, tmp_path):
+        trace_path = tmp_path / "trace.jsonl"
+        records = [
+            {"timestamp": "2024-05-01T10:00:00", "caller": "Abc", "priority": "LOW"},
+            {"timestamp": "2024-05-01T10:01:30", "caller": "Def", "priority": "HIGH"},
+        ]
+        trace_path.write_text("\n".join(json.dumps(record) for record in records))
+
+        arrivals = list(read_trace(str(trace_path)))
+
+        assert [arrival.time_sec for arrival in arrivals] == [0, 90]
+        assert arrivals[0].duration_sec is None
+
+    def test_unsupported_trace(self, tmp_path):
+        with pytest.raises(ValueError):
+            next(read_trace(str(tmp_path / "trace.txt")))
+
+    def test_virtual_replay_uses_recorded_durations(self, tmp_path):
+        trace_path = tmp_path / "trace.csv"
+        write_csv_trace(trace_path)
+        engine = SimulationEngine.from_config(CONFIG, escalate=False)
+
+        stats = engine.run(read_trace(str(trace_path)))
+
+        # junior: 0-5, then the third call waits until 5 and ends at 9
+        assert stats.calls_arrived == 3
+        assert stats.calls_ended == 3
+        assert stats.simulated_sec == 9
+
+    def test_realtime_replay(self, tmp_path):
+        trace_path = tmp_path / "trace.csv"
+        write_csv_trace(trace_path)
+        call_centre = CallCentre(CONFIG, clock=ScaledClock(speedup=200))
+
+        stats = replay_realtime(call_centre, read_trace(str(trace_path)))
+
+        assert stats.calls_arrived == 3
+        assert stats.calls_ended >= 3
+        assert len(call_centre.active_calls) == 0
+        assert stats.simulated_sec >= 9
+
+    def test_realtime_replay_requires_scaled_clock(self):
+        with pytest.raises(TypeError):
+            replay_realtime(CallCentre(CONFIG), [])
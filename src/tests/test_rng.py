@@ -0,0 +1,88 @@
+import pytest
+
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.rng import RandomStreams
+from src.simulation import SimulationEngine, random_arrivals
+
+
+def config(juniors: int) -> CallCentreConfig:
+    return CallCentreConfig(
+        juniors=juniors,
+        seniors=1,
+        managers=1,
+        directors=1,
+        max_call_duration_sec=10,
+        call_escalation_prob=0.3,
+    )
+
+
+class TestRandomStreams:
+    def test_seeded_and_block_independent(self):
+        small_blocks = RandomStreams(5, block_size=3)
+        large_blocks = RandomStreams(5)
+
+        assert [small_blocks.durations.random() for _ in range(10)] == [
+            large_blocks.durations.random() for _ in range(10)
+        ]
+        assert small_blocks.durations.randints(1, 6, 7) == [
+            large_blocks.durations.randint(1, 6) for _ in range(7)
+        ]
+        assert RandomStreams(5).arrivals.random() != RandomStreams(5).priority.random()
+        with pytest.raises(ValueError):
+            RandomStreams(5, block_size=0)
+
+    def test_randint_range(self):
+        stream = RandomStreams(1).durations
+        values = stream.randints(1, 15, 10000)
+
+        assert min(values) == 1
+        assert max(values) == 15
+
+    def test_replications(self):
+        first = RandomStreams.replication(seed=7, index=0).arrivals.random()
+
+        assert RandomStreams.replication(seed=7, index=0).arrivals.random() == first
+        assert RandomStreams.replication(seed=7, index=1).arrivals.random() != first
+
+    def test_common_random_numbers(self):
+        def run(juniors: int):
+            streams = RandomStreams(3)
+            engine = SimulationEngine.from_config(config(juniors), rng=streams)
+            call_centre = engine.call_centre
+            calls = []
+
+            def dispatch_call(*args, **kwargs):
+                call = CallCentre.dispatch_call(call_centre, *args, **kwargs)
+                calls.append(call)
+                return call
+
+            call_centre.dispatch_call = dispatch_call  # type: ignore
+            arrivals = []
+            for arrival in random_arrivals(
+                num_calls=500,
+                max_call_interval_sec=3,
+                prob_high_priority=0.4,
+                streams=streams,
+            ):
+                arrivals.append(arrival)
+                engine.run([arrival], until=arrival.time_sec)
+            engine.run([])
+
+            durations = [call.duration_sec for call in calls]
+            escalated = [
+                call.uid
+                for call, arrival in zip(calls, arrivals)
+                if arrival.priority is CallPriority.LOW
+                and call.priority is CallPriority.HIGH
+            ]
+            return arrivals, durations, escalated
+
+        small = run(juniors=1)
+        large = run(juniors=5)
+
+        # arrivals, durations and escalations do not depend on the staffing
+        assert len(small[1]) == 500
+        assert small[0] == large[0]
+        assert small[1] == large[1]
+        assert small[2]
+        assert small[2] == large[2]
@@ -0,0 +1,139 @@
+from typing import List
+
+import pytest
+
+from src.call_centre import CallCentre, CallPriority
+from src.employee import Employee, EmployeePool, EmployeeSeniorotyLevel
+from src.rng import RandomStreams
+from src.routing import (
+    FewestCallsPool,
+    FirstFreePool,
+    LongestIdlePool,
+    RandomPool,
+    RoutingPolicy,
+)
+from src.simulation import Arrival, SimulationEngine
+from src.snapshot import dumps, loads
+from src.tests.helpers import juniors_only
+
+JUNIOR = EmployeeSeniorotyLevel.JUNIOR
+
+
+def one_call_at_a_time(num_calls: int) -> List[Arrival]:
+    """Each call ends before the next one arrives"""
+    return [
+        Arrival(2 * index, "Abc", CallPriority.LOW, duration_sec=1)
+        for index in range(num_calls)
+    ]
+
+
+def calls_handled(call_centre: CallCentre) -> List[int]:
+    return [employee.calls_handled for employee in call_centre.employees[JUNIOR]]
+
+
+def run(routing: RoutingPolicy, arrivals: List[Arrival]) -> CallCentre:
+    engine = SimulationEngine.from_config(
+        juniors_only(), escalate=False, rng=RandomStreams(1), routing=routing
+    )
+    engine.run(arrivals)
+    return engine.call_centre
+
+
+class TestRoutingPolicies:
+    def test_pools(self):
+        pools = {
+            routing: CallCentre(juniors_only(), routing=routing).employee_pools[JUNIOR]
+            for routing in RoutingPolicy
+        }
+
+        assert type(pools[RoutingPolicy.LAST_RELEASED]) is EmployeePool
+        assert isinstance(pools[RoutingPolicy.FIRST_FREE], FirstFreePool)
+        assert isinstance(pools[RoutingPolicy.LONGEST_IDLE], LongestIdlePool)
+        assert isinstance(pools[RoutingPolicy.FEWEST_CALLS], FewestCallsPool)
+        assert isinstance(pools[RoutingPolicy.RANDOM], RandomPool)
+
+    def test_last_released_reuses_the_same_employee(self):
+        call_centre = run(RoutingPolicy.LAST_RELEASED, one_call_at_a_time(8))
+
+        assert calls_handled(call_centre) == [8, 0, 0, 0]
+
+    def test_first_free_takes_the_lowest_uid(self):
+        # junior 0 is busy with a long call while the short ones come in
+        arrivals = [
+            Arrival(0, "Abc", CallPriority.LOW, duration_sec=5),
+            Arrival(1, "Abc", CallPriority.LOW, duration_sec=10),
+            Arrival(2, "Abc", CallPriority.LOW, duration_sec=1),
+            Arrival(4, "Abc", CallPriority.LOW, duration_sec=1),
+            Arrival(6, "Abc", CallPriority.LOW, duration_sec=1),
+        ]
+
+        call_centre = run(RoutingPolicy.FIRST_FREE, arrivals)
+        # junior 2 until junior 0 is free again at 5
+        assert calls_handled(call_centre) == [2, 1, 2, 0]
+
+    def test_longest_idle_rotates(self):
+        call_centre = run(RoutingPolicy.LONGEST_IDLE, one_call_at_a_time(8))
+
+        assert calls_handled(call_centre) == [2, 2, 2, 2]
+
+    def test_fewest_calls_balances(self):
+        # two long calls keep juniors 0 and 1 busy while 2 and 3 take short ones
+        arrivals = [
+            Arrival(0, "Abc", CallPriority.LOW, duration_sec=20),
+            Arrival(0, "Abc", CallPriority.LOW, duration_sec=20),
+        ] + [
+            Arrival(1 + 2 * index, "Abc", CallPriority.LOW, duration_sec=1)
+            for index in range(8)
+        ]
+
+        call_centre = run(RoutingPolicy.FEWEST_CALLS, arrivals)
+        assert calls_handled(call_centre) == [1, 1, 4, 4]
+
+        engine = SimulationEngine(call_centre, escalate=False)
+        engine.clock.time_sec = 30
+        engine.run(
+            [
+                Arrival(30 + 2 * index, "Abc", CallPriority.LOW, duration_sec=1)
+                for index in range(6)
+            ]
+        )
+        assert calls_handled(call_centre) == [4, 4, 4, 4]
+
+    def test_random_is_seeded_and_spread(self):
+        arrivals = one_call_at_a_time(400)
+
+        first = run(RoutingPolicy.RANDOM, arrivals)
+        second = run(RoutingPolicy.RANDOM, arrivals)
+
+        assert calls_handled(first) == calls_handled(second)
+        assert min(calls_handled(first)) > 50
+
+    @pytest.mark.parametrize("routing", list(RoutingPolicy))
+    def test_pool_counters(self, routing: RoutingPolicy):
+        call_centre = CallCentre(juniors_only(), routing=routing)
+        pool = call_centre.employee_pools[JUNIOR]
+
+        calls = [call_centre.dispatch_call("Abc", CallPriority.LOW) for _ in range(5)]
+
+        assert pool.num_free == 0 and pool.num_busy == 4
+        assert len(call_centre.call_backlog) == 1
+        assert len({call.assigned_to.uid for call in calls[:4]}) == 4  # type: ignore
+
+        released = calls[2].assigned_to
+        calls[2].end(call_centre, escalate=False)
+        call_centre.review_backlog()
+        assert pool.num_free == 0 and pool.num_busy == 4
+        assert calls[4].assigned_to is released
+
+        with pytest.raises(RuntimeError):
+            pool.release(Employee(JUNIOR, uid=99, is_free=False))
+
+    def test_random_pool_follows_restored_rng(self):
+        call_centre = CallCentre(juniors_only(), routing=RoutingPolicy.RANDOM)
+        rng = RandomStreams(7)
+
+        restored = loads(dumps(call_centre), rng=rng)
+
+        pool = restored.employee_pools[JUNIOR]
+        assert isinstance(pool, RandomPool)
+        assert pool.stream is rng.routing
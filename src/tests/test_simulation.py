@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.simulation import Arrival, SimulationEngine, VirtualClock, random_arrivals
+
+
+class TestSimulationEngine:
+    def test_requires_virtual_clock(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+
+        with pytest.raises(TypeError):
+            SimulationEngine(CallCentre(config))
+
+    def test_calls_end_on_virtual_time(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=5,
+            call_escalation_prob=0.1,
+        )
+        engine = SimulationEngine.from_config(config, escalate=False)
+        arrivals = [Arrival(0, "Abc", CallPriority.LOW)] * 3
+
+        stats = engine.run(arrivals, until=0)
+
+        assert stats.calls_arrived == 3
+        assert len(engine.call_centre.active_calls) == 1
+        assert len(engine.call_centre.call_backlog) == 2
+
+        stats = engine.run([])
+
+        assert stats.calls_ended == 3
+        assert len(engine.call_centre.active_calls) == 0
+        assert len(engine.call_centre.call_backlog) == 0
+        assert 3 <= stats.simulated_sec <= 15
+
+    def test_escalation(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=1,
+            directors=0,
+            max_call_duration_sec=5,
+            call_escalation_prob=0.1,
+        )
+        engine = SimulationEngine.from_config(config, escalate=True)
+
+        stats = engine.run([Arrival(0, "Abc", CallPriority.LOW)])
+
+        # junior leg, then the escalated manager leg
+        assert stats.calls_ended == 2
+        assert engine.call_centre.free_staff == 2
+
+    def test_run_resumes_pending_arrivals(self):
+        config = CallCentreConfig(
+            juniors=2,
+            seniors=2,
+            managers=2,
+            directors=2,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.3,
+        )
+        engine = SimulationEngine.from_config(config)
+        arrivals = random_arrivals(
+            num_calls=1000,
+            max_call_interval_sec=3,
+            prob_high_priority=0.3,
+            rand=random.Random(0),
+        )
+
+        engine.run(arrivals, until=100)
+        assert engine.clock.time_sec == 100
+        engine.run(arrivals)
+
+        assert engine.stats.calls_arrived == 1000
+        assert len(engine.call_centre.active_calls) == 0
+
+    def test_abandonment_is_an_event(self):
+        config = CallCentreConfig(
+            juniors=1,
+            seniors=0,
+            managers=0,
+            directors=0,
+            max_call_duration_sec=10,
+            call_escalation_prob=0.1,
+        )
+        engine = SimulationEngine.from_config(config, escalate=False)
+        arrivals = [
+            Arrival(0, "Abc", CallPriority.LOW, duration_sec=100),
+            Arrival(1, "Def", CallPriority.LOW, patience_sec=5),
+        ]
+        metrics = engine.call_centre.metrics
+        assert metrics is not None
+
+        engine.run(arrivals, until=5.5)
+        assert metrics.abandoned[CallPriority.LOW] == 0
+
+        engine.run([], until=6)
+        assert metrics.abandoned[CallPriority.LOW] == 1
+        assert len(engine.call_centre.call_backlog) == 0
+
+        stats = engine.run([])
+        assert stats.calls_ended == 1
+        assert stats.simulated_sec == 100
+
+    def test_virtual_clock(self):
+        clock = VirtualClock()
+        clock.time_sec = 90
+
+        assert clock.to_sec(clock()) == 90
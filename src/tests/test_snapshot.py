@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from src.call_centre import CallCentre, CallCentreConfig, CallPriority
+from src.event_log import EventLog
+from src.rng import RandomStreams
+from src.simulation import SimulationEngine, random_arrivals
+from src.snapshot import (
+    branch,
+    dumps,
+    load,
+    loads,
+    remaining_arrivals,
+    save_in_background,
+)
+
+
+def fire_station() -> CallCentreConfig:
+    return CallCentreConfig(
+        juniors=3,
+        seniors=2,
+        managers=1,
+        directors=1,
+        max_call_duration_sec=15,
+        call_escalation_prob=0.4,
+    )
+
+
+def arrivals(seed: int):
+    return random_arrivals(
+        num_calls=3000,
+        max_call_interval_sec=3,
+        prob_high_priority=0.4,
+        streams=RandomStreams(seed),
+    )
+
+
+def new_engine(seed: int) -> SimulationEngine:
+    return SimulationEngine.from_config(fire_station(), rng=RandomStreams(seed))
+
+
+class TestSnapshot:
+    def test_restored_engine_resumes_the_same_run(self):
+        uninterrupted = new_engine(seed=4)
+        uninterrupted.run(arrivals(seed=4))
+
+        interrupted = new_engine(seed=4)
+        interrupted.run(arrivals(seed=4), until=2000)
+        restored = loads(dumps(interrupted, compress=True))
+        restored.run(remaining_arrivals(restored, arrivals(seed=4)))
+
+        assert restored.stats == uninterrupted.stats
+        assert restored.call_centre.metrics is not None
+        assert uninterrupted.call_centre.metrics is not None
+        assert restored.call_centre._call_count == uninterrupted.call_centre._call_count
+        assert (
+            restored.call_centre.metrics.summary()
+            == uninterrupted.call_centre.metrics.summary()
+        )
+
+    def test_state_is_restored(self):
+        engine = new_engine(seed=1)
+        engine.run(arrivals(seed=1), until=600)
+        call_centre = engine.call_centre
+
+        restored = loads(dumps(call_centre))
+
+        assert restored.clock() == call_centre.clock()
+        assert [call.uid for call in restored.active_calls] == [
+            call.uid for call in call_centre.active_calls
+        ]
+        assert [call.uid for call in restored.call_backlog] == [
+            call.uid for call in call_centre.call_backlog
+        ]
+        assert len(restored.callers) == len(call_centre.callers)
+        # busy employees are shared between pools and active calls
+        for call in restored.active_calls:
+            pool = restored.employee_pools[call.assigned_to.seniority]
+            assert pool._busy[call.assigned_to.uid] is call.assigned_to
+        with pytest.raises(ValueError):
+            loads(b"not a snapshot")
+
+    def test_event_log_and_profiler_are_left_out(self, tmp_path):
+        with EventLog(str(tmp_path / "events.bin")) as event_log:
+            call_centre = CallCentre(fire_station(), event_log=event_log, profile=True)
+            call_centre.dispatch_call("Abc", CallPriority.LOW)
+
+            restored = loads(dumps(call_centre))
+
+        assert restored.event_log is None
+        assert restored.profiler is None
+        assert "dispatch_call" not in vars(restored)
+        restored.dispatch_call("Def", CallPriority.LOW)
+
+    def test_branches(self):
+        engine = new_engine(seed=2)
+        engine.run(arrivals(seed=2), until=600)
+
+        first, second = branch(engine, 2)
+        reseeded = loads(dumps(engine), rng=RandomStreams(99))
+        for copy in (first, second, reseeded):
+            copy.run(remaining_arrivals(copy, arrivals(seed=2)))
+
+        assert first is not second
+        assert reseeded.call_centre.metrics is not None
+        assert first.call_centre.metrics is not None
+        assert first.stats == second.stats
+        assert (
+            reseeded.call_centre.metrics.summary()
+            != first.call_centre.metrics.summary()
+        )
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_background_snapshot(self, tmp_path):
+        engine = new_engine(seed=3)
+        engine.run(arrivals(seed=3), until=600)
+        path = str(tmp_path / "engine.snapshot")
+
+        pending = save_in_background(engine, path)
+        expected_time = engine.clock.time_sec
+        # the parent keeps going, the child wrote the state at fork time
+        engine.run(remaining_arrivals(engine, arrivals(seed=3)), until=1200)
+        pending.wait()
+
+        assert load(path).clock.time_sec == expected_time
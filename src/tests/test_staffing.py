@@ -0,0 +1,178 @@
+import pytest
+
+from src.call_centre import CallCentre, CallPriority
+from src.employee import EmployeeSeniorotyLevel
+from src.routing import RoutingPolicy
+from src.simulation import Arrival, SimulationEngine
+from src.staffing import ShiftChange, daily_shifts, parse_shift, run_with_shifts
+from src.tests.helpers import FakeClock, juniors_only
+
+JUNIOR = EmployeeSeniorotyLevel.JUNIOR
+
+
+class TestRuntimeStaffing:
+    def test_new_staff_drain_the_backlog(self):
+        call_centre = CallCentre(juniors_only(1))
+        for _ in range(4):
+            call_centre.dispatch_call("Abc", CallPriority.LOW)
+        assert len(call_centre.call_backlog) == 3
+
+        hired = call_centre.add_employees(JUNIOR, 2)
+
+        assert len(call_centre.employees[JUNIOR]) == 3
+        assert all(employee.calls_handled == 1 for employee in hired)
+        assert len(call_centre.call_backlog) == 1
+        assert call_centre.status().busy_staff[JUNIOR] == 3
+
+    def test_retiring_staff_finish_their_call(self):
+        clock = FakeClock()
+        call_centre = CallCentre(juniors_only(3), clock=clock)
+        pool = call_centre.employee_pools[JUNIOR]
+        call = call_centre.dispatch_call("Abc", CallPriority.LOW, duration_sec=5)
+        busy = call.assigned_to
+        # most recently hired first: move the busy junior to the end of the roster
+        roster = call_centre.employees[JUNIOR]
+        roster.remove(busy)  # type: ignore
+        roster.append(busy)  # type: ignore
+
+        retired = call_centre.retire_employees(JUNIOR, 2)
+
+        assert retired[0] is busy and retired[1].retiring
+        assert len(roster) == 1
+        assert (pool.num_free, pool.num_busy, pool.num_retiring) == (1, 1, 1)
+
+        clock.time_sec += 5
+        call_centre.review_active_calls(escalate=False)
+        assert (pool.num_free, pool.num_busy, pool.num_retiring) == (1, 0, 0)
+
+        for _ in range(3):
+            call_centre.dispatch_call("Def", CallPriority.LOW)
+        assert retired[0].calls_handled == 1 and retired[1].calls_handled == 0
+        assert len(call_centre.call_backlog) == 2
+
+        with pytest.raises(ValueError):
+            call_centre.retire_employees(JUNIOR, 2)
+
+    @pytest.mark.parametrize("routing", list(RoutingPolicy))
+    def test_lazy_retirement(self, routing: RoutingPolicy):
+        call_centre = CallCentre(juniors_only(300), routing=routing)
+        pool = call_centre.employee_pools[JUNIOR]
+
+        call_centre.retire_employees(JUNIOR, 250)
+
+        assert pool.num_free == 50
+        # compacted once mostly retired
+        assert len(pool._free) < 150
+        calls = [call_centre.dispatch_call("Abc", CallPriority.LOW) for _ in range(60)]
+        assert pool.num_free == 0 and pool.num_busy == 50
+        assert len(call_centre.call_backlog) == 10
+        assert not any(
+            call.assigned_to.retiring for call in calls if call.assigned_to is not None
+        )
+
+    def test_utilization_follows_headcount(self):
+        clock = FakeClock()
+        call_centre = CallCentre(juniors_only(1), clock=clock)
+
+        call_centre.dispatch_call("Abc", CallPriority.LOW, duration_sec=100)
+        clock.time_sec += 50
+        call_centre.add_employees(JUNIOR, 1)
+        clock.time_sec += 50
+        call_centre.review_active_calls(escalate=False)
+
+        # 100s on calls over 150s staffed
+        assert call_centre.utilization()[JUNIOR] == pytest.approx(100 / 150)
+
+        call_centre.retire_employees(JUNIOR, 1)
+        clock.time_sec += 100
+        # 100s on calls over 250s staffed
+        assert call_centre.utilization()[JUNIOR] == pytest.approx(100 / 250)
+
+
+class TestShifts:
+    def test_parse_shift(self):
+        shift = parse_shift("8:juniors=6,seniors=3")
+
+        assert shift.time_sec == 8 * 3600
+        assert shift.staff == {JUNIOR: 6, EmployeeSeniorotyLevel.SENIOR: 3}
+        with pytest.raises(ValueError):
+            parse_shift("8:interns=2")
+
+    def test_run_with_shifts(self):
+        engine = SimulationEngine.from_config(juniors_only(1), escalate=False)
+        call_centre = engine.call_centre
+        # two calls every 10s over two days, 5s each
+        arrivals = [
+            Arrival(time_sec, "Abc", CallPriority.LOW, duration_sec=5)
+            for time_sec in range(0, 2 * 86_400, 10)
+            for _ in range(2)
+        ]
+        shifts = daily_shifts(
+            [ShiftChange(8 * 3600, {JUNIOR: 2}), ShiftChange(20 * 3600, {JUNIOR: 1})]
+        )
+        headcount = []
+
+        def record(shifts):
+            for shift in shifts:
+                yield shift
+                headcount.append(len(call_centre.employees[JUNIOR]))
+
+        stats = run_with_shifts(engine, arrivals, record(shifts))
+
+        assert stats.calls_arrived == stats.calls_ended == len(arrivals)
+        # after each change: day shift, night shift, ...
+        assert headcount[:4] == [2, 1, 2, 1]
+        assert len(call_centre.employees[JUNIOR]) == 1
+        metrics = call_centre.metrics
+        assert metrics is not None
+        # at night the second caller waits for the first call, by day both
+        # are answered at once
+        wait = metrics.queue_wait[CallPriority.LOW]
+        assert wait.max == 5.0
+        assert wait.percentile(50) == 0.0
+
+    def test_run_with_shifts_stops_at_last_event(self):
+        engine = SimulationEngine.from_config(juniors_only(1), escalate=False)
+        arrivals = [
+            Arrival(time_sec, "Abc", CallPriority.LOW, duration_sec=5)
+            for time_sec in range(0, 1000, 10)
+        ]
+        shifts = daily_shifts(
+            [ShiftChange(8 * 3600, {JUNIOR: 2}), ShiftChange(20 * 3600, {JUNIOR: 1})]
+        )
+
+        stats = run_with_shifts(engine, arrivals, shifts)
+
+        assert stats.calls_ended == len(arrivals)
+        # traffic is over long before the first shift change
+        assert stats.simulated_sec == 995
+        assert len(engine.call_centre.employees[JUNIOR]) == 1
+
+    def test_shifts_answer_calls_left_on_hold(self):
+        engine = SimulationEngine.from_config(juniors_only(0), escalate=False)
+        arrivals = [
+            Arrival(time_sec, "Abc", CallPriority.LOW, duration_sec=5)
+            for time_sec in range(10)
+        ]
+
+        stats = run_with_shifts(
+            engine, arrivals, daily_shifts([ShiftChange(100, {JUNIOR: 2})])
+        )
+
+        assert len(engine.call_centre.call_backlog) == 0
+        assert len(engine.call_centre.employees[JUNIOR]) == 2
+        assert stats.calls_ended == len(arrivals)
+        # two at a time from the shift change on
+        assert stats.simulated_sec == 125
+
+    def test_shifts_give_up_after_a_day_without_answers(self):
+        engine = SimulationEngine.from_config(juniors_only(0), escalate=False)
+        arrivals = [Arrival(0, "Abc", CallPriority.LOW, duration_sec=5)]
+
+        # endless schedule that never staffs the level
+        stats = run_with_shifts(
+            engine, arrivals, daily_shifts([ShiftChange(100, {JUNIOR: 0})])
+        )
+
+        assert len(engine.call_centre.call_backlog) == 1
+        assert stats.calls_ended == 0
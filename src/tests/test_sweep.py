@@ -0,0 +1,63 @@
+from typing import Any, Dict, List
+import csv
+
+import pytest
+
+from src.call_centre import CallCentreConfig
+from src.sweep import SweepSettings, expand_grid, parse_grid, run_sweep
+
+BASE_CONFIG = CallCentreConfig(
+    juniors=2,
+    seniors=1,
+    managers=1,
+    directors=1,
+    max_call_duration_sec=10,
+    call_escalation_prob=0.2,
+)
+
+
+class TestSweep:
+    def test_parse_grid(self):
+        grid = parse_grid(
+            ["juniors=3:5", "managers=1,4", "call_escalation_prob=0.1:0.3:0.1"]
+        )
+
+        assert grid["juniors"] == [3, 4, 5]
+        assert grid["managers"] == [1, 4]
+        assert grid["call_escalation_prob"] == [0.1, 0.2, 0.3]
+
+        with pytest.raises(ValueError):
+            parse_grid(["interns=1:3"])
+        with pytest.raises(ValueError):
+            parse_grid(["juniors=1:3:0"])
+
+    def test_expand_grid(self):
+        configs = list(expand_grid(BASE_CONFIG, {"juniors": [1, 2], "managers": [3]}))
+
+        assert [(c.juniors, c.managers) for c in configs] == [(1, 3), (2, 3)]
+        assert all(c.directors == BASE_CONFIG.directors for c in configs)
+
+        with pytest.raises(ValueError):
+            # invalid configs are rejected by CallCentreConfig
+            list(expand_grid(BASE_CONFIG, {"juniors": [-1]}))
+
+    def test_run_sweep_is_deterministic(self, tmp_path):
+        settings = SweepSettings(
+            replications=4, horizon_sec=120, arrival_rate=0.5, prob_high_priority=0.3
+        )
+        grid: Dict[str, List[Any]] = {
+            "juniors": [1, 2, 3],
+            "call_escalation_prob": [0.1, 0.5],
+        }
+
+        rows = []
+        for name in ["first.csv", "second.csv"]:
+            out_path = tmp_path / name
+            assert run_sweep(BASE_CONFIG, grid, settings, str(out_path), workers=2) == 6
+            with open(out_path) as out_file:
+                rows.append(
+                    sorted(csv.DictReader(out_file), key=lambda row: int(row["index"]))
+                )
+
+        assert rows[0] == rows[1]
+        assert [int(row["juniors"]) for row in rows[0]] == [1, 1, 2, 2, 3, 3]